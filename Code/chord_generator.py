@@ -1,3 +1,12 @@
+import argparse
+import json
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from itertools import islice
+
+from midi_file import MidiFileWriter
 
 # Online# Chromatic scale for linear indexing
 CHROMATIC_SCALE = [
@@ -15,6 +24,9 @@ ENHARMONICS = {
     "G#": "G#", "Ab": "G#"
 }
 
+# Roman numerals for the scale degrees
+NUMERALS = ["I", "II", "III", "IV", "V", "VI", "VII"]
+
 # Scale intervals for different modes
 SCALE_INTERVALS = {
     "Major": [2, 2, 1, 2, 2, 2, 1],
@@ -41,235 +53,98 @@ COMPLEXITY_CHORDS = {
     10: [0, 2, 4, 6, 5, 10]
 }
 
-SCALES = {
-    "Major": {
-        "C": ["C", "D", "E", "F", "G", "A", "B"],
-        "C#": ["C#", "D#", "E#", "F#", "G#", "A#", "B#"],
-        "Db": ["Db", "Eb", "F", "Gb", "Ab", "Bb", "C"],
-        "D": ["D", "E", "F#", "G", "A", "B", "C#"],
-        "D#": ["D#", "E#", "F##", "G#", "A#", "B#", "C##"],
-        "Eb": ["Eb", "F", "G", "Ab", "Bb", "C", "D"],
-        "E": ["E", "F#", "G#", "A", "B", "C#", "D#"],
-        "Fb": ["Fb", "Gb", "Ab", "Bbb", "Cb", "Db", "Eb"],
-        "F": ["F", "G", "A", "Bb", "C", "D", "E"],
-        "F#": ["F#", "G#", "A#", "B", "C#", "D#", "E#"],
-        "Gb": ["Gb", "Ab", "Bb", "Cb", "Db", "Eb", "F"],
-        "G": ["G", "A", "B", "C", "D", "E", "F#"],
-        "Ab": ["Ab", "Bb", "C", "Db", "Eb", "F", "G"],
-        "A": ["A", "B", "C#", "D", "E", "F#", "G#"],
-        "A#": ["A#", "B#", "C##", "D#", "E#", "F##", "G##"],
-        "Bb": ["Bb", "C", "D", "Eb", "F", "G", "A"],
-        "B": ["B", "C#", "D#", "E", "F#", "G#", "A#"],
-        "Cb": ["Cb", "Db", "Eb", "Fb", "Gb", "Ab", "Bb"],
-    },
-    "Minor": {
-        "C": ["C", "D", "Eb", "F", "G", "Ab", "Bb"],
-        "C#": ["C#", "D#", "E", "F#", "G#", "A", "B"],
-        "Db": ["Db", "Eb", "Fb", "Gb", "Ab", "Bbb", "Cb"],
-        "D": ["D", "E", "F", "G", "A", "Bb", "C"],
-        "D#": ["D#", "E#", "F#", "G#", "A#", "B", "C#"],
-        "Eb": ["Eb", "F", "Gb", "Ab", "Bb", "Cb", "Db"],
-        "E": ["E", "F#", "G", "A", "B", "C", "D"],
-        "Fb": ["Fb", "Gb", "Abb", "Bbb", "Cb", "Dbb", "Ebb"],
-        "F": ["F", "G", "Ab", "Bb", "C", "Db", "Eb"],
-        "F#": ["F#", "G#", "A", "B", "C#", "D", "E"],
-        "Gb": ["Gb", "Ab", "Bbb", "Cb", "Db", "Ebb", "Fb"],
-        "G": ["G", "A", "Bb", "C", "D", "Eb", "F"],
-        "Ab": ["Ab", "Bb", "Cb", "Db", "Eb", "Fb", "Gb"],
-        "A": ["A", "B", "C", "D", "E", "F", "G"],
-        "A#": ["A#", "C", "D", "D#", "F", "G", "A"],
-        "Bb": ["Bb", "C", "Db", "Eb", "F", "Gb", "Ab"],
-        "B": ["B", "C#", "D", "E", "F#", "G", "A"],
-        "Cb": ["Cb", "Db", "Ebb", "Fb", "Gb", "Abb", "Bbb"],
-    },
- "Dorian": {
-        "C": ["C", "D", "Eb", "F", "G", "A", "Bb"],
-        "C#": ["C#", "D#", "E", "F#", "G#", "A#", "B"],
-        "Db": ["Db", "Eb", "Fb", "Gb", "Ab", "Bb", "Cb"],
-        "D": ["D", "E", "F", "G", "A", "B", "C"],
-        "D#": ["D#", "E#", "F#", "G#", "A#", "B#", "C#"],
-        "Eb": ["Eb", "F", "Gb", "Ab", "Bb", "C", "Db"],
-        "E": ["E", "F#", "G", "A", "B", "C#", "D"],
-        "Fb": ["Fb", "Gb", "Abb", "Bbb", "Cb", "Db", "Ebb"],
-        "F": ["F", "G", "Ab", "Bb", "C", "D", "Eb"],
-        "F#": ["F#", "G#", "A", "B", "C#", "D#", "E"],
-        "Gb": ["Gb", "Ab", "Bbb", "Cb", "Db", "Eb", "Fb"],
-        "G": ["G", "A", "Bb", "C", "D", "E", "F"],
-        "G#": ["G#", "A#", "B", "C#", "D#", "E#", "F#"],
-        "Ab": ["Ab", "Bb", "Cb", "Db", "Eb", "F", "Gb"],
-        "A": ["A", "B", "C", "D", "E", "F#", "G"],
-        "A#": ["A#", "B#", "C#", "D#", "E#", "F##", "G#"],
-        "Bb": ["Bb", "C", "Db", "Eb", "F", "G", "Ab"],
-        "B": ["B", "C#", "D", "E", "F#", "G#", "A"],
-        "Cb": ["Cb", "Db", "Ebb", "Fb", "Gb", "Ab", "Bbb"],
-    },
-       "Phrygian": {
-        "C": ["C", "Db", "Eb", "F", "G", "Ab", "Bb"],
-        "C#": ["C#", "D", "E", "F#", "G#", "A", "B"],
-        "Db": ["Db", "Ebb", "Fb", "Gb", "Ab", "Bbb", "Cb"],
-        "D": ["D", "Eb", "F", "G", "A", "Bb", "C"],
-        "D#": ["D#", "E", "F#", "G#", "A#", "B", "C#"],
-        "Eb": ["Eb", "Fb", "Gb", "Ab", "Bb", "Cb", "Db"],
-        "E": ["E", "F", "G", "A", "B", "C", "D"],
-        "Fb": ["Fb", "Gbb", "Abb", "Bbb", "Cb", "Dbb", "Ebb"],
-        "F": ["F", "Gb", "Ab", "Bb", "C", "Db", "Eb"],
-        "F#": ["F#", "G", "A", "B", "C#", "D", "E"],
-        "Gb": ["Gb", "Abb", "Bbb", "Cb", "Db", "Ebb", "Fb"],
-        "G": ["G", "Ab", "Bb", "C", "D", "Eb", "F"],
-        "G#": ["G#", "A", "B", "C#", "D#", "E", "F#"],
-        "Ab": ["Ab", "Bbb", "Cb", "Db", "Eb", "Fb", "Gb"],
-        "A": ["A", "Bb", "C", "D", "E", "F", "G"],
-        "A#": ["A#", "B", "C#", "D#", "E#", "F#", "G#"],
-        "Bb": ["Bb", "Cb", "Db", "Eb", "F", "Gb", "Ab"],
-        "B": ["B", "C", "D", "E", "F#", "G", "A"],
-        "Cb": ["Cb", "Dbb", "Ebb", "Fb", "Gb", "Abb", "Bbb"],
-    },
-    "Lydian": {
-        "C": ["C", "D", "E", "F#", "G", "A", "B"],
-        "C#": ["C#", "D#", "E#", "F##", "G#", "A#", "B#"],
-        "Db": ["Db", "Eb", "F", "G", "Ab", "Bb", "C"],
-        "D": ["D", "E", "F#", "G#", "A", "B", "C#"],
-        "D#": ["D#", "E#", "F##", "G##", "A#", "B#", "C##"],
-        "Eb": ["Eb", "F", "G", "A", "Bb", "C", "D"],
-        "E": ["E", "F#", "G#", "A#", "B", "C#", "D#"],
-        "Fb": ["Fb", "Gb", "Ab", "Bb", "Cb", "Db", "Eb"],
-        "F": ["F", "G", "A", "B", "C", "D", "E"],
-        "F#": ["F#", "G#", "A#", "B#", "C#", "D#", "E#"],
-        "Gb": ["Gb", "Ab", "Bb", "Cb", "Db", "Eb", "F"],
-        "G": ["G", "A", "B", "C#", "D", "E", "F#"],
-        "G#": ["G#", "A#", "B#", "C##", "D#", "E#", "F##"],
-        "Ab": ["Ab", "Bb", "C", "D", "Eb", "F", "G"],
-        "A": ["A", "B", "C#", "D#", "E", "F#", "G#"],
-        "A#": ["A#", "B#", "C##", "D##", "E#", "F##", "G##"],
-        "Bb": ["Bb", "C", "D", "E", "F", "G", "A"],
-        "B": ["B", "C#", "D#", "E#", "F#", "G#", "A#"],
-        "Cb": ["Cb", "Db", "Eb", "Fb", "Gb", "Ab", "Bb"],
-    },
- "Mixolydian": {
-        "C": ["C", "D", "E", "F", "G", "A", "Bb"],
-        "C#": ["C#", "D#", "E#", "F#", "G#", "A#", "B"],
-        "Db": ["Db", "Eb", "F", "Gb", "Ab", "Bb", "Cb"],
-        "D": ["D", "E", "F#", "G", "A", "B", "C"],
-        "D#": ["D#", "E#", "F##", "G#", "A#", "B#", "C#"],
-        "Eb": ["Eb", "F", "G", "Ab", "Bb", "C", "Db"],
-        "E": ["E", "F#", "G#", "A", "B", "C#", "D"],
-        "F": ["F", "G", "A", "Bb", "C", "D", "Eb"],
-        "F#": ["F#", "G#", "A#", "B", "C#", "D#", "E"],
-        "Gb": ["Gb", "Ab", "Bb", "Cb", "Db", "Eb", "Fb"],
-        "G": ["G", "A", "B", "C", "D", "E", "F"],
-        "G#": ["G#", "A#", "B#", "C#", "D#", "E#", "F#"],
-        "Ab": ["Ab", "Bb", "C", "Db", "Eb", "F", "Gb"],
-        "A": ["A", "B", "C#", "D", "E", "F#", "G"],
-        "A#": ["A#", "B#", "C##", "D#", "E#", "F##", "G#"],
-        "Bb": ["Bb", "C", "D", "Eb", "F", "G", "Ab"],
-        "B": ["B", "C#", "D#", "E", "F#", "G#", "A"],
-        "Cb": ["Cb", "Db", "Eb", "Fb", "Gb", "Ab", "Bbb"],
-    },
- "Locrian": {
-        "C": ["C", "Db", "Eb", "F", "Gb", "Ab", "Bb"],
-        "C#": ["C#", "D", "E", "F#", "G", "A", "B"],
-        "Db": ["Db", "Ebb", "Fb", "Gb", "Abb", "Bbb", "Cb"],
-        "D": ["D", "Eb", "F", "G", "Ab", "Bb", "C"],
-        "D#": ["D#", "E", "F#", "G#", "A", "B", "C#"],
-        "Eb": ["Eb", "Fb", "Gb", "Ab", "Bbb", "Cb", "Db"],
-        "E": ["E", "F", "G", "A", "Bb", "C", "D"],
-        "Fb": ["Fb", "Gbb", "Abb", "Bbb", "Cb", "Dbb", "Ebb"],
-        "F": ["F", "Gb", "Ab", "Bb", "Cb", "Db", "Eb"],
-        "F#": ["F#", "G", "A", "B", "C", "D", "E"],
-        "Gb": ["Gb", "Abb", "Bbb", "Cb", "Dbb", "Ebb", "Fb"],
-        "G": ["G", "Ab", "Bb", "C", "Db", "Eb", "F"],
-        "G#": ["G#", "A", "B", "C#", "D", "E", "F#"],
-        "Ab": ["Ab", "Bbb", "Cb", "Db", "Ebb", "Fb", "Gb"],
-        "A": ["A", "Bb", "C", "D", "Eb", "F", "G"],
-        "A#": ["A#", "B", "C#", "D#", "E", "F#", "G#"],
-        "Bb": ["Bb", "Cb", "Db", "Eb", "Fb", "Gb", "Ab"],
-        "B": ["B", "C", "D", "E", "F", "G", "A"],
-        "Cb": ["Cb", "Dbb", "Ebb", "Fb", "Gb", "Abb", "Bbb"],
-    },
- "Harmonic Minor": {
-        "C": ["C", "D", "Eb", "F", "G", "Ab", "B"],
-        "C#": ["C#", "D#", "E", "F#", "G#", "A", "B#"],
-        "Db": ["Db", "Eb", "Fb", "Gb", "Ab", "Bbb", "C"],
-        "D": ["D", "E", "F", "G", "A", "Bb", "C#"],
-        "D#": ["D#", "E#", "F#", "G#", "A#", "B", "C##"],
-        "Eb": ["Eb", "F", "Gb", "Ab", "Bb", "Cb", "D"],
-        "E": ["E", "F#", "G", "A", "B", "C", "D#"],
-        "Fb": ["Fb", "Gb", "Abb", "Bbb", "Cb", "Dbb", "Ebb"],
-        "F": ["F", "G", "Ab", "Bb", "C", "Db", "E"],
-        "F#": ["F#", "G#", "A", "B", "C#", "D", "E#"],
-        "Gb": ["Gb", "Ab", "Bbb", "Cb", "Db", "Ebb", "F"],
-        "G": ["G", "A", "Bb", "C", "D", "Eb", "F#"],
-        "G#": ["G#", "A#", "B", "C#", "D#", "E", "F##"],
-        "Ab": ["Ab", "Bb", "Cb", "Db", "Eb", "Fb", "G"],
-        "A": ["A", "B", "C", "D", "E", "F", "G#"],
-        "A#": ["A#", "B#", "C#", "D#", "E#", "F#", "G##"],
-        "Bb": ["Bb", "C", "Db", "Eb", "F", "Gb", "A"],
-        "B": ["B", "C#", "D", "E", "F#", "G", "A#"],
-        "Cb": ["Cb", "Db", "Ebb", "Fb", "Gb", "Abb", "Bb"],
-    },
-}
-
 
 def normalize_note(note):
     """Convert enharmonic notes to match the chromatic scale."""
     note = note.capitalize()
     return ENHARMONICS.get(note, note)
 
-# Generate scales dynamically
-def generate_scale(tonic, scale_type):
-    """Retrieve a predefined scale."""
-    # Normalize the tonic for enharmonic mapping
-    tonic = normalize_note(tonic)
 
-    # Ensure scale type exists
-    if scale_type not in SCALES:
+# Natural letters as pitch classes, used to read any spelling (F##, Bbb, ...)
+LETTER_PITCH_CLASSES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+
+
+def note_to_pitch_class(note):
+    """Convert a note name with any number of sharps/flats to a pitch class (0-11)."""
+    note = note.strip().capitalize()
+    if not note or note[0] not in LETTER_PITCH_CLASSES:
+        raise ValueError(f"Invalid note name '{note}'.")
+    accidentals = note[1:]
+    if accidentals.strip("#") and accidentals.strip("b"):
+        raise ValueError(f"Invalid note name '{note}'.")
+    return (LETTER_PITCH_CLASSES[note[0]] + accidentals.count("#") - accidentals.count("b")) % 12
+
+# Letter names in order, for spelling scales one letter per degree
+LETTERS = ["C", "D", "E", "F", "G", "A", "B"]
+
+
+def spell_note(letter, pitch_class):
+    """Spell a pitch class on the given letter, adding sharps or flats as needed (e.g., F##, Bbb)."""
+    diff = (pitch_class - LETTER_PITCH_CLASSES[letter] + 6) % 12 - 6
+    return letter + ("#" * diff if diff > 0 else "b" * -diff)
+
+
+@lru_cache(maxsize=None)
+def scale_pitch_classes(tonic_pc, scale_type):
+    """Compute the pitch classes of a scale from SCALE_INTERVALS."""
+    intervals = SCALE_INTERVALS.get(scale_type)
+    if intervals is None:
         raise ValueError(f"Scale type '{scale_type}' is not defined.")
+    pitch_classes = [tonic_pc % 12]
+    for step in intervals[:-1]:
+        pitch_classes.append((pitch_classes[-1] + step) % 12)
+    return tuple(pitch_classes)
+
+
+@lru_cache(maxsize=None)
+def _spelled_scale(tonic, scale_type):
+    """Spell a scale with one letter per degree, starting from the tonic's letter."""
+    pitch_classes = scale_pitch_classes(note_to_pitch_class(tonic), scale_type)
+    start = LETTERS.index(tonic[0])
+    return tuple(spell_note(LETTERS[(start + i) % 7], pc) for i, pc in enumerate(pitch_classes))
 
-    # Fetch the predefined scale for the tonic
-    scale_dict = SCALES[scale_type]
-    if tonic not in scale_dict:
-        raise ValueError(f"Tonic '{tonic}' is not defined in {scale_type} scale.")
 
-    # Return the predefined scale
-    return scale_dict[tonic]
+# Generate scales dynamically
+def generate_scale(tonic, scale_type, spelled=True):
+    """
+    Compute a scale from SCALE_INTERVALS.
+
+    :param tonic: The root note of the scale, in any spelling (e.g., "C#", "Db", "F##").
+    :param scale_type: The scale type (e.g., "Major", "Minor").
+    :param spelled: Spell the notes with correct letter names; otherwise use CHROMATIC_SCALE names.
+    :return: List of the seven note names.
+    """
+    tonic = tonic.strip().capitalize()
+    if not spelled:
+        return [CHROMATIC_SCALE[pc] for pc in scale_pitch_classes(note_to_pitch_class(tonic), scale_type)]
+    return list(_spelled_scale(tonic, scale_type))
 
 
 
 # Compare scales with enharmonic equivalence
 def compare_scales(expected, generated):
     """Compare scales, accounting for enharmonic equivalence."""
-    return all(normalize_note(e) == normalize_note(g) for e, g in zip(expected, generated))
+    return all(note_to_pitch_class(e) == note_to_pitch_class(g) for e, g in zip(expected, generated))
 
 # Verify scales internally
 def verify_scale_internal(scale_type, tonic):
-    """Verify a scale against predefined scales for the given tonic and scale type."""
-    intervals = SCALE_INTERVALS.get(scale_type)
-    if not intervals:
+    """Verify that the spelled scale uses each letter once and matches the scale intervals."""
+    if scale_type not in SCALE_INTERVALS:
         raise ValueError(f"Scale type '{scale_type}' is not defined.")
-    if tonic not in SCALES[scale_type]:
-        raise ValueError(f"Tonic '{tonic}' is not defined in scale type '{scale_type}'.")
-    expected_notes = SCALES[scale_type][tonic]
-    generated_notes = generate_scale(tonic, intervals)
-    if not compare_scales(expected_notes, generated_notes):
+    generated_notes = generate_scale(tonic, scale_type)
+    pitch_classes = [note_to_pitch_class(note) for note in generated_notes]
+    steps = [(b - a) % 12 for a, b in zip(pitch_classes, pitch_classes[1:] + pitch_classes[:1])]
+    letters = [note[0] for note in generated_notes]
+    if (sorted(letters) != sorted(LETTERS) or steps != SCALE_INTERVALS[scale_type]
+            or pitch_classes[0] != note_to_pitch_class(tonic)):
         raise ValueError(
             f"Verification failed for {scale_type} scale with tonic {tonic}.\n"
-            f"Expected: {expected_notes}, Generated: {generated_notes}"
+            f"Expected steps: {SCALE_INTERVALS[scale_type]}, Generated: {generated_notes} (steps {steps})"
         )
 
-def build_chord(scale_type, tonic, numeral_index, complexity, debug=False):
-    """Build a chord based on the specified scale type and complexity."""
-    # Generate the scale for the specified type
-    scale_notes = generate_scale(tonic, scale_type)
-    if debug:
-        print(f"Scale Notes: {scale_notes}")  # Debug print
-
-    # Ensure the numeral_index is valid
-    if not (0 <= numeral_index < len(scale_notes)):
-        raise ValueError(f"Numeral index {numeral_index} is out of bounds for scale of length {len(scale_notes)}.")
-
-    # Calculate chord indices
+def get_chord_indices(numeral_index, complexity, scale_length=7):
+    """Map complexity offsets to scale indices for the chord built on numeral_index."""
     chord_indices = []
-    scale_length = len(scale_notes)
     for offset in complexity:
         # Initial index with wrapping
         index = (numeral_index + offset) % scale_length
@@ -281,6 +156,22 @@ def build_chord(scale_type, tonic, numeral_index, complexity, debug=False):
             index %= scale_length  # Wrap around if necessary
 
         chord_indices.append(index)
+    return chord_indices
+
+
+def build_chord(scale_type, tonic, numeral_index, complexity, debug=False):
+    """Build a chord based on the specified scale type and complexity."""
+    # Generate the scale for the specified type
+    scale_notes = generate_scale(tonic, scale_type)
+    if debug:
+        print(f"Scale Notes: {scale_notes}")  # Debug print
+
+    # Ensure the numeral_index is valid
+    if not (0 <= numeral_index < len(scale_notes)):
+        raise ValueError(f"Numeral index {numeral_index} is out of bounds for scale of length {len(scale_notes)}.")
+
+    # Calculate chord indices
+    chord_indices = get_chord_indices(numeral_index, complexity, len(scale_notes))
 
     if debug:
         print(f"Chord Indices: {chord_indices}")  # Debug
@@ -371,6 +262,691 @@ def build_chord_with_inversion(scale_type, tonic, numeral_index, complexity, inv
     return inverted_chord
 
 
+# ===================== Precomputed Chord Table =====================
+#
+# Every (scale, tonic, numeral, complexity, inversion) result packed into one
+# integer: the low 3 bits hold the note count, then 4 bits per pitch class
+# (note 0 in bits 3-6, note 1 in bits 7-10, ...). Every scale has a note for
+# each numeral and tonic, so the only empty slots (count 0) are inversions
+# past a chord's note count, which lookup never reads since it wraps the
+# inversion.
+
+SCALE_TYPES = list(SCALE_INTERVALS.keys())
+COMPLEXITY_LEVELS = sorted(COMPLEXITY_CHORDS.keys())
+MAX_CHORD_NOTES = max(len(offsets) for offsets in COMPLEXITY_CHORDS.values())
+NUM_NUMERALS = len(NUMERALS)
+
+CHORD_TABLE_MAGIC = b"CHRD"
+CHORD_TABLE_VERSION = 1
+# magic, version, scales, tonics, numerals, complexities, inversions
+CHORD_TABLE_HEADER = struct.Struct("<4sHBBBBB")
+
+_SCALE_INDEX = {name: i for i, name in enumerate(SCALE_TYPES)}
+_COMPLEXITY_INDEX = {level: i for i, level in enumerate(COMPLEXITY_LEVELS)}
+_COMPLEXITY_LENGTHS = [len(COMPLEXITY_CHORDS[level]) for level in COMPLEXITY_LEVELS]
+
+_chord_table = None
+
+
+def pack_chord(pitch_classes):
+    """Pack a list of pitch classes (0-11) into a single integer."""
+    packed = len(pitch_classes)
+    for i, pc in enumerate(pitch_classes):
+        packed |= pc << (3 + 4 * i)
+    return packed
+
+
+def unpack_chord(packed):
+    """Unpack an integer produced by pack_chord back into a list of pitch classes."""
+    return [(packed >> (3 + 4 * i)) & 0xF for i in range(packed & 0x7)]
+
+
+def _table_index(scale_index, tonic_pc, numeral_index, complexity_index, inversion):
+    """Flat index into the chord table."""
+    return ((((scale_index * 12 + tonic_pc) * NUM_NUMERALS + numeral_index)
+             * len(COMPLEXITY_LEVELS) + complexity_index) * MAX_CHORD_NOTES + inversion)
+
+
+def build_chord_table():
+    """Run build_chord_with_inversion over the whole parameter space and pack the results."""
+    size = len(SCALE_TYPES) * 12 * NUM_NUMERALS * len(COMPLEXITY_LEVELS) * MAX_CHORD_NOTES
+    table = array("I", bytes(4 * size))
+    for scale_index, scale_type in enumerate(SCALE_TYPES):
+        for tonic_pc, tonic in enumerate(CHROMATIC_SCALE):
+            for numeral_index in range(NUM_NUMERALS):
+                for complexity_index, level in enumerate(COMPLEXITY_LEVELS):
+                    chord = build_chord(scale_type, tonic, numeral_index, COMPLEXITY_CHORDS[level])
+                    pitch_classes = [note_to_pitch_class(note) for note in chord]
+                    for inversion in range(len(chord)):
+                        index = _table_index(scale_index, tonic_pc, numeral_index, complexity_index, inversion)
+                        table[index] = pack_chord(invert_chord(pitch_classes, inversion))
+    return table
+
+
+def get_chord_table():
+    """Return the shared chord table, building it on first use."""
+    global _chord_table
+    if _chord_table is None:
+        _chord_table = build_chord_table()
+    return _chord_table
+
+
+def lookup(scale, tonic, numeral, complexity, inversion):
+    """
+    Look up a chord in the precomputed table.
+
+    :param scale: Scale type name (e.g., "Major") or its index in SCALE_TYPES.
+    :param tonic: Tonic note name (any spelling) or pitch class (0-11).
+    :param numeral: Numeral index (0-6).
+    :param complexity: Complexity level (1-10), as in COMPLEXITY_CHORDS.
+    :param inversion: Inversion number, wrapped by the chord size like invert_chord.
+    :return: Packed pitch classes (see unpack_chord).
+    """
+    scale_index = _SCALE_INDEX.get(scale) if isinstance(scale, str) else scale
+    if scale_index is None or not 0 <= scale_index < len(SCALE_TYPES):
+        raise ValueError(f"Scale type '{scale}' is not defined.")
+    tonic_pc = note_to_pitch_class(tonic) if isinstance(tonic, str) else tonic
+    if not 0 <= tonic_pc < 12:
+        raise ValueError(f"Tonic pitch class {tonic} is out of bounds (0-11).")
+    if not 0 <= numeral < NUM_NUMERALS:
+        raise ValueError(f"Numeral index {numeral} is out of bounds for scale of length {NUM_NUMERALS}.")
+    if complexity not in _COMPLEXITY_INDEX:
+        raise ValueError(f"Invalid complexity: {complexity}. Must be an integer between 1 and 10.")
+    complexity_index = _COMPLEXITY_INDEX[complexity]
+    inversion %= _COMPLEXITY_LENGTHS[complexity_index]
+    return get_chord_table()[_table_index(scale_index, tonic_pc, numeral, complexity_index, inversion)]
+
+
+def save_chord_table(path, table=None):
+    """Write the chord table to a compact binary file (little-endian uint32 entries)."""
+    if table is None:
+        table = get_chord_table()
+    header = CHORD_TABLE_HEADER.pack(
+        CHORD_TABLE_MAGIC, CHORD_TABLE_VERSION, len(SCALE_TYPES), 12,
+        NUM_NUMERALS, len(COMPLEXITY_LEVELS), MAX_CHORD_NOTES
+    )
+    data = array("I", table)
+    if struct.pack("=I", 1) != struct.pack("<I", 1):
+        data.byteswap()
+    with open(path, "wb") as f:
+        f.write(header)
+        data.tofile(f)
+
+
+def load_chord_table(path):
+    """Load a chord table written by save_chord_table and make it the shared table."""
+    global _chord_table
+    with open(path, "rb") as f:
+        magic, version, *dims = CHORD_TABLE_HEADER.unpack(f.read(CHORD_TABLE_HEADER.size))
+        expected = [len(SCALE_TYPES), 12, NUM_NUMERALS, len(COMPLEXITY_LEVELS), MAX_CHORD_NOTES]
+        if magic != CHORD_TABLE_MAGIC or version != CHORD_TABLE_VERSION or dims != expected:
+            raise ValueError(f"'{path}' is not a compatible chord table.")
+        table = array("I")
+        table.frombytes(f.read())
+    if struct.pack("=I", 1) != struct.pack("<I", 1):
+        table.byteswap()
+    if len(table) != len(SCALE_TYPES) * 12 * NUM_NUMERALS * len(COMPLEXITY_LEVELS) * MAX_CHORD_NOTES:
+        raise ValueError(f"'{path}' is truncated.")
+    _chord_table = table
+    return table
+
+
+# ===================== MIDI Notes and Batch Building =====================
+
+def chord_to_midi(chord, octave=4):
+    """
+    Place a chord's notes as ascending MIDI notes.
+
+    The first note sits in the given octave (C4 = 60); each following note is
+    raised by octaves until it is above the previous one. See chord_box_notes
+    for the placement the chord_box firmware uses.
+
+    :param chord: List of note names (any spelling) or pitch classes.
+    :param octave: Octave of the first note.
+    :return: List of MIDI note numbers.
+    """
+    base = 12 * (octave + 1)
+    midi_notes = []
+    for note in chord:
+        midi_note = base + (note_to_pitch_class(note) if isinstance(note, str) else note)
+        if midi_notes and midi_note <= midi_notes[-1]:
+            midi_note += 12 * ((midi_notes[-1] - midi_note) // 12 + 1)
+        midi_notes.append(midi_note)
+    return midi_notes
+
+
+def tonic_offsets(chord, tonic):
+    """
+    Semitones of a chord's notes above the tonic, stacked upwards like chord_to_midi.
+
+    The first note is 0-11 semitones above the tonic. These are the offsets
+    stored in the chord_box firmware's tables (see gen_firmware_tables.py).
+    """
+    tonic_pc = note_to_pitch_class(tonic) if isinstance(tonic, str) else tonic % 12
+    return chord_to_midi([((note_to_pitch_class(note) if isinstance(note, str) else note) - tonic_pc) % 12
+                          for note in chord], octave=-1)
+
+
+def chord_box_notes(chord, tonic, octave_shift=0):
+    """MIDI notes of a chord as chord_box_rev1_11 plays it: 60 + tonic + 12 * octaveShift + tonic_offsets."""
+    base = 60 + (note_to_pitch_class(tonic) if isinstance(tonic, str) else tonic % 12) + 12 * octave_shift
+    return [base + offset for offset in tonic_offsets(chord, tonic)]
+
+
+_batch_tables = None
+
+
+def _get_batch_tables():
+    """Build the NumPy gather tables for build_chords_batch on first use."""
+    global _batch_tables
+    if _batch_tables is None:
+        import numpy as np
+
+        # Scale degree -> semitones above the tonic, per scale type
+        scale_offsets = np.array([scale_pitch_classes(0, scale_type) for scale_type in SCALE_TYPES], dtype=np.int16)
+        # (numeral, complexity) -> scale degrees of the chord, padded to MAX_CHORD_NOTES
+        chord_degrees = np.zeros((NUM_NUMERALS, len(COMPLEXITY_LEVELS), MAX_CHORD_NOTES), dtype=np.int16)
+        for numeral_index in range(NUM_NUMERALS):
+            for complexity_index, level in enumerate(COMPLEXITY_LEVELS):
+                indices = get_chord_indices(numeral_index, COMPLEXITY_CHORDS[level])
+                chord_degrees[numeral_index, complexity_index, :len(indices)] = indices
+        # Complexity level -> column in chord_degrees
+        complexity_lookup = np.full(max(COMPLEXITY_LEVELS) + 1, -1, dtype=np.int16)
+        complexity_lookup[COMPLEXITY_LEVELS] = np.arange(len(COMPLEXITY_LEVELS))
+        lengths = np.array(_COMPLEXITY_LENGTHS, dtype=np.int16)
+        _batch_tables = (scale_offsets, chord_degrees, complexity_lookup, lengths)
+    return _batch_tables
+
+
+def build_chords_batch(tonics, scales, numerals, complexities, inversions, octave=4):
+    """
+    Build many chords at once with NumPy.
+
+    All arguments are parallel arrays; row i matches
+    chord_to_midi(build_chord_with_inversion(SCALE_TYPES[scales[i]], tonic, numerals[i],
+    COMPLEXITY_CHORDS[complexities[i]], inversions[i]), octave).
+
+    :param tonics: Tonic pitch classes (0-11).
+    :param scales: Scale indices into SCALE_TYPES.
+    :param numerals: Numeral indices (0-6).
+    :param complexities: Complexity levels (1-10).
+    :param inversions: Inversion numbers.
+    :param octave: Octave of each chord's first note.
+    :return: (notes, lengths) - an int16 matrix of MIDI notes padded with -1 to
+             MAX_CHORD_NOTES columns, and an int8 vector of notes per row.
+    """
+    try:
+        import numpy as np  # Imported here: it is slow to load and nothing else needs it
+    except ImportError:
+        raise RuntimeError("build_chords_batch requires NumPy (pip install numpy).") from None
+    scale_offsets, chord_degrees, complexity_lookup, lengths = _get_batch_tables()
+
+    tonics = np.asarray(tonics, dtype=np.int16) % 12
+    scales = np.asarray(scales, dtype=np.intp)
+    numerals = np.asarray(numerals, dtype=np.intp)
+    inversions = np.asarray(inversions, dtype=np.int64)
+    complexities = np.asarray(complexities, dtype=np.intp)
+    if ((complexities < 0) | (complexities >= len(complexity_lookup))).any():
+        raise ValueError("Complexity out of range.")
+    complexity_indices = complexity_lookup[complexities]
+    if (complexity_indices < 0).any():
+        raise ValueError("Complexity out of range.")
+    if ((scales < 0) | (scales >= len(SCALE_TYPES))).any():
+        raise ValueError(f"Scale index out of range (0-{len(SCALE_TYPES) - 1}).")
+    if ((numerals < 0) | (numerals >= NUM_NUMERALS)).any():
+        raise ValueError(f"Numeral index out of bounds for scale of length {NUM_NUMERALS}.")
+
+    # Gather scale degrees, then semitone offsets, then pitch classes
+    degrees = chord_degrees[numerals, complexity_indices]
+    pitch_classes = (tonics[:, None] + scale_offsets[scales[:, None], degrees]) % 12
+
+    # Rotate each row by its inversion, wrapping within the row's chord size
+    row_lengths = lengths[complexity_indices].astype(np.int64)
+    columns = np.arange(MAX_CHORD_NOTES)
+    source = (columns[None, :] + (inversions % row_lengths)[:, None]) % row_lengths[:, None]
+    pitch_classes = np.take_along_axis(pitch_classes, source, axis=1)
+
+    # Stack notes upwards, one column at a time (at most MAX_CHORD_NOTES steps)
+    notes = pitch_classes.astype(np.int16) + 12 * (octave + 1)
+    for column in range(1, MAX_CHORD_NOTES):
+        previous = notes[:, column - 1]
+        current = notes[:, column]
+        notes[:, column] = np.where(current <= previous, current + 12 * ((previous - current) // 12 + 1), current)
+    notes[columns[None, :] >= row_lengths[:, None]] = -1
+    return notes, row_lengths.astype(np.int8)
+
+
+# ===================== Chord Value Type =====================
+
+PITCH_CLASS_MASK = 0xFFF  # 12 bits, bit n set when pitch class n sounds
+
+
+def rotate_mask(mask, semitones):
+    """Transpose a 12-bit pitch-class mask by rotating its bits."""
+    semitones %= 12
+    return ((mask << semitones) | (mask >> (12 - semitones))) & PITCH_CLASS_MASK
+
+
+def mask_to_pitch_classes(mask):
+    """List the pitch classes set in a 12-bit mask."""
+    return [pc for pc in range(12) if mask >> pc & 1]
+
+
+class Chord:
+    """
+    A chord stored as a 12-bit pitch-class mask plus its MIDI notes.
+
+    Equality and hashing use the MIDI notes; use same_pitch_classes() to
+    compare voicing-independently. The note names are only worked out when
+    spelling is first read.
+    """
+
+    __slots__ = ("mask", "notes", "_spelling")
+
+    def __init__(self, notes, spelling=None, mask=None):
+        self.notes = tuple(notes)
+        if mask is None:
+            mask = 0
+            for note in self.notes:
+                mask |= 1 << (note % 12)
+        self.mask = mask
+        self._spelling = tuple(spelling) if spelling is not None else None
+
+    @classmethod
+    def from_names(cls, names, octave=4):
+        """Create a chord from note names, stacked upwards from the given octave."""
+        return cls(chord_to_midi(names, octave), names)
+
+    @classmethod
+    def build(cls, scale_type, tonic, numeral_index, complexity, inversion=0, octave=4):
+        """Create a chord with build_chord_with_inversion."""
+        return cls.from_names(build_chord_with_inversion(scale_type, tonic, numeral_index, complexity, inversion), octave)
+
+    @property
+    def spelling(self):
+        """Note names, from the original spelling or CHROMATIC_SCALE."""
+        if self._spelling is None:
+            self._spelling = tuple(CHROMATIC_SCALE[note % 12] for note in self.notes)
+        return self._spelling
+
+    @property
+    def pitch_classes(self):
+        """Distinct pitch classes in ascending order."""
+        return mask_to_pitch_classes(self.mask)
+
+    def union(self, other):
+        """Pitch-class mask of the notes in either chord."""
+        return self.mask | other.mask
+
+    def common_tones(self, other):
+        """Pitch-class mask of the notes shared with another chord."""
+        return self.mask & other.mask
+
+    def common_tone_count(self, other):
+        """Number of pitch classes shared with another chord."""
+        return bin(self.mask & other.mask).count("1")
+
+    def same_pitch_classes(self, other):
+        """True if both chords use exactly the same pitch classes."""
+        return self.mask == other.mask
+
+    def transpose(self, semitones):
+        """Return the chord moved by a number of semitones."""
+        return Chord((note + semitones for note in self.notes), mask=rotate_mask(self.mask, semitones))
+
+    def __contains__(self, pitch_class):
+        return bool(self.mask >> (pitch_class % 12) & 1)
+
+    def __len__(self):
+        return len(self.notes)
+
+    def __iter__(self):
+        return iter(self.notes)
+
+    def __eq__(self, other):
+        if not isinstance(other, Chord):
+            return NotImplemented
+        return self.notes == other.notes
+
+    def __hash__(self):
+        return hash(self.notes)
+
+    def __repr__(self):
+        return f"Chord({' '.join(self.spelling)}: {list(self.notes)})"
+
+
+# ===================== Reverse Chord Identification =====================
+
+_identify_index = None
+
+
+def build_identify_index():
+    """
+    Index the chord table by pitch-class mask.
+
+    Each mask maps to (tonic_pc, scale_index, numeral_index, complexity, pitch_classes)
+    entries in root position, ordered by complexity, scale type, numeral and tonic.
+    """
+    table = get_chord_table()
+    index = {}
+    for scale_index in range(len(SCALE_TYPES)):
+        for tonic_pc in range(12):
+            for numeral_index in range(NUM_NUMERALS):
+                for complexity_index, level in enumerate(COMPLEXITY_LEVELS):
+                    packed = table[_table_index(scale_index, tonic_pc, numeral_index, complexity_index, 0)]
+                    pitch_classes = tuple(unpack_chord(packed))
+                    mask = 0
+                    for pc in pitch_classes:
+                        mask |= 1 << pc
+                    index.setdefault(mask, []).append((tonic_pc, scale_index, numeral_index, level, pitch_classes))
+    for entries in index.values():
+        entries.sort(key=lambda entry: (entry[3], entry[1], entry[2], entry[0]))
+    return index
+
+
+def identify_chord(notes, limit=None):
+    """
+    Find the (tonic, scale_type, numeral, complexity, inversion) combinations that produce a set of notes.
+
+    Matches need the same pitch classes; the inversion is the one that puts
+    the lowest sounding note first. Root-position matches rank first, then
+    lower complexity, then scale type order, numeral and tonic.
+
+    :param notes: MIDI note numbers or a Chord.
+    :param limit: Maximum number of matches to return.
+    :return: List of (tonic, scale_type, numeral, complexity, inversion) tuples.
+    """
+    global _identify_index
+    if _identify_index is None:
+        _identify_index = build_identify_index()
+    if isinstance(notes, Chord):
+        mask, bass = notes.mask, min(notes.notes) % 12
+    else:
+        notes = list(notes)
+        if not notes:
+            return []
+        mask = 0
+        for note in notes:
+            mask |= 1 << (note % 12)
+        bass = min(notes) % 12
+
+    matches = []
+    for tonic_pc, scale_index, numeral_index, complexity, pitch_classes in _identify_index.get(mask, ()):
+        matches.append((CHROMATIC_SCALE[tonic_pc], SCALE_TYPES[scale_index], NUMERALS[numeral_index],
+                        complexity, pitch_classes.index(bass)))
+    matches.sort(key=lambda match: match[4] != 0)
+    return matches[:limit] if limit is not None else matches
+
+
+# ===================== Voice Leading =====================
+
+# Default cost weights for voice_lead
+VOICE_LEADING_WEIGHTS = {
+    "movement": 1.0,   # Per semitone each new note sits from the nearest previous note
+    "bass": 0.5,       # Per semitone of bass (lowest note) movement
+    "inversion": 0.0,  # Flat cost for any inversion other than root position
+}
+
+
+def _voicing_candidates(chord, low, high):
+    """All (inversion, midi_notes) placements of a chord that fit in [low, high]."""
+    candidates = []
+    seen = set()
+    for inversion in range(len(chord)):
+        inverted = invert_chord(chord, inversion)
+        for octave in range(-1, 10):
+            notes = chord_to_midi(inverted, octave)
+            if notes[0] >= low and notes[-1] <= high and tuple(notes) not in seen:
+                seen.add(tuple(notes))
+                candidates.append((inversion, notes))
+    return candidates
+
+
+def _voicing_cost(previous, notes, weights):
+    """Cost of moving from one voicing to the next."""
+    movement = sum(min(abs(note - p) for p in previous) for note in notes)
+    return weights["movement"] * movement + weights["bass"] * abs(notes[0] - previous[0])
+
+
+def voice_lead(progression, low=48, high=84, weights=None, debug=False):
+    """
+    Choose an inversion and octave for each chord that minimizes total voice movement.
+
+    Uses a Viterbi-style pass: for each chord, keep the cheapest path ending in
+    each of its voicings, so the work grows linearly with the progression length.
+
+    :param progression: List of (scale_type, tonic, numeral_index, complexity) tuples,
+                        with complexity as the offsets list (like build_chord).
+    :param low: Lowest allowed MIDI note.
+    :param high: Highest allowed MIDI note.
+    :param weights: Cost weights overriding VOICE_LEADING_WEIGHTS.
+    :param debug: Debug flag for additional output.
+    :return: List of (inversion, midi_notes) pairs, one per chord.
+    """
+    weights = {**VOICE_LEADING_WEIGHTS, **(weights or {})}
+    if not progression:
+        return []
+
+    layers = []
+    for scale_type, tonic, numeral_index, complexity in progression:
+        chord = build_chord(scale_type, tonic, numeral_index, complexity)
+        candidates = _voicing_candidates(chord, low, high)
+        if not candidates:
+            raise ValueError(f"Chord {chord} does not fit between MIDI notes {low} and {high}.")
+        layers.append(candidates)
+
+    # costs[i] is the cheapest total cost of a path ending in candidate i of the current layer
+    costs = [weights["inversion"] * (inversion != 0) for inversion, _ in layers[0]]
+    backpointers = []
+    for previous_layer, layer in zip(layers, layers[1:]):
+        new_costs = []
+        pointers = []
+        for inversion, notes in layer:
+            path_costs = [cost + _voicing_cost(previous_notes, notes, weights)
+                          for cost, (_, previous_notes) in zip(costs, previous_layer)]
+            best = min(range(len(path_costs)), key=path_costs.__getitem__)
+            new_costs.append(path_costs[best] + weights["inversion"] * (inversion != 0))
+            pointers.append(best)
+        costs = new_costs
+        backpointers.append(pointers)
+
+    # Walk back from the cheapest final voicing
+    index = min(range(len(costs)), key=costs.__getitem__)
+    if debug:
+        print(f"Total voice-leading cost: {costs[index]}")
+    path = [index]
+    for pointers in reversed(backpointers):
+        index = pointers[index]
+        path.append(index)
+    path.reverse()
+    return [layers[i][choice] for i, choice in enumerate(path)]
+
+
+# ===================== MIDI File Export =====================
+
+def chord_box_events(progression, chord_length, strum=0, octave_shift=0):
+    """
+    Note on/off events for a progression, the way chord_box_rev1_11 plays chords.
+
+    Times are in the caller's unit (ticks, seconds, ...). Chord n starts at
+    n * chord_length; its notes (chord_box_notes) start `strum` apart, never
+    later than the chord's end, and all stop when the next chord starts.
+
+    :param progression: Iterable of (scale_type, tonic, numeral_index, complexity, inversion)
+                        tuples, with complexity as the offsets list.
+    :return: Generator of (time, is_note_on, midi_note), in time order.
+    """
+    for n, (scale_type, tonic, numeral_index, complexity, inversion) in enumerate(progression):
+        chord = build_chord_with_inversion(scale_type, tonic, numeral_index, complexity, inversion)
+        notes = [note for note in chord_box_notes(chord, tonic, octave_shift) if 0 <= note <= 127]
+        start, end = n * chord_length, (n + 1) * chord_length
+        for i, note in enumerate(notes):
+            yield min(start + i * strum, end), True, note
+        for note in notes:
+            yield end, False, note
+
+
+def render_progression_midi(path, progression, bpm=120, beats_per_chord=2, strum_ms=0, octave_shift=0,
+                            velocity=100, channel=0, ticks_per_beat=480):
+    """
+    Render a progression to a Standard MIDI File, the way chord_box_rev1_11 plays chords.
+
+    Events come from chord_box_events: notes are placed upwards from the tonic
+    in octave 4 (plus octave_shift), each note of a chord starts strum_ms after
+    the previous one, and every chord's notes are turned off right before the
+    next chord starts. The progression is consumed
+    lazily and written as it goes, so it can be a generator of any length.
+
+    :param path: Output .mid file.
+    :param progression: Iterable of (scale_type, tonic, numeral_index, complexity, inversion)
+                        tuples, with complexity as the offsets list.
+    :param bpm: Tempo in beats per minute.
+    :param beats_per_chord: Length of each chord in beats.
+    :param strum_ms: Delay between the notes of a chord, like the firmware's strumDelay.
+    :param octave_shift: Octaves to move every chord, like the firmware's octaveShift.
+    :return: Number of chords written.
+    """
+    count = 0
+
+    def counted(chords):
+        nonlocal count
+        for chord in chords:
+            count += 1
+            yield chord
+
+    with MidiFileWriter(path, ticks_per_beat) as midi:
+        track = midi.new_track()
+        track.tempo(0, bpm)
+        strum_ticks = midi.ms_to_ticks(strum_ms, bpm)
+        chord_ticks = round(beats_per_chord * ticks_per_beat)
+        for tick, is_note_on, note in chord_box_events(counted(progression), chord_ticks, strum_ticks, octave_shift):
+            if is_note_on:
+                track.note_on(tick, channel, note, velocity)
+            else:
+                track.note_off(tick, channel, note)
+        track.end(count * chord_ticks)
+    return count
+
+
+# ===================== Streaming Batch Mode =====================
+#
+# Each input line is one progression spec, either plain text:
+#     TONIC SCALE NUMERALS [COMPLEXITY [INVERSION]]
+#     e.g. "A Harmonic Minor I-IV-V-I 3 0"
+# or a JSON object (JSONL):
+#     {"tonic": "A", "scale": "Harmonic Minor", "numerals": ["I", "IV"], "complexity": 3, "inversion": 0}
+# Text lines produce one line of chords separated by " | "; JSON lines produce
+# the input object with a "chords" list added. Blank lines and lines starting
+# with "#" are skipped.
+
+_SCALE_NAMES = {name.lower(): name for name in SCALE_INTERVALS}
+
+
+def parse_progression_spec(line):
+    """Parse one batch input line into (tonic, scale_type, numeral_indices, complexity, inversion)."""
+    line = line.strip()
+    if line.startswith("{"):
+        spec = json.loads(line)
+        numerals = spec.get("numerals", spec.get("numeral"))
+        tonic, scale = spec["tonic"], spec["scale"]
+        complexity, inversion = spec.get("complexity", 1), spec.get("inversion", 0)
+        if not isinstance(tonic, str):
+            raise ValueError(f"Invalid tonic: {tonic!r}. Must be a note name like 'C' or 'F#'.")
+        if not isinstance(numerals, (str, list)):
+            raise ValueError(f"Invalid numerals: {numerals!r}. Must be a string like 'I-IV-V' or a list.")
+        for name, value in (("complexity", complexity), ("inversion", inversion)):
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError(f"Invalid {name}: {value!r}. Must be an integer.")
+    else:
+        fields = line.split()
+        # Scale names may contain spaces, so find the numerals field after them
+        numeral_field = next((i for i in range(2, len(fields))
+                              if all(n in NUMERALS for n in fields[i].upper().split("-"))), None)
+        if numeral_field is None or len(fields) > numeral_field + 3:
+            raise ValueError(f"Expected 'TONIC SCALE NUMERALS [COMPLEXITY [INVERSION]]', got '{line}'.")
+        tonic, scale, numerals = fields[0], " ".join(fields[1:numeral_field]), fields[numeral_field]
+        rest = fields[numeral_field + 1:] + ["1", "0"][len(fields) - numeral_field - 1:]
+        complexity, inversion = int(rest[0]), int(rest[1])
+
+    if isinstance(numerals, str):
+        numerals = numerals.split("-")
+    note_to_pitch_class(tonic)  # Raises ValueError for a tonic like "X"
+    scale_type = _SCALE_NAMES.get(str(scale).lower())
+    if scale_type is None:
+        raise ValueError(f"Invalid key: {scale}. Available keys: {', '.join(SCALE_INTERVALS.keys())}")
+    if complexity not in COMPLEXITY_CHORDS:
+        raise ValueError(f"Invalid complexity: {complexity}. Must be an integer between 1 and 10.")
+    numeral_indices = []
+    for numeral in numerals:
+        if str(numeral).upper() not in NUMERALS:
+            raise ValueError(f"Invalid numeral: {numeral}. Available numerals: {', '.join(NUMERALS)}")
+        numeral_indices.append(NUMERALS.index(str(numeral).upper()))
+    return tonic, scale_type, numeral_indices, complexity, inversion
+
+
+def render_progression_line(line):
+    """Turn one batch input line into its output line (without newline)."""
+    is_json = line.lstrip().startswith("{")
+    try:
+        tonic, scale_type, numeral_indices, complexity, inversion = parse_progression_spec(line)
+        chords = [build_chord_with_inversion(scale_type, tonic, numeral_index, COMPLEXITY_CHORDS[complexity], inversion)
+                  for numeral_index in numeral_indices]
+    except (ValueError, KeyError, TypeError) as e:
+        message = f"Missing field {e}" if isinstance(e, KeyError) else str(e)
+        return json.dumps({"input": line.strip(), "error": message}) if is_json else f"Error: {message}"
+    if is_json:
+        spec = json.loads(line)
+        spec["chords"] = chords
+        return json.dumps(spec)
+    return " | ".join(" ".join(chord) for chord in chords)
+
+
+def _spec_lines(lines):
+    """Yield the lines that hold specs, skipping blanks and comments."""
+    for line in lines:
+        if line.strip() and not line.lstrip().startswith("#"):
+            yield line
+
+
+def iter_progression_chords(lines, errors=None):
+    """Yield (scale_type, tonic, numeral_index, complexity, inversion) for every chord in the spec lines."""
+    for line in _spec_lines(lines):
+        try:
+            tonic, scale_type, numeral_indices, complexity, inversion = parse_progression_spec(line)
+        except (ValueError, KeyError, TypeError) as e:
+            if errors is not None:
+                errors.write(f"Skipping '{line.strip()}': {e}\n")
+            continue
+        for numeral_index in numeral_indices:
+            yield scale_type, tonic, numeral_index, COMPLEXITY_CHORDS[complexity], inversion
+
+
+def run_batch(lines, out, workers=1, chunksize=256):
+    """
+    Stream progression specs from an iterable of lines to a file-like output.
+
+    Lines are read lazily, so the input is never held in memory. With
+    workers > 1 the lines are spread over a process pool, workers * chunksize
+    lines at a time (Pool.imap alone would read the whole input ahead of the
+    results); results are still written in input order.
+    """
+    specs = _spec_lines(lines)
+    if workers > 1:
+        from multiprocessing import Pool  # Only batch mode needs it
+
+        with Pool(workers) as pool:
+            while True:
+                batch = list(islice(specs, workers * chunksize))
+                if not batch:
+                    break
+                for result in pool.imap(render_progression_line, batch, chunksize):
+                    out.write(result + "\n")
+    else:
+        for line in specs:
+            out.write(render_progression_line(line) + "\n")
+    out.flush()
+
+
 def main():
     """Interactive mode for chord generation with inversion support."""
     letter = input("Enter the Letter (e.g., C, G, A#): ").strip()
@@ -379,7 +955,12 @@ def main():
     numeral = input("Enter the Numeral (I, II, III, IV, V, VI, VII): ").strip().upper()
     inversion = input("Enter the Inversion (1-6): ").strip()
 
-    letter = normalize_note(letter)
+    letter = letter.capitalize()  # Keep the user's spelling (Db stays Db) so the scale is spelled from it
+    try:
+        note_to_pitch_class(letter)
+    except ValueError as e:
+        print(f"Invalid letter: {e}")
+        return
 
     if key not in SCALE_INTERVALS:
         print(f"Invalid key: {key}. Available keys: {', '.join(SCALE_INTERVALS.keys())}")
@@ -406,6 +987,27 @@ def main():
 
 
 if __name__ == "__main__":
-    main()  # Run the interactive mode
-    print("\nRunning Validation Tests...\n")
-    test_chord_transformation()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Chord generator. Runs interactively unless --batch is given.")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FILE",
+                        help="Read progression specs (text or JSONL) from FILE, or stdin if omitted, and stream chords to stdout")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for --batch (default 1)")
+    parser.add_argument("--midi", metavar="OUT", help="With --batch, render all progressions to this .mid file instead")
+    parser.add_argument("--bpm", type=float, default=120, help="Tempo for --midi (default 120)")
+    parser.add_argument("--beats", type=float, default=2, help="Beats per chord for --midi (default 2)")
+    parser.add_argument("--strum", type=float, default=0, help="Strum delay in ms for --midi (default 0)")
+    parser.add_argument("--octave", type=int, default=0, help="Octave shift for --midi (default 0)")
+    args = parser.parse_args()
+
+    if args.batch is not None:
+        spec_file = sys.stdin if args.batch == "-" else open(args.batch)
+        with spec_file:
+            if args.midi:
+                chords = render_progression_midi(args.midi, iter_progression_chords(spec_file, sys.stderr),
+                                                 args.bpm, args.beats, args.strum, args.octave)
+                print(f"Wrote {chords} chords to {args.midi}")
+            else:
+                run_batch(spec_file, sys.stdout, args.workers)
+    else:
+        main()  # Run the interactive mode
+        print("\nRunning Validation Tests...\n")
+        test_chord_transformation()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Generate the chord_box firmware's chord tables (a C header) from chord_generator.py.
+
+Every scale x numeral x complexity x inversion chord is stored as semitone
+offsets from the tonic (chord_generator.tonic_offsets), which is how the
+firmware's playChord() places notes. The firmware adds them to its base note
+(60 + tonic + 12 * octaveShift), so the tonic needs no table dimension.
+
+Packing, all in PROGMEM:
+  - each voicing is one nibble per note: the first note's offset (0-11),
+    then each following note's distance above the previous one, minus 1
+  - the inversions of a chord are stored together as a group; identical
+    groups are shared, and CHORD_GROUP_INDEX[scale][numeral][complexity]
+    picks the group
+A chord press is one group index read plus its nibbles; no scale maths.
+
+Example:
+    python gen_firmware_tables.py                  # writes the rev1_11 sketch's chord_tables.h
+    python gen_firmware_tables.py -o chord_tables.h --report
+"""
+import argparse
+import os
+
+from chord_generator import (COMPLEXITY_CHORDS, COMPLEXITY_LEVELS, MAX_CHORD_NOTES, NUM_NUMERALS, NUMERALS,
+                             SCALE_TYPES, lookup, tonic_offsets, unpack_chord)
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "chord_box", "rev1",
+                              "chord_box_rev1_11", "chord_box_rev1_11", "chord_tables.h")
+
+
+# ===================== Building the Tables =====================
+
+def voicing_nibbles(scale_index, numeral_index, level, inversion):
+    """Nibbles of one voicing: first offset from the tonic, then (step above the previous note - 1) per note."""
+    offsets = tonic_offsets(unpack_chord(lookup(scale_index, 0, numeral_index, level, inversion)), 0)
+    steps = [b - a - 1 for a, b in zip(offsets, offsets[1:])]
+    if offsets[0] > 15 or any(step > 15 for step in steps):
+        raise ValueError(f"Voicing {offsets} does not fit in nibbles.")
+    return [offsets[0]] + steps
+
+
+def build_tables():
+    """
+    Return a dict with:
+      notes:  notes per chord, by complexity index
+      starts: nibble offset of each complexity's first group
+      index:  group number per [scale][numeral][complexity]
+      nibbles: every group's voicings, one after another
+    """
+    notes = [len(COMPLEXITY_CHORDS[level]) for level in COMPLEXITY_LEVELS]
+    index = [[[0] * len(COMPLEXITY_LEVELS) for _ in range(NUM_NUMERALS)] for _ in SCALE_TYPES]
+    starts = []
+    nibbles = []
+    for complexity_index, level in enumerate(COMPLEXITY_LEVELS):
+        starts.append(len(nibbles))
+        groups = {}
+        for scale_index in range(len(SCALE_TYPES)):
+            for numeral_index in range(NUM_NUMERALS):
+                group = tuple(nibble for inversion in range(notes[complexity_index])
+                              for nibble in voicing_nibbles(scale_index, numeral_index, level, inversion))
+                if group not in groups:
+                    groups[group] = len(groups)
+                    nibbles.extend(group)
+                index[scale_index][numeral_index][complexity_index] = groups[group]
+        if len(groups) > 256:
+            raise ValueError(f"Complexity {level} has {len(groups)} distinct chords, too many for a byte index.")
+    if len(nibbles) > 0xFFFF:
+        raise ValueError("Too many nibbles for 16-bit offsets.")
+    return {"notes": notes, "starts": starts, "index": index, "nibbles": nibbles}
+
+
+def pack_nibbles(nibbles):
+    """Two nibbles per byte, the even one in the low half."""
+    padded = nibbles + [0] * (len(nibbles) % 2)
+    return bytes(padded[i] | (padded[i + 1] << 4) for i in range(0, len(padded), 2))
+
+
+def decode(tables, packed, scale_index, numeral_index, complexity_index, inversion):
+    """Python copy of the header's chordOffsets(), used to check the tables."""
+    count = tables["notes"][complexity_index]
+    group = tables["index"][scale_index][numeral_index][complexity_index]
+    position = tables["starts"][complexity_index] + (group * count + inversion % count) * count
+    offsets = []
+    for i in range(count):
+        nibble = (packed[(position + i) >> 1] >> (4 * ((position + i) & 1))) & 0xF
+        offsets.append(nibble if i == 0 else offsets[-1] + nibble + 1)
+    return offsets
+
+
+def check_tables(tables, packed):
+    """Compare every decoded chord, for every tonic, with chord_generator.lookup. Returns the number checked."""
+    checked = 0
+    for scale_index in range(len(SCALE_TYPES)):
+        for numeral_index in range(NUM_NUMERALS):
+            for complexity_index, level in enumerate(COMPLEXITY_LEVELS):
+                for inversion in range(MAX_CHORD_NOTES):
+                    offsets = decode(tables, packed, scale_index, numeral_index, complexity_index, inversion)
+                    for tonic in range(12):
+                        expected = unpack_chord(lookup(scale_index, tonic, numeral_index, level, inversion))
+                        if [(tonic + offset) % 12 for offset in offsets] != expected:
+                            raise AssertionError(f"{SCALE_TYPES[scale_index]} {tonic} {NUMERALS[numeral_index]} "
+                                                 f"complexity {level} inversion {inversion}: {offsets} != {expected}")
+                        checked += 1
+    return checked
+
+
+def size_report(tables, packed):
+    """[(name, bytes)] for the emitted tables, then the layouts they replace."""
+    slots = len(SCALE_TYPES) * NUM_NUMERALS * len(COMPLEXITY_LEVELS)
+    flat_nibbles = len(SCALE_TYPES) * NUM_NUMERALS * sum(count * count for count in tables["notes"])
+    return [
+        ("CHORD_NIBBLES", len(packed)),
+        ("CHORD_GROUP_INDEX", slots),
+        ("CHORD_COMPLEXITY_NOTES", len(tables["notes"])),
+        ("CHORD_COMPLEXITY_START", 2 * len(tables["starts"])),
+    ], [
+        ("Same nibbles without sharing groups", (flat_nibbles + 1) // 2),
+        ("One uint32 per chord and tonic (chord_generator's table)",
+         4 * 12 * slots * MAX_CHORD_NOTES),
+    ]
+
+
+# ===================== Writing the Header =====================
+
+def _c_array(values, per_line=16):
+    lines = []
+    for i in range(0, len(values), per_line):
+        lines.append("  " + ", ".join(str(value) for value in values[i:i + per_line]) + ",")
+    return "\n".join(lines)
+
+
+def render_header(tables, packed):
+    emitted, _ = size_report(tables, packed)
+    total = sum(size for _, size in emitted)
+    index_rows = []
+    for scale_index, scale_type in enumerate(SCALE_TYPES):
+        index_rows.append(f"  {{ // {scale_type}")
+        for numeral_index in range(NUM_NUMERALS):
+            row = ", ".join(f"{group:>2}" for group in tables["index"][scale_index][numeral_index])
+            index_rows.append(f"    {{{row}}}, // {NUMERALS[numeral_index]}")
+        index_rows.append("  },")
+    scale_names = ", ".join(f"{i} {name}" for i, name in enumerate(SCALE_TYPES))
+    return f"""// Generated by Code/gen_firmware_tables.py from Code/chord_generator.py. Do not edit.
+//
+// chordOffsets(scale, numeral, complexity, inversion, offsets) fills offsets[]
+// with the chord's semitones above the tonic, stacked upwards, and returns
+// the note count. Add them to the base note (60 + tonic + 12 * octaveShift).
+//
+// Scales: {scale_names}
+// Complexity index i is chord_generator complexity level {COMPLEXITY_LEVELS[0]} + i
+// (0 is the plain triad). Inversions past the note count wrap around.
+//
+// Flash used: {total} bytes ({", ".join(f"{name} {size}" for name, size in emitted)})
+#pragma once
+
+#include <Arduino.h>
+
+#define CHORD_SCALE_COUNT {len(SCALE_TYPES)}
+#define CHORD_NUMERAL_COUNT {NUM_NUMERALS}
+#define CHORD_COMPLEXITY_COUNT {len(COMPLEXITY_LEVELS)}
+#define CHORD_MAX_NOTES {MAX_CHORD_NOTES}
+
+// Notes per chord, by complexity index
+const uint8_t CHORD_COMPLEXITY_NOTES[CHORD_COMPLEXITY_COUNT] PROGMEM = {{
+{_c_array(tables["notes"])}
+}};
+
+// Nibble offset of each complexity's first group in CHORD_NIBBLES
+const uint16_t CHORD_COMPLEXITY_START[CHORD_COMPLEXITY_COUNT] PROGMEM = {{
+{_c_array(tables["starts"])}
+}};
+
+// Group of voicings used by each [scale][numeral][complexity]
+const uint8_t CHORD_GROUP_INDEX[CHORD_SCALE_COUNT][CHORD_NUMERAL_COUNT][CHORD_COMPLEXITY_COUNT] PROGMEM = {{
+{chr(10).join(index_rows)}
+}};
+
+// Voicings, two nibbles per byte (even nibble in the low half). A voicing is
+// the first note's offset from the tonic, then each next note's step above
+// the previous one minus 1; a group holds one voicing per inversion.
+const uint8_t CHORD_NIBBLES[{len(packed)}] PROGMEM = {{
+{_c_array([f"0x{byte:02X}" for byte in packed])}
+}};
+
+static inline uint8_t chordNibble(uint16_t position) {{
+  uint8_t packed = pgm_read_byte(&CHORD_NIBBLES[position >> 1]);
+  return (position & 1) ? (packed >> 4) : (packed & 0x0F);
+}}
+
+static inline uint8_t chordOffsets(uint8_t scale, uint8_t numeral, uint8_t complexity, uint8_t inversion,
+                                   uint8_t offsets[CHORD_MAX_NOTES]) {{
+  uint8_t count = pgm_read_byte(&CHORD_COMPLEXITY_NOTES[complexity]);
+  uint8_t group = pgm_read_byte(&CHORD_GROUP_INDEX[scale][numeral][complexity]);
+  uint16_t position = pgm_read_word(&CHORD_COMPLEXITY_START[complexity])
+                      + ((uint16_t)group * count + inversion % count) * count;
+  uint8_t offset = chordNibble(position);
+  offsets[0] = offset;
+  for (uint8_t i = 1; i < count; i++) {{
+    offset += chordNibble(position + i) + 1;
+    offsets[i] = offset;
+  }}
+  return count;
+}}
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the chord_box firmware's chord tables as a C header.")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="Header to write")
+    parser.add_argument("--report", action="store_true", help="Also compare with the layouts the tables replace")
+    args = parser.parse_args()
+
+    tables = build_tables()
+    packed = pack_nibbles(tables["nibbles"])
+    checked = check_tables(tables, packed)
+    with open(args.output, "w") as f:
+        f.write(render_header(tables, packed))
+
+    emitted, replaced = size_report(tables, packed)
+    print(f"Wrote {os.path.relpath(args.output)} ({checked} chords checked against chord_generator)")
+    for name, size in emitted:
+        print(f"  {name:<26}{size:>7} bytes")
+    print(f"  {'Total':<26}{sum(size for _, size in emitted):>7} bytes")
+    if args.report:
+        for name, size in replaced:
+            print(f"  {name}: {size} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Incremental key/mode detection over a live stream of MIDI notes.
+
+Keeps a decayed pitch-class histogram and, after each note-on, scores it
+against every tonic x SCALE_INTERVALS mode using a precomputed template
+matrix. Each update adds one template column to the running scores, so it
+costs the same no matter how long the stream has been running.
+
+Decay is done by growing the weight of new notes instead of shrinking the
+old ones; the histogram and scores are rescaled only when that weight gets
+very large.
+
+Example (one MIDI note number per line on stdin):
+    python key_detector.py < notes.txt
+"""
+import math
+import sys
+
+from chord_generator import CHROMATIC_SCALE, SCALE_INTERVALS, scale_pitch_classes
+
+# Template weights by scale degree (0 = tonic); pitch classes outside the scale get OUT_OF_SCALE_WEIGHT
+DEGREE_WEIGHTS = [2.0, 1.0, 1.25, 1.0, 1.5, 1.0, 1.0]
+OUT_OF_SCALE_WEIGHT = -1.0
+
+# Every (tonic pitch class, scale type) pair, in the order of the score vector
+KEYS = [(tonic_pc, scale_type) for scale_type in SCALE_INTERVALS for tonic_pc in range(12)]
+
+# Rescale the histogram once the weight of new notes passes this
+MAX_GAIN = 1e100
+MAX_GAIN_EXPONENT = math.log2(MAX_GAIN)
+
+
+def build_templates():
+    """Return TEMPLATES[pc][k]: how much a note of pitch class pc counts towards KEYS[k]."""
+    templates = [[OUT_OF_SCALE_WEIGHT] * len(KEYS) for _ in range(12)]
+    for k, (tonic_pc, scale_type) in enumerate(KEYS):
+        for degree, pc in enumerate(scale_pitch_classes(tonic_pc, scale_type)):
+            templates[pc][k] = DEGREE_WEIGHTS[degree]
+    return templates
+
+
+TEMPLATES = build_templates()
+
+
+class KeyDetector:
+    """Streaming key/mode estimator fed one note-on at a time."""
+
+    def __init__(self, half_life=16.0, use_velocity=True):
+        """
+        :param half_life: Number of notes after which a note counts half as much,
+                          or seconds when note_on is given timestamps.
+        :param use_velocity: Weight notes by their velocity.
+        """
+        self.half_life = half_life
+        self.use_velocity = use_velocity
+        self.reset()
+
+    def reset(self):
+        """Forget all notes heard so far."""
+        self.histogram = [0.0] * 12
+        self.scores = [0.0] * len(KEYS)
+        self.total = 0.0
+        self.gain = 1.0
+        self.reference_time = None
+        self.best = 0
+
+    def note_on(self, note, velocity=100, timestamp=None):
+        """
+        Add a note-on and return the current best key.
+
+        :param note: MIDI note number.
+        :param velocity: MIDI velocity; 0 is treated as note-off and ignored.
+        :param timestamp: Event time in seconds, for time-based decay.
+        :return: (tonic, scale_type, confidence), see current_key.
+        """
+        if velocity <= 0:
+            return self.current_key()
+
+        if timestamp is None:
+            self.gain *= 2.0 ** (1.0 / self.half_life)
+        else:
+            if self.reference_time is None:
+                self.reference_time = timestamp
+            exponent = (timestamp - self.reference_time) / self.half_life
+            if exponent > MAX_GAIN_EXPONENT:
+                # A long pause: decay the old notes straight to this time before 2 ** exponent overflows
+                self._rescale(timestamp, 2.0 ** -exponent)
+                exponent = 0.0
+            self.gain = 2.0 ** exponent
+        if self.gain > MAX_GAIN:
+            self._rescale(timestamp)
+
+        weight = self.gain * (velocity / 127.0 if self.use_velocity else 1.0)
+        pc = note % 12
+        self.histogram[pc] += weight
+        self.total += weight
+
+        # One pass over a fixed number of keys: update the scores and track the best
+        scores = self.scores
+        best, best_score = 0, float("-inf")
+        for k, template_weight in enumerate(TEMPLATES[pc]):
+            score = scores[k] + weight * template_weight
+            scores[k] = score
+            if score > best_score:
+                best, best_score = k, score
+        self.best = best
+        return self.current_key()
+
+    def _rescale(self, timestamp, scale=None):
+        """Divide everything by the current gain (or multiply by scale) so the numbers stay small."""
+        if scale is None:
+            scale = 1.0 / self.gain
+        self.histogram = [value * scale for value in self.histogram]
+        self.scores = [value * scale for value in self.scores]
+        self.total *= scale
+        self.gain = 1.0
+        if timestamp is not None:
+            self.reference_time = timestamp
+
+    def current_key(self):
+        """
+        Return the best (tonic, scale_type, confidence) so far.
+
+        Confidence is the best score divided by the total note weight, so it is
+        at most DEGREE_WEIGHTS[0]; it is 0.0 before any notes arrive.
+        """
+        tonic_pc, scale_type = KEYS[self.best]
+        confidence = self.scores[self.best] / self.total if self.total else 0.0
+        return CHROMATIC_SCALE[tonic_pc], scale_type, confidence
+
+    def ranked_keys(self, limit=5):
+        """Return the top (tonic, scale_type, confidence) candidates."""
+        order = sorted(range(len(KEYS)), key=self.scores.__getitem__, reverse=True)[:limit]
+        return [(CHROMATIC_SCALE[KEYS[k][0]], KEYS[k][1], self.scores[k] / self.total if self.total else 0.0)
+                for k in order]
+
+
+def main():
+    """Read MIDI note numbers from stdin (one per line) and print the key after each."""
+    detector = KeyDetector()
+    for line in sys.stdin:
+        line = line.strip()
+        if not line.isdigit():
+            continue
+        tonic, scale_type, confidence = detector.note_on(int(line))
+        print(f"{line}: {tonic} {scale_type} ({confidence:.2f})")
+
+
+if __name__ == "__main__":
+    main()
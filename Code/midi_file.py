@@ -0,0 +1,142 @@
+"""
+Minimal Standard MIDI File writer (no third-party libraries).
+
+Tracks are written straight to the file as events arrive: the track length
+is patched in when the track ends, so a render of any length only keeps
+one event in memory. Channel messages use running status.
+
+Example:
+    with MidiFileWriter("out.mid", ticks_per_beat=480) as midi:
+        track = midi.new_track()
+        track.tempo(0, 120)
+        track.note_on(0, 0, 60, 100)
+        track.note_off(480, 0, 60)
+        track.end()
+"""
+import struct
+
+NOTE_OFF = 0x80
+NOTE_ON = 0x90
+PROGRAM_CHANGE = 0xC0
+
+META_TEMPO = 0x51
+META_TRACK_NAME = 0x03
+META_END_OF_TRACK = 0x2F
+
+
+def encode_vlq(value):
+    """Encode a non-negative integer as a MIDI variable-length quantity."""
+    if value < 0 or value > 0x0FFFFFFF:
+        raise ValueError(f"Value {value} out of range for a variable-length quantity.")
+    data = bytearray([value & 0x7F])
+    value >>= 7
+    while value:
+        data.insert(0, (value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(data)
+
+
+class MidiTrackWriter:
+    """Writes one MTrk chunk; events must be added in non-decreasing tick order."""
+
+    def __init__(self, f):
+        self.f = f
+        self.tick = 0
+        self.running_status = None
+        self.length = 0
+        self.ended = False
+        f.write(b"MTrk")
+        self.length_offset = f.tell()
+        f.write(b"\x00\x00\x00\x00")  # Patched in end()
+
+    def _write_event(self, tick, data):
+        if self.ended:
+            raise ValueError("Track has already ended.")
+        if tick < self.tick:
+            raise ValueError(f"Event at tick {tick} is earlier than the previous event ({self.tick}).")
+        event = encode_vlq(tick - self.tick) + data
+        self.f.write(event)
+        self.length += len(event)
+        self.tick = tick
+
+    def channel_message(self, tick, status, *data):
+        """Write a channel message, leaving out the status byte when running status allows."""
+        if status == self.running_status:
+            self._write_event(tick, bytes(data))
+        else:
+            self._write_event(tick, bytes((status,) + data))
+            self.running_status = status
+
+    def note_on(self, tick, channel, note, velocity=100):
+        self.channel_message(tick, NOTE_ON | channel, note, velocity)
+
+    def note_off(self, tick, channel, note):
+        # Note-on with velocity 0 keeps running status going between note-ons and note-offs
+        self.channel_message(tick, NOTE_ON | channel, note, 0)
+
+    def program_change(self, tick, channel, program):
+        self.channel_message(tick, PROGRAM_CHANGE | channel, program)
+
+    def meta(self, tick, meta_type, data=b""):
+        """Write a meta event (this cancels running status)."""
+        self._write_event(tick, bytes((0xFF, meta_type)) + encode_vlq(len(data)) + data)
+        self.running_status = None
+
+    def tempo(self, tick, bpm):
+        """Write a tempo meta event in beats per minute."""
+        self.meta(tick, META_TEMPO, struct.pack(">I", round(60_000_000 / bpm))[1:])
+
+    def track_name(self, tick, name):
+        self.meta(tick, META_TRACK_NAME, name.encode("utf-8"))
+
+    def end(self, tick=None):
+        """Write end-of-track and patch the chunk length."""
+        if self.ended:
+            return
+        self.meta(self.tick if tick is None else tick, META_END_OF_TRACK)
+        self.ended = True
+        end_offset = self.f.tell()
+        self.f.seek(self.length_offset)
+        self.f.write(struct.pack(">I", self.length))
+        self.f.seek(end_offset)
+
+
+class MidiFileWriter:
+    """Writes a format 1 Standard MIDI File; tracks are written one after another."""
+
+    def __init__(self, path, ticks_per_beat=480, buffering=64 * 1024):
+        self.ticks_per_beat = ticks_per_beat
+        self.f = open(path, "wb", buffering=buffering)
+        self.num_tracks = 0
+        self.track = None
+        self._write_header()
+
+    def _write_header(self):
+        self.f.write(b"MThd" + struct.pack(">IHHH", 6, 1, self.num_tracks, self.ticks_per_beat))
+
+    def new_track(self):
+        """End the current track (if any) and start a new one."""
+        if self.track is not None:
+            self.track.end()
+        self.track = MidiTrackWriter(self.f)
+        self.num_tracks += 1
+        return self.track
+
+    def ms_to_ticks(self, ms, bpm):
+        """Convert milliseconds to ticks at a constant tempo."""
+        return round(ms * self.ticks_per_beat * bpm / 60_000)
+
+    def close(self):
+        if self.f.closed:
+            return
+        if self.track is not None:
+            self.track.end()
+        self.f.seek(0)
+        self._write_header()  # Now with the real track count
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
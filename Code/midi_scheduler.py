@@ -0,0 +1,196 @@
+"""
+Low-jitter asyncio MIDI playback scheduler.
+
+Plays timestamped MIDI messages to a pluggable sink. Every deadline is
+measured from one start time on the monotonic clock, so small errors never
+add up. The scheduler sleeps with asyncio until shortly before each
+deadline, then spins for the last moment. The spin margin grows when the
+event loop oversleeps. How late each message was sent is kept, and
+jitter_stats() reports p50/p99 lateness.
+
+Example (plays a progression spec file to a serial MIDI device):
+    python midi_scheduler.py specs.txt --port /dev/ttyACM0 --bpm 100 --strum 30
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from chord_generator import chord_box_events, iter_progression_chords
+
+try:
+    import serial
+except ImportError:  # pyserial is only needed for SerialSink
+    serial = None
+
+NOTE_ON = 0x90
+NOTE_OFF = 0x80
+
+
+# ===================== Output Sinks =====================
+
+class LoopbackSink:
+    """Keeps every message in memory as (monotonic_time, message), for tests."""
+
+    def __init__(self):
+        self.messages = []
+
+    def send(self, message):
+        self.messages.append((time.monotonic(), message))
+
+    def close(self):
+        pass
+
+
+class FileSink:
+    """Appends raw MIDI bytes to a file."""
+
+    def __init__(self, path):
+        self.f = open(path, "wb")
+
+    def send(self, message):
+        self.f.write(message)
+
+    def close(self):
+        self.f.close()
+
+
+class SerialSink:
+    """
+    Writes MIDI bytes to a serial port (e.g. a MIDI interface or a board's USB serial).
+
+    Writes block for up to write_timeout seconds; a message that cannot be
+    written whole raises instead of leaving a cut-off message in the stream.
+    """
+
+    def __init__(self, port, baudrate=31250, write_timeout=0.1):
+        if serial is None:
+            raise RuntimeError("SerialSink requires pyserial (pip install pyserial).")
+        self.port = serial.Serial(port, baudrate, write_timeout=write_timeout)
+
+    def send(self, message):
+        written = self.port.write(message)
+        if written != len(message):
+            raise serial.SerialTimeoutException(f"Wrote {written} of {len(message)} MIDI bytes")
+
+    def close(self):
+        self.port.close()
+
+
+# ===================== Scheduler =====================
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class MidiScheduler:
+    """Sends (time_seconds, message_bytes) events to a sink at their deadlines."""
+
+    def __init__(self, sink, spin_margin=0.002, max_spin_margin=0.02):
+        """
+        :param sink: Object with send(message) and close().
+        :param spin_margin: Seconds before a deadline to stop sleeping and start spinning.
+        :param max_spin_margin: Upper limit for the margin as it adapts to oversleeping.
+        """
+        self.sink = sink
+        self.spin_margin = spin_margin
+        self.max_spin_margin = max_spin_margin
+        self.lateness = []
+
+    async def play(self, events, start_delay=0.05):
+        """
+        Play events, an iterable of (time_seconds, message) in time order.
+
+        :param start_delay: Seconds between the call and time 0 of the events.
+        :return: Number of messages sent.
+        """
+        start = time.monotonic() + start_delay
+        sent = 0
+        for offset, message in events:
+            deadline = start + offset
+            remaining = deadline - time.monotonic()
+            if remaining > self.spin_margin:
+                wake = deadline - self.spin_margin
+                await asyncio.sleep(remaining - self.spin_margin)
+                oversleep = time.monotonic() - wake
+                if oversleep > self.spin_margin / 2:
+                    # The loop woke us late; leave more room next time
+                    self.spin_margin = min(self.max_spin_margin, self.spin_margin * 1.5)
+            while time.monotonic() < deadline:
+                pass  # Spin for the last moment; it is at most spin_margin long
+            self.sink.send(message)
+            self.lateness.append(time.monotonic() - deadline)
+            sent += 1
+        return sent
+
+    def jitter_stats(self):
+        """Lateness statistics in milliseconds."""
+        return {
+            "count": len(self.lateness),
+            "p50_ms": percentile(self.lateness, 0.50) * 1000,
+            "p99_ms": percentile(self.lateness, 0.99) * 1000,
+            "max_ms": max(self.lateness, default=0.0) * 1000,
+        }
+
+
+# ===================== Chord Events =====================
+
+def chord_events(progression, bpm=120, beats_per_chord=2, strum_ms=0, octave_shift=0, velocity=100, channel=0):
+    """
+    Turn a progression into timed MIDI messages, like chord_box_rev1_11 plays chords.
+
+    The notes and their timing come from chord_generator.chord_box_events,
+    the same events render_progression_midi writes to a .mid file.
+
+    :param progression: Iterable of (scale_type, tonic, numeral_index, complexity, inversion)
+                        tuples, with complexity as the offsets list.
+    :param strum_ms: Delay between the notes of a chord (strum or arpeggio).
+    :return: Generator of (time_seconds, message_bytes), in time order.
+    """
+    for seconds, is_note_on, note in chord_box_events(progression, beats_per_chord * 60.0 / bpm,
+                                                      strum_ms / 1000.0, octave_shift):
+        if is_note_on:
+            yield seconds, bytes((NOTE_ON | channel, note, velocity))
+        else:
+            yield seconds, bytes((NOTE_OFF | channel, note, 0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play progression specs (see chord_generator --batch) to a MIDI sink.")
+    parser.add_argument("specs", nargs="?", default="-", help="Spec file, or stdin if omitted")
+    parser.add_argument("--port", help="Serial port to play to")
+    parser.add_argument("--baud", type=int, default=31250, help="Serial baud rate (default 31250)")
+    parser.add_argument("--out", help="Write raw MIDI bytes to this file instead")
+    parser.add_argument("--bpm", type=float, default=120)
+    parser.add_argument("--beats", type=float, default=2, help="Beats per chord")
+    parser.add_argument("--strum", type=float, default=0, help="Strum delay in ms")
+    parser.add_argument("--octave", type=int, default=0, help="Octave shift")
+    args = parser.parse_args()
+
+    if args.port:
+        sink = SerialSink(args.port, args.baud)
+    elif args.out:
+        sink = FileSink(args.out)
+    else:
+        sink = LoopbackSink()
+
+    spec_file = sys.stdin if args.specs == "-" else open(args.specs)
+    scheduler = MidiScheduler(sink)
+    try:
+        with spec_file:
+            events = chord_events(iter_progression_chords(spec_file, sys.stderr),
+                                  args.bpm, args.beats, args.strum, args.octave)
+            asyncio.run(scheduler.play(events))
+    finally:
+        sink.close()
+    stats = scheduler.jitter_stats()
+    print(f"Sent {stats['count']} messages, lateness p50 {stats['p50_ms']:.3f} ms, "
+          f"p99 {stats['p99_ms']:.3f} ms, max {stats['max_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Find the RP2040 board's serial port by USB VID/PID/serial number.
+
+The last port found is cached on disk and checked first (through sysfs on
+Linux), so the usual case needs no port enumeration at all. TtyWatcher
+polls /sys/class/tty in the background and reports boards being plugged
+in or removed.
+"""
+import json
+import os
+import threading
+
+import serial.tools.list_ports
+
+# USB vendor IDs of boards running the preset firmware
+RP2040_VIDS = {
+    0x239A,  # Adafruit
+    0x2E8A,  # Raspberry Pi
+}
+
+SYS_CLASS_TTY = "/sys/class/tty"
+DEFAULT_CACHE = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+                             "preset_switch", "last_device.json")
+
+
+def _read_sysfs(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def sysfs_usb_info(device):
+    """
+    Read (vid, pid, serial_number) for a tty device from sysfs.
+
+    Returns None when sysfs has no USB information for it (not Linux, not USB,
+    or not plugged in).
+    """
+    path = os.path.join(SYS_CLASS_TTY, os.path.basename(device), "device")
+    if not os.path.exists(path):
+        return None
+    path = os.path.realpath(path)
+    # Walk up from the interface to the USB device that holds the IDs
+    for _ in range(4):
+        vid = _read_sysfs(os.path.join(path, "idVendor"))
+        if vid is not None:
+            pid = _read_sysfs(os.path.join(path, "idProduct"))
+            return int(vid, 16), int(pid, 16) if pid else None, _read_sysfs(os.path.join(path, "serial"))
+        path = os.path.dirname(path)
+    return None
+
+
+def matches(vid, pid, serial_number, want_vid=None, want_pid=None, want_serial=None):
+    """True if the IDs fit the wanted ones (any RP2040 vendor when want_vid is None)."""
+    if vid is None:
+        return False
+    if want_vid is None and vid not in RP2040_VIDS:
+        return False
+    if want_vid is not None and vid != want_vid:
+        return False
+    if want_pid is not None and pid != want_pid:
+        return False
+    return want_serial is None or serial_number == want_serial
+
+
+def load_cached_device(cache_path=DEFAULT_CACHE):
+    """Return the cached {"device", "vid", "pid", "serial_number"} entry, or None."""
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_device(entry, cache_path=DEFAULT_CACHE):
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(entry, f)
+    except OSError:
+        pass  # The cache is only a speed-up
+
+
+def _check_cached(entry, vid, pid, serial_number):
+    """Confirm the cached device is still the same board, without enumerating ports."""
+    device = entry.get("device")
+    if not device or not os.path.exists(device):
+        return False
+    if not matches(entry.get("vid"), entry.get("pid"), entry.get("serial_number"), vid, pid, serial_number):
+        return False
+    info = sysfs_usb_info(device)
+    if info is None:
+        # No sysfs (e.g. macOS): trust the cache only when the port name exists
+        return not os.path.isdir(SYS_CLASS_TTY)
+    return info == (entry.get("vid"), entry.get("pid"), entry.get("serial_number"))
+
+
+def find_rp2040(vid=None, pid=None, serial_number=None, cache_path=DEFAULT_CACHE, use_cache=True):
+    """
+    Find the RP2040 board's serial port.
+
+    Checks the cached port first, then enumerates ports once and matches on
+    USB IDs. Without any IDs given, boards whose descriptions look like the
+    RP2040 are accepted as a fallback.
+
+    :return: The port name, or None if nothing matched.
+    """
+    if use_cache:
+        entry = load_cached_device(cache_path)
+        if entry and _check_cached(entry, vid, pid, serial_number):
+            return entry["device"]
+
+    by_description = None
+    generic = None
+    for port in serial.tools.list_ports.comports():
+        if matches(port.vid, port.pid, port.serial_number, vid, pid, serial_number):
+            save_cached_device({"device": port.device, "vid": port.vid, "pid": port.pid,
+                                "serial_number": port.serial_number}, cache_path)
+            return port.device
+        if vid is None and pid is None and serial_number is None:
+            # Look for typical RP2040 identifiers, then generic USB Serial Devices
+            if by_description is None and ("RP2040" in port.description or "Adafruit" in port.description
+                                           or "USB Serial Device" in port.description):
+                by_description = port.device
+            elif generic is None and "USB Serial" in port.description:
+                generic = port.device
+    return by_description or generic
+
+
+def find_all_rp2040(vid=None, pid=None):
+    """List (device, serial_number) for every connected board matching the IDs."""
+    return [(port.device, port.serial_number) for port in serial.tools.list_ports.comports()
+            if matches(port.vid, port.pid, port.serial_number, vid, pid)]
+
+
+def list_ttys():
+    """Names of the USB serial ttys currently in /sys/class/tty."""
+    try:
+        return {name for name in os.listdir(SYS_CLASS_TTY) if name.startswith(("ttyACM", "ttyUSB"))}
+    except OSError:
+        return set()
+
+
+class TtyWatcher(threading.Thread):
+    """
+    Polls /sys/class/tty and calls callback(event, device, usb_info) on changes.
+
+    event is "added" or "removed"; usb_info is (vid, pid, serial_number) for
+    added devices (None if unknown) and the last known info for removed ones.
+    """
+
+    def __init__(self, callback, interval=0.5):
+        super().__init__(daemon=True)
+        self.callback = callback
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.known = {name: sysfs_usb_info(name) for name in list_ttys()}
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            current = list_ttys()
+            for name in current - self.known.keys():
+                self.known[name] = sysfs_usb_info(name)
+                self.callback("added", "/dev/" + name, self.known[name])
+            for name in self.known.keys() - current:
+                self.callback("removed", "/dev/" + name, self.known.pop(name))
+
+    def stop(self):
+        self.stopped.set()
+
+
+if __name__ == "__main__":
+    device = find_rp2040(use_cache=False)
+    print(f"RP2040: {device}" if device else "RP2040 not found")
+    for device, serial_number in find_all_rp2040():
+        print(f"  {device} (serial {serial_number})")
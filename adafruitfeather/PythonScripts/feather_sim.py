@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Host-side simulator of the midi_test_02 Feather firmware.
+
+Opens a pty that behaves like the board's USB serial port:
+  'P' + preset                -> program change, replies "Preset N"
+  'S' + seq + preset + check  -> program change, replies 'A' + seq + preset + check
+With --midi it opens a second pty for the USB MIDI side. Notes 21/22 on
+channel 1 step the preset up/down; every other message passes through to
+the module output (a file, or stdout as hex).
+
+Example:
+    python feather_sim.py --delay-ms 2          # prints the pty to pass as --port
+    python feather_sim.py --bench 5000          # load test with FramedPresetClient
+"""
+import argparse
+import heapq
+import os
+import pty
+import select
+import sys
+import threading
+import time
+import tty
+
+# Same constants as midi_test_02.ino
+MIDI_CHANNEL = 0
+NOTE_ON = 0x90
+NOTE_OFF = 0x80
+PROGRAM_CHANGE = 0xC0
+PRESET_COUNT = 127
+PRESET_UP_NOTE = 21
+PRESET_DOWN_NOTE = 22
+FRAME_CHECK_KEY = 0x5A
+
+# Data bytes that follow each status type
+MIDI_DATA_LENGTHS = {0x80: 2, 0x90: 2, 0xA0: 2, 0xB0: 2, 0xC0: 1, 0xD0: 1, 0xE0: 2}
+
+
+class FeatherFirmware:
+    """The firmware's state machine, fed bytes and returning bytes."""
+
+    def __init__(self):
+        self.current_preset = 0
+        self.serial_buffer = bytearray()
+        self.midi_buffer = bytearray()
+        self.commands = 0
+
+    def program_change(self, preset):
+        self.current_preset = preset
+        return bytes((PROGRAM_CHANGE | MIDI_CHANNEL, preset))
+
+    def handle_serial(self, data):
+        """
+        Feed bytes from the USB serial port.
+
+        Returns (reply_to_host, midi_to_module).
+        """
+        self.serial_buffer += data
+        reply = bytearray()
+        module = bytearray()
+        buffer = self.serial_buffer
+        while len(buffer) >= 2:
+            marker = buffer[0]
+            if marker == ord('P'):
+                preset = buffer[1]
+                del buffer[:2]
+                if preset <= 127:
+                    module += self.program_change(preset)
+                reply += f"Preset {self.current_preset}\r\n".encode()
+                self.commands += 1
+            elif marker == ord('S'):
+                if len(buffer) < 4:
+                    break  # Wait for the rest of the frame
+                _, seq, preset, check = buffer[:4]
+                del buffer[:4]
+                if check != seq ^ preset ^ FRAME_CHECK_KEY or preset > 127:
+                    continue  # Host times out
+                module += self.program_change(preset)
+                reply += bytes((ord('A'), seq, preset, check))
+                self.commands += 1
+            else:
+                del buffer[0]  # Not a command, drop it
+        return bytes(reply), bytes(module)
+
+    def handle_midi(self, data):
+        """Feed bytes from the USB MIDI side; returns the bytes forwarded to the module."""
+        self.midi_buffer += data
+        module = bytearray()
+        buffer = self.midi_buffer
+        while buffer:
+            status = buffer[0]
+            if not status & 0x80:
+                del buffer[0]  # Stray data byte, the firmware ignores it too
+                continue
+            length = MIDI_DATA_LENGTHS.get(status & 0xF0)
+            if length is None:
+                del buffer[0]  # System messages are not forwarded
+                continue
+            if len(buffer) < 1 + length:
+                break
+            message = bytes(buffer[:1 + length])
+            del buffer[:1 + length]
+            message_type, channel = status & 0xF0, status & 0x0F
+            if message_type == NOTE_ON and channel == MIDI_CHANNEL and message[2] > 0:
+                if message[1] == PRESET_UP_NOTE:
+                    module += self.program_change((self.current_preset + 1) % PRESET_COUNT)
+                    continue
+                if message[1] == PRESET_DOWN_NOTE:
+                    previous = self.current_preset - 1 if self.current_preset > 0 else PRESET_COUNT - 1
+                    module += self.program_change(previous)
+                    continue
+            module += message
+        return bytes(module)
+
+
+def open_pty():
+    """Open a raw pty; returns (master_fd, slave_path)."""
+    master, slave = pty.openpty()
+    tty.setraw(slave)
+    return master, os.ttyname(slave)
+
+
+class FeatherSimulator:
+    """Runs FeatherFirmware behind ptys, with an optional reply delay."""
+
+    def __init__(self, delay=0.0, midi=False, module_out=None):
+        self.firmware = FeatherFirmware()
+        self.delay = delay
+        self.module_out = module_out
+        self.serial_fd, self.serial_path = open_pty()
+        self.midi_fd, self.midi_path = open_pty() if midi else (None, None)
+        self.replies = []  # Heap of (due_time, order, data)
+        self.order = 0
+        self.stopped = threading.Event()
+
+    def _module(self, data):
+        if data and self.module_out is not None:
+            self.module_out(data)
+
+    def run(self):
+        fds = [fd for fd in (self.serial_fd, self.midi_fd) if fd is not None]
+        while not self.stopped.is_set():
+            timeout = 0.1
+            if self.replies:
+                timeout = max(0.0, min(timeout, self.replies[0][0] - time.monotonic()))
+            readable, _, _ = select.select(fds, [], [], timeout)
+            for fd in readable:
+                try:
+                    data = os.read(fd, 4096)
+                except OSError:
+                    continue  # Nobody has the other end open yet
+                if fd == self.serial_fd:
+                    reply, module = self.firmware.handle_serial(data)
+                    self._module(module)
+                    if reply:
+                        if self.delay:
+                            heapq.heappush(self.replies, (time.monotonic() + self.delay, self.order, reply))
+                            self.order += 1
+                        else:
+                            os.write(self.serial_fd, reply)
+                else:
+                    self._module(self.firmware.handle_midi(data))
+            now = time.monotonic()
+            while self.replies and self.replies[0][0] <= now:
+                os.write(self.serial_fd, heapq.heappop(self.replies)[2])
+
+    def start(self):
+        """Run in a background thread."""
+        thread = threading.Thread(target=self.run, daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self.stopped.set()
+
+
+def benchmark(count, delay=0.0, in_flight=64):
+    """Drive the simulator with FramedPresetClient and print throughput and latency."""
+    import serial
+    from preset_switch import FramedPresetClient
+
+    sim = FeatherSimulator(delay)
+    sim.start()
+    ser = serial.Serial(sim.serial_path, 9600, timeout=0)
+    client = FramedPresetClient(ser, deadline=1.0)
+    start = time.perf_counter()
+    for i in range(count):
+        client.send(i % 128)
+        if len(client.pending) >= in_flight:
+            client.poll(0.01)
+    results = client.wait_all()
+    elapsed = time.perf_counter() - start
+    sim.stop()
+    ser.close()
+
+    latencies = sorted(latency for _, _, latency in results if latency is not None)
+    lost = len(results) - len(latencies)
+    print(f"{count} commands in {elapsed:.3f} s ({count / elapsed:.0f}/s), {lost} lost")
+    if latencies:
+        print(f"Round trip p50 {latencies[len(latencies) // 2] * 1000:.3f} ms, "
+              f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate the midi_test_02 Feather on a pty.")
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="Delay before each reply")
+    parser.add_argument("--midi", action="store_true", help="Also open a pty for the USB MIDI side")
+    parser.add_argument("--module-log", help="Write the bytes sent to the MIDI module to this file")
+    parser.add_argument("--bench", type=int, metavar="N", help="Run N framed commands against the simulator and exit")
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench, args.delay_ms / 1000)
+        return
+
+    log = open(args.module_log, "ab", buffering=0) if args.module_log else None
+    module_out = log.write if log else (lambda data: print(f"Module <- {data.hex(' ')}"))
+    sim = FeatherSimulator(args.delay_ms / 1000, args.midi, module_out)
+    print(f"Serial port: {sim.serial_path}")
+    if sim.midi_path:
+        print(f"MIDI port: {sim.midi_path}")
+    sys.stdout.flush()
+    try:
+        sim.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if log:
+            log.close()
+
+
+if __name__ == "__main__":
+    main()
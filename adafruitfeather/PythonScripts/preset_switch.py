@@ -1,23 +1,35 @@
 #!/usr/bin/env python3
+import argparse
+import atexit
+import math
+from concurrent.futures import ThreadPoolExecutor
+import io
+import json
+import os
+import selectors
+import signal
+import socket
+import socketserver
 import sys
+import tempfile
+import threading
 import serial
 import time
 import serial.tools.list_ports
 
-def find_rp2040():
-    """Find the RP2040 board's serial port."""
-    ports = list(serial.tools.list_ports.comports())
-    for port in ports:
-        # Look for typical RP2040 identifiers
-        if "RP2040" in port.description or "Adafruit" in port.description or "USB Serial Device" in port.description:
-            return port.device
-    
-    # If no specific identifier found, look for generic USB Serial Device
-    for port in ports:
-        if "USB Serial" in port.description:
-            return port.device
-            
-    return None
+from device_discovery import TtyWatcher, find_all_rp2040, find_rp2040, sysfs_usb_info, matches
+from timing_stats import TimingRing
+
+# Unix socket the daemon listens on for preset commands
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "preset_switch.sock")
+
+# Framed protocol (see midi_test_02): 'S' + seq + preset + check, acked by 'A' + seq + preset + check
+FRAME_REQUEST = ord('S')
+FRAME_ACK = ord('A')
+FRAME_CHECK_KEY = 0x5A
+
+# Step timings of every command sent from this process (see timing_stats.py)
+STATS = TimingRing()
 
 def send_preset_command(port, preset_number):
     """
@@ -25,14 +37,21 @@ def send_preset_command(port, preset_number):
     'P' followed by the preset number as a single byte
     """
     try:
-        # Command format: 'P' (marker) + preset_number (0-127 as a byte)
-        command = bytes(['P'.encode()[0], preset_number])
-        port.write(command)
-        
-        # Wait for and read the confirmation response
-        time.sleep(0.2)  # Give the Arduino time to process and respond
-        response = port.readline().decode('utf-8').strip()
-        
+        port.reset_input_buffer()  # Drop replies left over from earlier commands
+        start = time.perf_counter()
+        port.write(encode_preset_command(preset_number))
+        written = time.perf_counter()
+
+        # Wait for the confirmation response (up to the port's timeout)
+        first = port.read(1)
+        first_byte = time.perf_counter()
+        response = (first + port.readline()).decode('utf-8').strip() if first else ""
+        done = time.perf_counter()
+        STATS.record("P", write=written - start,
+                     first_byte=first_byte - start if first else math.nan,
+                     response=done - start if first else math.nan)
+
+        # Report only after the timing-sensitive part is over
         if response:
             print(f"Device response: {response}")
         else:
@@ -43,54 +62,610 @@ def send_preset_command(port, preset_number):
         print(f"Error sending preset change: {e}")
         return False
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python preset_switcher.py PRESET_NUMBER")
-        print("Example: python preset_switcher.py 27")
-        sys.exit(1)
-    
+def encode_preset_command(preset_number):
+    """Command format: 'P' (marker) + preset_number (0-127 as a byte)."""
+    return bytes(['P'.encode()[0], preset_number])
+
+def wait_for_preset_reply(ser, preset, end):
+    """
+    Read reply lines until the board says "Preset <preset>" or time.perf_counter() passes `end`.
+
+    Other lines (debug output, replies to earlier commands) are skipped.
+    Returns True if the reply arrived.
+    """
+    expected = f"Preset {preset}"
+    old_timeout = ser.timeout
     try:
-        preset = int(sys.argv[1])
-        if preset < 0 or preset > 127:
-            print("Error: Preset number must be between 0 and 127")
-            sys.exit(1)
+        while True:
+            remaining = end - time.perf_counter()
+            if remaining <= 0:
+                return False
+            ser.timeout = remaining
+            if ser.readline().decode('utf-8', 'replace').strip() == expected:
+                return True
+    finally:
+        ser.timeout = old_timeout
+
+def parse_preset(text):
+    """Parse and range-check a preset number, raising ValueError with a readable message."""
+    try:
+        preset = int(text)
     except ValueError:
-        print("Error: Preset number must be an integer")
-        sys.exit(1)
-    
+        raise ValueError("Preset number must be an integer")
+    if preset < 0 or preset > 127:
+        raise ValueError("Preset number must be between 0 and 127")
+    return preset
+
+def open_device(port_name):
+    """Open the board's serial port and wait for the connection to settle."""
+    # Open serial connection at 9600 baud (standard for USB Serial)
+    start = time.perf_counter()
+    ser = serial.Serial(port_name, 9600, timeout=1)
+    STATS.record("open", open=time.perf_counter() - start)
+    time.sleep(0.5)  # Give the serial connection time to establish
+    return ser
+
+def resolve_port(port_name=None, vid=None, pid=None, serial_number=None):
+    """Use the given port, or find the RP2040, or ask the user (only when run interactively)."""
+    if port_name:
+        return port_name
+
     # Try to find the RP2040 automatically
-    port_name = find_rp2040()
-    
+    port_name = find_rp2040(vid, pid, serial_number)
+
     if not port_name:
         # If automatic detection fails, suggest manual entry
         print("RP2040 not automatically detected. Available ports:")
         for port in serial.tools.list_ports.comports():
             print(f"  {port.device}: {port.description}")
-        
+
+        if not sys.stdin.isatty():
+            raise RuntimeError("No RP2040 found; pass --port")
         port_name = input("Enter port name manually (e.g., COM3 or /dev/ttyACM0): ")
-    
+    return port_name
+
+# ===================== Framed Protocol =====================
+
+def encode_frame(marker, seq, preset):
+    """Build a 4-byte frame: marker, sequence byte, preset, check byte."""
+    return bytes([marker, seq, preset, seq ^ preset ^ FRAME_CHECK_KEY])
+
+class FramedPresetClient:
+    """
+    Sends framed preset commands and matches each ack to its command by sequence byte.
+
+    Several commands can be in flight at once. Reads wait on the port's file
+    descriptor with selectors (or on pyserial's own timed read for ports
+    without one, like loop://), so an ack is handled as soon as it arrives.
+    Commands not acked within the deadline finish with a latency of None.
+    """
+
+    def __init__(self, ser, deadline=0.5):
+        self.ser = ser
+        self.deadline = deadline
+        self.next_seq = 0
+        self.pending = {}  # seq -> (preset, send time, seconds spent writing)
+        self.results = []  # (seq, preset, round-trip seconds or None) of finished commands
+        self.buffer = bytearray()
+        self.selector = None
+        try:
+            fd = ser.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            fd = None
+        if fd is not None:
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(fd, selectors.EVENT_READ)
+
+    def send(self, preset):
+        """Write a preset command without waiting for its ack; returns its sequence byte."""
+        if len(self.pending) >= 256:
+            self._wait(lambda: len(self.pending) < 256)  # Every sequence byte is in use
+        while self.next_seq in self.pending:
+            self.next_seq = (self.next_seq + 1) % 256
+        seq = self.next_seq
+        self.next_seq = (seq + 1) % 256
+        start = time.perf_counter()
+        self.ser.write(encode_frame(FRAME_REQUEST, seq, preset))
+        self.pending[seq] = (preset, start, time.perf_counter() - start)
+        return seq
+
+    def _read(self, timeout):
+        if self.selector is not None:
+            if not self.selector.select(timeout):
+                return b""
+            return self.ser.read(self.ser.in_waiting or 1)
+        # Leave the port's timeout as we found it; the daemon and play_cues share the port
+        old_timeout = self.ser.timeout
+        try:
+            self.ser.timeout = timeout
+            return self.ser.read(self.ser.in_waiting or 1)
+        finally:
+            self.ser.timeout = old_timeout
+
+    def poll(self, timeout=0.0):
+        """
+        Handle whatever arrives within timeout seconds.
+
+        Returns the commands finished by this call as (seq, preset, latency) tuples.
+        """
+        self.buffer += self._read(timeout)
+        now = time.perf_counter()
+        finished = []
+        while len(self.buffer) >= 4:
+            marker, seq, preset, check = self.buffer[:4]
+            if (marker != FRAME_ACK or check != seq ^ preset ^ FRAME_CHECK_KEY
+                    or self.pending.get(seq, (None,))[0] != preset):
+                del self.buffer[0]  # Not an ack for us (e.g. text output); resync
+                continue
+            del self.buffer[:4]
+            _, sent, write = self.pending.pop(seq)
+            STATS.record("S", write=write, response=now - sent)
+            finished.append((seq, preset, now - sent))
+        for seq, (preset, sent, write) in list(self.pending.items()):
+            if now - sent > self.deadline:
+                del self.pending[seq]
+                STATS.record("S", write=write)
+                finished.append((seq, preset, None))
+        self.results.extend(finished)
+        return finished
+
+    def _wait(self, done):
+        while not done():
+            oldest = min(sent for _, sent, _ in self.pending.values())
+            self.poll(max(0.0, oldest + self.deadline - time.perf_counter()))
+
+    def wait_all(self):
+        """Wait for every command in flight; returns and clears the finished (seq, preset, latency) list."""
+        self._wait(lambda: not self.pending)
+        results, self.results = self.results, []
+        return results
+
+    def switch(self, preset):
+        """Send one preset command and wait for it; returns the round-trip seconds or None."""
+        seq = self.send(preset)
+        self._wait(lambda: seq not in self.pending)
+        for i in range(len(self.results) - 1, -1, -1):
+            if self.results[i][0] == seq:
+                return self.results.pop(i)[2]
+
+# ===================== Daemon =====================
+
+class PresetDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Owns the serial port and takes preset numbers over a Unix socket.
+
+    Each request is one line holding a preset number; the reply is one line,
+    "OK <preset>" once the command has been written to the device, or
+    "ERR <message>". A "STATS" line is answered with "OK " and the step
+    timing summary as JSON. Each connection gets its own thread, so a client
+    that stays connected without sending does not hold up the others; port
+    access is serialized with a lock, so commands never interleave.
+    """
+
+    daemon_threads = True  # Idle clients do not keep the process alive on shutdown
+
+    def __init__(self, socket_path, port_name, framed=False, deadline=0.5, watch_ids=None):
+        self.socket_path = socket_path
+        self.port_name = port_name
+        self.framed = framed
+        self.deadline = deadline
+        self.ser = None
+        self.port_changed = False
+        self.port_lock = threading.Lock()
+        self.open()
+        # Follow the board across unplug/replug when (vid, pid, serial_number) are given
+        self.watch_ids = watch_ids
+        self.watcher = None
+        if watch_ids is not None:
+            self.watcher = TtyWatcher(self.on_hotplug)
+            self.watcher.start()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)  # Left over from a daemon that did not shut down cleanly
+        super().__init__(socket_path, PresetRequestHandler)
+
+    def open(self):
+        if self.ser is not None:
+            self.ser.close()
+        self.ser = open_device(self.port_name)
+        self.port_changed = False
+        self.client = FramedPresetClient(self.ser, self.deadline) if self.framed else None
+
+    def write_preset(self, preset):
+        """
+        Send a preset command, reopening the port once if the device went away.
+
+        In framed mode this waits for the device's ack and returns the
+        round-trip seconds (None if the deadline passed); otherwise it returns
+        as soon as the command is written. Safe to call from several handler threads.
+        """
+        with self.port_lock:
+            if self.port_changed:
+                self.open()
+            try:
+                return self._write_preset(preset)
+            except (serial.SerialException, OSError):
+                self.open()
+                return self._write_preset(preset)
+
+    def on_hotplug(self, event, device, usb_info):
+        """TtyWatcher callback (runs on the watcher thread, so it only sets flags)."""
+        print(f"Hot-plug: {device} {event}")
+        if event == "added" and usb_info is not None and matches(*usb_info, *self.watch_ids):
+            self.port_name = device
+            self.port_changed = True
+
+    def _write_preset(self, preset):
+        if self.client is not None:
+            return self.client.switch(preset)
+        start = time.perf_counter()
+        self.ser.write(encode_preset_command(preset))
+        self.ser.flush()
+        STATS.record("P", write=time.perf_counter() - start)
+        # Log anything the device has said without waiting for it
+        waiting = self.ser.in_waiting
+        if waiting:
+            print(f"Device response: {self.ser.read(waiting).decode('utf-8', 'replace').strip()}")
+        return None
+
+    def server_close(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+        super().server_close()
+        with self.port_lock:
+            self.ser.close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+class PresetRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            request = line.decode().strip()
+            if request.upper() == "STATS":
+                self.wfile.write(f"OK {json.dumps(STATS.summary())}\n".encode())
+                self.wfile.flush()
+                continue
+            try:
+                preset = parse_preset(request)
+                latency = self.server.write_preset(preset)
+                if not self.server.framed:
+                    reply = f"OK {preset}"
+                elif latency is None:
+                    reply = f"ERR no ack for preset {preset}"
+                else:
+                    reply = f"OK {preset} {latency * 1000:.2f}ms"
+            except Exception as e:
+                reply = f"ERR {e}"
+            self.wfile.write((reply + "\n").encode())
+            self.wfile.flush()
+
+def run_daemon(port_name=None, socket_path=DEFAULT_SOCKET, framed=False, deadline=0.5, ids=(None, None, None),
+               watch=False):
+    """Keep the device open and serve preset commands until interrupted."""
+    port_name = resolve_port(port_name, *ids)
+    print(f"Connecting to {port_name}...")
+    watch_ids = None
+    if watch:
+        # Remember which board this is so a replug on another tty is followed
+        usb_info = sysfs_usb_info(port_name)
+        watch_ids = ids if usb_info is None else (usb_info[0], usb_info[1], ids[2] or usb_info[2])
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))  # Clean up the socket on kill
+    with PresetDaemon(socket_path, port_name, framed, deadline, watch_ids) as daemon:
+        print(f"Listening for preset commands on {socket_path}")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            print("Shutting down")
+
+def send_to_daemon(preset, socket_path=DEFAULT_SOCKET, timeout=2.0):
+    """
+    Ask a running daemon to switch presets (or, with preset "STATS", for its timings).
+
+    Returns the daemon's reply line, or None if no daemon is listening. A
+    daemon that is there but does not answer (timeout, broken pipe, ...) gives
+    an "ERR" reply rather than a fallback, since it may still hold the port.
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
     try:
-        # Open serial connection at 9600 baud (standard for USB Serial)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            try:
+                client.connect(socket_path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                return None  # Stale socket file, no daemon
+            client.sendall(f"{preset}\n".encode())
+            reply = client.makefile("rb").readline().decode().strip()
+    except OSError as e:
+        return f"ERR daemon did not answer: {e or type(e).__name__}"
+    return reply or "ERR daemon closed the connection"
+
+# ===================== Multi-Board Fan-Out =====================
+
+def switch_board(port_name, preset, framed=True, deadline=0.5):
+    """
+    Open one board, switch its preset and close it.
+
+    Returns (port_name, preset, latency, error): latency is the round trip to
+    the board's ack (framed) or its "Preset N" reply; error is None on success.
+    A board that does not answer within `deadline` seconds has failed.
+    """
+    try:
+        ser = open_device(port_name)
+    except Exception as e:
+        return port_name, preset, None, f"open failed: {e}"
+    try:
+        if framed:
+            latency = FramedPresetClient(ser, deadline).switch(preset)
+            return port_name, preset, latency, None if latency is not None else f"no ack within {deadline} s"
+        ser.reset_input_buffer()
+        start = time.perf_counter()
+        ser.write(encode_preset_command(preset))
+        ser.flush()
+        written = time.perf_counter()
+        if not wait_for_preset_reply(ser, preset, start + deadline):
+            STATS.record("P", write=written - start)
+            return port_name, preset, None, f"no reply within {deadline} s"
+        latency = time.perf_counter() - start
+        STATS.record("P", write=written - start, response=latency)
+        return port_name, preset, latency, None
+    except Exception as e:
+        return port_name, preset, None, str(e)
+    finally:
+        ser.close()
+
+def fan_out_presets(targets, framed=True, deadline=0.5):
+    """
+    Switch presets on several boards at once.
+
+    Every board is handled on its own thread, so the total time is about
+    that of the slowest board rather than the sum.
+
+    :param targets: Dict of port name -> preset number.
+    :return: List of switch_board results, in the order of targets.
+    """
+    if not targets:
+        return []
+    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        futures = [pool.submit(switch_board, port_name, preset, framed, deadline)
+                   for port_name, preset in targets.items()]
+        return [future.result() for future in futures]
+
+def parse_preset_map(text):
+    """Parse "PORT=PRESET,PORT=PRESET" into a dict."""
+    targets = {}
+    for item in text.split(","):
+        port_name, _, preset = item.rpartition("=")
+        if not port_name:
+            raise ValueError(f"Expected PORT=PRESET, got '{item}'")
+        targets[port_name] = parse_preset(preset)
+    return targets
+
+def run_fan_out(targets, framed=True, deadline=0.5):
+    """Switch every board in targets and print per-board results; returns True if all succeeded."""
+    start = time.perf_counter()
+    results = fan_out_presets(targets, framed, deadline)
+    elapsed = time.perf_counter() - start
+    failed = [result for result in results if result[3] is not None]
+    for port_name, preset, latency, error in results:
+        if error is None:
+            print(f"  {port_name}: preset {preset} OK ({latency * 1000:.2f} ms)")
+        else:
+            print(f"  {port_name}: preset {preset} FAILED ({error})")
+    print(f"{len(results) - len(failed)}/{len(results)} boards switched in {elapsed * 1000:.1f} ms")
+    if failed:
+        print(f"Failed: {', '.join(result[0] for result in failed)}")
+    return not failed
+
+# ===================== Cue Player =====================
+
+def parse_cue_time(text, bpm=None):
+    """Parse a cue time: seconds ("12.5"), minutes:seconds ("1:02.5") or beats ("32b", needs bpm)."""
+    if text.lower().endswith("b"):
+        if not bpm:
+            raise ValueError(f"Cue time '{text}' is in beats; pass --bpm")
+        return float(text[:-1]) * 60.0 / bpm
+    if ":" in text:
+        minutes, seconds = text.split(":", 1)
+        return int(minutes) * 60 + float(seconds)
+    return float(text)
+
+def load_cues(path, bpm=None):
+    """
+    Read a cue file: one "TIME PRESET" per line, "#" starts a comment.
+
+    Returns (seconds, preset) pairs sorted by time.
+    """
+    cues = []
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            try:
+                time_text, preset_text = line.split()
+                cues.append((parse_cue_time(time_text, bpm), parse_preset(preset_text)))
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: {e}")
+    cues.sort()
+    return cues
+
+def play_cues(ser, cues, framed=False, deadline=0.5, spin_margin=0.002, start_delay=0.1):
+    """
+    Fire preset cues on schedule over an open connection.
+
+    Deadlines are measured from one start time on the monotonic clock so
+    timing errors never add up. Each command is encoded ahead of time; the
+    player sleeps (or, in framed mode, handles acks) until just before the
+    deadline, then spins for the last moment. The margin grows if sleeps
+    overshoot.
+
+    :return: List of (cue_seconds, preset, lateness_seconds). In framed mode,
+             cues the device never acked are reported at the end.
+    """
+    client = FramedPresetClient(ser, deadline) if framed else None
+    queue = [(offset, preset, encode_preset_command(preset)) for offset, preset in cues]
+    start = time.monotonic() + start_delay
+    log = []
+    for offset, preset, command in queue:
+        target = start + offset
+        while True:
+            remaining = target - time.monotonic()
+            if remaining <= spin_margin:
+                break
+            wait = remaining - spin_margin
+            if client is not None:
+                client.poll(min(wait, 0.05))  # Handle acks while waiting
+            else:
+                time.sleep(wait)
+            if time.monotonic() > target:
+                spin_margin = min(0.02, spin_margin * 1.5)  # Overslept; wake earlier next time
+        while time.monotonic() < target:
+            pass
+        if client is not None:
+            client.send(preset)
+        else:
+            sent = time.monotonic()
+            ser.write(command)
+            STATS.record("P", write=time.monotonic() - sent, late=sent - target)
+        lateness = time.monotonic() - target
+        log.append((offset, preset, lateness))
+        print(f"Cue {offset:9.3f} s preset {preset:3d}: sent {lateness * 1000:+.3f} ms late")
+
+    if client is not None:
+        for seq, preset, latency in client.wait_all():
+            if latency is None:
+                print(f"Preset {preset} (seq {seq}): no ack within {deadline} s")
+    if log:
+        worst = max(lateness for _, _, lateness in log)
+        print(f"Fired {len(log)} cues, worst lateness {worst * 1000:.3f} ms")
+    return log
+
+# ===================== Command Line =====================
+
+def send_direct(port_name, preset, framed=False, deadline=0.5, ids=(None, None, None)):
+    """Open the device, send one preset command and close it again."""
+    try:
+        port_name = resolve_port(port_name, *ids)
         print(f"Connecting to {port_name}...")
-        ser = serial.Serial(port_name, 9600, timeout=1)
-        time.sleep(0.5)  # Give the serial connection time to establish
-        
+        ser = open_device(port_name)
+
         # Send the preset change command
         print(f"Sending command to switch to preset {preset}...")
-        success = send_preset_command(ser, preset)
-        
+        if framed:
+            latency = FramedPresetClient(ser, deadline).switch(preset)
+            success = latency is not None
+            if success:
+                print(f"Device acked preset {preset} in {latency * 1000:.2f} ms")
+            else:
+                print(f"No ack received within {deadline} s")
+        else:
+            success = send_preset_command(ser, preset)
+
         # Close the connection
         ser.close()
-        
+
         if success:
             print("Command sent successfully")
         else:
             print("Failed to send command")
             sys.exit(1)
-            
+
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Switch presets on the RP2040 board. Uses a running daemon when there is one.",
+        epilog="Example: python preset_switch.py 27",
+    )
+    parser.add_argument("preset", nargs="?", help="Preset number (0-127)")
+    parser.add_argument("--daemon", action="store_true", help="Keep the port open and serve preset commands on --socket")
+    parser.add_argument("--port", help="Serial port (default: detect the RP2040)")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help=f"Daemon socket path (default {DEFAULT_SOCKET})")
+    parser.add_argument("--direct", action="store_true", help="Talk to the device directly even if a daemon is running")
+    parser.add_argument("--vid", type=lambda text: int(text, 16), help="USB vendor ID to look for, in hex (default: any RP2040 board)")
+    parser.add_argument("--pid", type=lambda text: int(text, 16), help="USB product ID to look for, in hex")
+    parser.add_argument("--serial-number", help="USB serial number to look for")
+    parser.add_argument("--watch", action="store_true", help="With --daemon, follow the board when it is unplugged and replugged")
+    parser.add_argument("--framed", action="store_true", help="Use the framed protocol and wait for the device's ack")
+    parser.add_argument("--deadline", type=float, default=0.5, help="Seconds to wait for a framed ack, or a fan-out reply (default 0.5)")
+    parser.add_argument("--ports", help="Comma-separated ports to send PRESET to at once")
+    parser.add_argument("--all", action="store_true", help="Send PRESET to every connected RP2040 board at once")
+    parser.add_argument("--map", help="Send a different preset per board: PORT=PRESET,PORT=PRESET")
+    parser.add_argument("--cues", help="Play a cue file of 'TIME PRESET' lines over one open connection")
+    parser.add_argument("--bpm", type=float, help="Tempo for cue times given in beats (e.g. '32b')")
+    parser.add_argument("--stats", action="store_true", help="Print p50/p95/p99 step timings on exit")
+    parser.add_argument("--stats-out", metavar="FILE", help="Save every step timing on exit (.csv, otherwise JSON)")
+    parser.add_argument("--daemon-stats", action="store_true", help="Print the running daemon's step timings so far")
+    args = parser.parse_args()
+
+    if args.stats:
+        atexit.register(lambda: print(STATS.format_summary()))
+    if args.stats_out:
+        atexit.register(STATS.export, args.stats_out)
+
+    if args.daemon_stats:
+        reply = send_to_daemon("STATS", args.socket)
+        if reply is None:
+            print(f"Error: No daemon listening on {args.socket}")
+            sys.exit(1)
+        if not reply.startswith("OK "):
+            print(f"Daemon: {reply}")
+            sys.exit(1)
+        print(STATS.format_summary(json.loads(reply[3:])))
+        return
+    if args.daemon:
+        run_daemon(args.port, args.socket, args.framed, args.deadline,
+                   (args.vid, args.pid, args.serial_number), args.watch)
+        return
+    if args.cues:
+        try:
+            cues = load_cues(args.cues, args.bpm)
+            port_name = resolve_port(args.port, args.vid, args.pid, args.serial_number)
+            print(f"Connecting to {port_name}...")
+            ser = open_device(port_name)
+        except Exception as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        try:
+            play_cues(ser, cues, args.framed, args.deadline)
+        except KeyboardInterrupt:
+            print("Stopped")
+        finally:
+            ser.close()
+        return
+    if args.map:
+        try:
+            targets = parse_preset_map(args.map)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        sys.exit(0 if run_fan_out(targets, args.framed, args.deadline) else 1)
+    if args.preset is None:
+        parser.print_usage()
+        sys.exit(1)
+
+    try:
+        preset = parse_preset(args.preset)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if args.ports or args.all:
+        ports = args.ports.split(",") if args.ports else [device for device, _ in find_all_rp2040(args.vid, args.pid)]
+        if not ports:
+            print("Error: No RP2040 boards found")
+            sys.exit(1)
+        sys.exit(0 if run_fan_out(dict.fromkeys(ports, preset), args.framed, args.deadline) else 1)
+
+    if not args.direct:
+        reply = send_to_daemon(preset, args.socket)
+        if reply is not None:
+            print(f"Daemon: {reply}")
+            sys.exit(0 if reply.startswith("OK") else 1)
+
+    send_direct(args.port, preset, args.framed, args.deadline, (args.vid, args.pid, args.serial_number))
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,101 @@
+"""
+Fixed-size ring buffer of host-to-device command timings.
+
+Each record holds the seconds spent in each step of one command (port
+open, write, first response byte, full response), plus how late a
+scheduled command was sent; steps that did not happen are NaN. Recording
+is a few list stores under a lock, so it can sit on the timing-sensitive
+path of several threads at once.
+Summaries and JSON/CSV exports are computed later.
+"""
+import csv
+import json
+import math
+import threading
+import time
+
+STEPS = ("open", "write", "first_byte", "response", "late")
+
+
+class TimingRing:
+    """Keeps the last `capacity` command timings."""
+
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.labels = [None] * capacity
+        self.timestamps = [0.0] * capacity
+        self.steps = {step: [math.nan] * capacity for step in STEPS}
+        self.count = 0  # Total records ever added
+        self.lock = threading.Lock()  # Fan-out threads record into one ring
+
+    def record(self, label, open=math.nan, write=math.nan, first_byte=math.nan, response=math.nan, late=math.nan):
+        """Add one command's step timings, in seconds. Safe to call from several threads."""
+        with self.lock:
+            i = self.count % self.capacity
+            self.labels[i] = label
+            self.timestamps[i] = time.time()
+            self.steps["open"][i] = open
+            self.steps["write"][i] = write
+            self.steps["first_byte"][i] = first_byte
+            self.steps["response"][i] = response
+            self.steps["late"][i] = late
+            self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def records(self):
+        """Yield the stored records, oldest first, as dicts."""
+        size = len(self)
+        start = self.count - size
+        for n in range(start, self.count):
+            i = n % self.capacity
+            record = {"label": self.labels[i], "timestamp": self.timestamps[i]}
+            for step in STEPS:
+                record[step] = self.steps[step][i]
+            yield record
+
+    def summary(self):
+        """Return {step: {"count", "p50", "p95", "p99", "max"}} in milliseconds, for steps with data."""
+        result = {}
+        size = len(self)
+        for step in STEPS:
+            values = sorted(v for v in self.steps[step][:size] if not math.isnan(v))
+            if not values:
+                continue
+            result[step] = {
+                "count": len(values),
+                "p50": values[int(0.50 * (len(values) - 1))] * 1000,
+                "p95": values[int(0.95 * (len(values) - 1))] * 1000,
+                "p99": values[int(0.99 * (len(values) - 1))] * 1000,
+                "max": values[-1] * 1000,
+            }
+        return result
+
+    def format_summary(self, summary=None):
+        """Summary (this ring's, or one from summary()) as a small text table."""
+        if summary is None:
+            summary = self.summary()
+        if not summary:
+            return "No timings recorded"
+        lines = [f"{'step':<12}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+        for step, stats in summary.items():
+            lines.append(f"{step:<12}{stats['count']:>7}{stats['p50']:>10.3f}{stats['p95']:>10.3f}"
+                         f"{stats['p99']:>10.3f}{stats['max']:>10.3f}")
+        return "\n".join(lines)
+
+    def export(self, path):
+        """Write the records to a .csv file, or JSON for any other extension."""
+        records = list(self.records())
+        with open(path, "w", newline="") as f:
+            if path.lower().endswith(".csv"):
+                writer = csv.DictWriter(f, fieldnames=["label", "timestamp", *STEPS])
+                writer.writeheader()
+                writer.writerows(records)
+            else:
+                # NaN is not valid JSON, so missing steps become null
+                for record in records:
+                    for step in STEPS:
+                        if math.isnan(record[step]):
+                            record[step] = None
+                json.dump({"records": records, "summary_ms": self.summary()}, f, indent=1)
@@ -16,6 +16,12 @@ int currentPreset = 0;
 const byte PRESET_UP_NOTE = 21;    // A-1
 const byte PRESET_DOWN_NOTE = 22;  // A#-1
 
+// Serial preset commands (see PythonScripts/preset_switch.py)
+// 'P' + preset                   -> switch preset, reply "Preset N" as text
+// 'S' + seq + preset + check     -> switch preset, reply 'A' + seq + preset + check
+// check = seq ^ preset ^ 0x5A
+const byte FRAME_CHECK_KEY = 0x5A;
+
 
 void setup() {
   // Initialize TinyUSB
@@ -24,6 +30,9 @@ void setup() {
   // Wait for USB device to be mounted
   while (!TinyUSBDevice.mounted()) delay(1);
   
+  // USB serial for preset commands from the host
+  Serial.begin(9600);
+
   // Initialize Serial1 for hardware MIDI output to module
   Serial1.begin(31250);  // VS1053 MIDI baud rate
   
@@ -38,6 +47,9 @@ void setup() {
 }
 
 void loop() {
+  // Handle preset commands from the host
+  checkSerialCommands();
+
   // Check if MIDI data is available
   if (usb_midi.available()) {
     // Read one byte at a time to build MIDI messages
@@ -106,4 +118,36 @@ void sendProgramChange(uint8_t program) {
   // Program Change message (0xC0 | channel)
   Serial1.write(0xC0 | MIDI_CHANNEL);
   Serial1.write(program);
-}
\ No newline at end of file
+}
+
+// Read preset commands from USB serial without blocking
+void checkSerialCommands() {
+  while (Serial.available() >= 2) {
+    int marker = Serial.peek();
+    if (marker == 'P') {
+      Serial.read();
+      uint8_t preset = Serial.read();
+      if (preset <= 127) {
+        currentPreset = preset;
+        sendProgramChange(currentPreset);
+      }
+      Serial.print("Preset ");
+      Serial.println(currentPreset);
+    }
+    else if (marker == 'S') {
+      if (Serial.available() < 4) return; // Wait for the rest of the frame
+      Serial.read();
+      uint8_t seq = Serial.read();
+      uint8_t preset = Serial.read();
+      uint8_t check = Serial.read();
+      if (check != (seq ^ preset ^ FRAME_CHECK_KEY) || preset > 127) continue; // Host times out
+      currentPreset = preset;
+      sendProgramChange(currentPreset);
+      uint8_t ack[4] = {'A', seq, preset, check};
+      Serial.write(ack, 4);
+    }
+    else {
+      Serial.read(); // Not a command, drop it
+    }
+  }
+}
@@ -1,5 +1,6 @@
 #include <Arduino.h>
 #include <MIDIUSB.h>
+#include "chord_tables.h" // Generated by Code/gen_firmware_tables.py
 
 // ===================== Constants and Definitions =====================
 
@@ -93,7 +94,11 @@ struct MidiNote {
   uint8_t note;
   uint8_t velocity;
   bool active;
-} activeNotes[3]; // Supports up to 3 notes (triad)
+} activeNotes[CHORD_MAX_NOTES]; // Room for the largest chord in chord_tables.h
+
+// Chord voicing read from chord_tables.h (complexity 0 is the plain triad)
+const uint8_t chordComplexity = 0;
+const uint8_t chordInversion = 0;
 
 // Last pressed button tracking for replay functionality
 unsigned long lastNoteChangeTime = 0;
@@ -117,7 +122,7 @@ inline void sendMidiNoteOff(uint8_t note) {
 
 // Stop all currently playing notes
 void stopAllNotes() {
-  for (int i = 0; i < 3; i++) {
+  for (int i = 0; i < CHORD_MAX_NOTES; i++) {
     if (activeNotes[i].active) {
       sendMidiNoteOff(activeNotes[i].note);
       activeNotes[i].active = false;
@@ -127,32 +132,18 @@ void stopAllNotes() {
 
 // Generate and play a chord based on the current note, scale, and numeral
 void playChord(int numeralIndex) {
-  // Calculate the actual notes based on scale intervals
-  const int* intervals = scales[currentScaleIndex - 19].intervals;
-  
-  // Diatonic chord intervals (root, third, fifth)
-  const int chordIntervals[3] = {0, 2, 4};
+  // Semitones above the tonic for every chord note, from the PROGMEM tables
+  uint8_t offsets[CHORD_MAX_NOTES];
+  uint8_t noteCount = chordOffsets(currentScaleIndex - 19, numeralIndex, chordComplexity, chordInversion, offsets);
   
   // Base MIDI note (C4 = 60) with octave shift applied
   int baseNote = 60 + (currentTonicIndex) + (octaveShift * 12); 
   
   // Calculate and prepare chord notes (without playing them yet)
-  uint8_t midiNotes[3];
+  uint8_t midiNotes[CHORD_MAX_NOTES];
   
-  for (int i = 0; i < 3; i++) {
-    // Find the scale degree
-    int scaleDegree = (numeralIndex + chordIntervals[i]) % 7;
-    
-    // Get the interval from the scale
-    int interval = intervals[scaleDegree];
-    
-    // Calculate actual MIDI note
-    int midiNote = baseNote + interval;
-    
-    // Ensure proper octave (if needed)
-    if (i > 0 && midiNote <= midiNotes[i-1]) {
-      midiNote += 12;
-    }
+  for (int i = 0; i < noteCount; i++) {
+    int midiNote = baseNote + offsets[i];
     
     // Check MIDI note is in valid range (0-127)
     if (midiNote < 0) midiNote = 0;
@@ -166,11 +157,11 @@ void playChord(int numeralIndex) {
   }
   
   // Now play the notes with strum effect if enabled
-  for (int i = 0; i < 3; i++) {
+  for (int i = 0; i < noteCount; i++) {
     sendMidiNoteOn(midiNotes[i]);
     
     // Add delay between notes for strum effect (if potentiometer is turned up)
-    if (i < 2 && strumDelay > 0) {
+    if (i < noteCount - 1 && strumDelay > 0) {
       delay(strumDelay);
     }
   }
@@ -188,7 +179,7 @@ void playChord(int numeralIndex) {
   Serial.print("ms): ");
   
   // Get note names for the chord
-  for (int i = 0; i < 3; i++) {
+  for (int i = 0; i < noteCount; i++) {
     int noteIndex = (activeNotes[i].note - 60) % 12;
     if (noteIndex < 0) noteIndex += 12;
     Serial.print(chromaticScale[noteIndex]);
@@ -0,0 +1,353 @@
+// Generated by Code/gen_firmware_tables.py from Code/chord_generator.py. Do not edit.
+//
+// chordOffsets(scale, numeral, complexity, inversion, offsets) fills offsets[]
+// with the chord's semitones above the tonic, stacked upwards, and returns
+// the note count. Add them to the base note (60 + tonic + 12 * octaveShift).
+//
+// Scales: 0 Major, 1 Minor, 2 Dorian, 3 Phrygian, 4 Lydian, 5 Mixolydian, 6 Locrian, 7 Harmonic Minor
+// Complexity index i is chord_generator complexity level 1 + i
+// (0 is the plain triad). Inversions past the note count wrap around.
+//
+// Flash used: 4135 bytes (CHORD_NIBBLES 3545, CHORD_GROUP_INDEX 560, CHORD_COMPLEXITY_NOTES 10, CHORD_COMPLEXITY_START 20)
+#pragma once
+
+#include <Arduino.h>
+
+#define CHORD_SCALE_COUNT 8
+#define CHORD_NUMERAL_COUNT 7
+#define CHORD_COMPLEXITY_COUNT 10
+#define CHORD_MAX_NOTES 6
+
+// Notes per chord, by complexity index
+const uint8_t CHORD_COMPLEXITY_NOTES[CHORD_COMPLEXITY_COUNT] PROGMEM = {
+  3, 4, 4, 4, 3, 4, 5, 5, 5, 6,
+};
+
+// Nibble offset of each complexity's first group in CHORD_NIBBLES
+const uint16_t CHORD_COMPLEXITY_START[CHORD_COMPLEXITY_COUNT] PROGMEM = {
+  0, 234, 778, 1322, 1866, 2109, 2653, 3503, 4553, 5578,
+};
+
+// Group of voicings used by each [scale][numeral][complexity]
+const uint8_t CHORD_GROUP_INDEX[CHORD_SCALE_COUNT][CHORD_NUMERAL_COUNT][CHORD_COMPLEXITY_COUNT] PROGMEM = {
+  { // Major
+    { 0,  0,  0,  0,  0,  0,  0,  0,  0,  0}, // I
+    { 1,  1,  1,  1,  1,  1,  1,  1,  1,  1}, // II
+    { 2,  2,  2,  2,  2,  2,  2,  2,  2,  2}, // III
+    { 3,  3,  3,  3,  3,  3,  3,  3,  3,  3}, // IV
+    { 4,  4,  4,  4,  4,  4,  4,  4,  4,  4}, // V
+    { 5,  5,  5,  5,  5,  5,  5,  5,  5,  5}, // VI
+    { 6,  6,  6,  6,  6,  6,  6,  6,  6,  6}, // VII
+  },
+  { // Minor
+    { 7,  7,  7,  7,  0,  7,  7,  7,  7,  7}, // I
+    { 8,  8,  8,  8,  7,  8,  8,  8,  8,  8}, // II
+    { 9,  9,  9,  9,  8,  9,  9,  9,  9,  9}, // III
+    {10, 10, 10, 10,  9, 10, 10, 10, 10, 10}, // IV
+    {11, 11, 11,  4,  4, 11, 11, 11, 11, 11}, // V
+    {12, 12, 12, 11, 10, 12, 12, 12, 12, 12}, // VI
+    {13, 13, 13, 12, 11, 13, 13, 13, 13, 13}, // VII
+  },
+  { // Dorian
+    { 7, 14,  7,  7,  0, 14,  7, 14,  7, 14}, // I
+    { 1, 15,  1,  1,  1,  8,  1, 15,  1, 15}, // II
+    { 9,  9,  9, 13, 12,  9,  9,  9, 14,  9}, // III
+    { 3,  3, 14, 10,  9, 15, 14, 16, 15, 16}, // IV
+    {11, 11, 11,  4,  4, 11, 11, 11, 11, 11}, // V
+    {14, 16, 15, 14, 13,  5, 15, 17, 16, 17}, // VI
+    {13, 13, 16, 15, 11, 16, 16, 18, 17, 18}, // VII
+  },
+  { // Phrygian
+    { 7,  7,  7,  7,  0,  7,  7,  7,  7,  7}, // I
+    {15, 17, 17, 16, 14, 17, 17, 19, 18, 19}, // II
+    { 9,  9, 18, 17,  8, 18, 18, 20, 19, 20}, // III
+    {10, 18, 10, 10,  9, 19, 10, 21, 10, 21}, // IV
+    {16, 19, 19, 18, 15, 11, 19, 22, 20, 22}, // V
+    {12, 12, 12, 19, 16, 12, 12, 12, 21, 12}, // VI
+    {17, 20, 20, 12, 11, 20, 20, 23, 22, 23}, // VII
+  },
+  { // Lydian
+    { 0,  0,  0, 20, 17,  0,  0,  0, 23,  0}, // I
+    {18, 21, 21,  1,  1, 21, 21, 24, 24, 24}, // II
+    { 2,  2,  2,  2,  2,  2,  2,  2,  2,  2}, // III
+    {19, 22, 22, 21, 18, 22, 22, 25, 25, 25}, // IV
+    { 4,  4, 23, 22,  4, 23, 23, 26, 26, 26}, // V
+    { 5, 23,  5,  5,  5, 24,  5, 27,  5, 27}, // VI
+    {20, 24, 24, 23, 19,  6, 24, 28, 27, 28}, // VII
+  },
+  { // Mixolydian
+    { 0,  0, 25,  7,  0, 25, 25, 29, 28, 29}, // I
+    { 1, 15,  1,  1,  1,  8,  1, 15,  1, 15}, // II
+    {21, 25, 26, 24, 20,  2, 26, 30, 29, 30}, // III
+    { 3,  3,  3, 25,  9,  3,  3,  3, 30,  3}, // IV
+    {11, 26, 11,  4,  4, 26, 11, 31, 11, 31}, // V
+    { 5,  5,  5,  5,  5,  5,  5,  5,  5,  5}, // VI
+    {13, 13, 16, 26, 21, 16, 16, 18, 31, 18}, // VII
+  },
+  { // Locrian
+    {22, 27, 27, 27, 22,  7, 27, 32, 32, 32}, // I
+    {15, 17, 17, 28, 23, 17, 17, 19, 33, 19}, // II
+    {23, 28, 28, 17,  8, 27, 28, 33, 34, 33}, // III
+    {10, 18, 10, 10,  9, 19, 10, 21, 10, 21}, // IV
+    {24, 29, 29, 29, 24, 28, 29, 34, 35, 34}, // V
+    {12, 12, 30, 30, 16, 29, 30, 35, 36, 35}, // VI
+    {17, 30, 20, 12, 11, 30, 20, 36, 22, 36}, // VII
+  },
+  { // Harmonic Minor
+    { 7,  7, 31,  0,  0, 31, 31, 37, 37, 37}, // I
+    { 8, 31,  8,  8,  7,  1,  8, 38,  8, 38}, // II
+    {25, 32, 32, 31, 25,  9, 32, 39, 38, 39}, // III
+    {10, 10, 10, 32,  3, 10, 10, 10, 39, 10}, // IV
+    { 4, 33,  4,  4,  4, 32,  4, 40,  4, 40}, // V
+    {12, 12, 12, 11, 10, 12, 12, 12, 12, 12}, // VI
+    { 6,  6, 33, 33, 26, 33, 33, 41, 40, 41}, // VII
+  },
+};
+
+// Voicings, two nibbles per byte (even nibble in the low half). A voicing is
+// the first note's offset from the tonic, then each next note's step above
+// the previous one minus 1; a group holds one voicing per inversion.
+const uint8_t CHORD_NIBBLES[3545] PROGMEM = {
+  0x30, 0x42, 0x42, 0x47, 0x23, 0x32, 0x35, 0x94, 0x24, 0x24, 0x73, 0x43, 0x4B, 0x52, 0x23, 0x29,
+  0x04, 0x34, 0x37, 0xB2, 0x42, 0x42, 0x93, 0x32, 0x30, 0x44, 0x24, 0x2B, 0x22, 0x52, 0x55, 0x02,
+  0x32, 0x33, 0x74, 0x24, 0x22, 0x52, 0x52, 0x58, 0x32, 0x23, 0x27, 0xA4, 0x34, 0x25, 0x83, 0x43,
+  0x40, 0x72, 0x32, 0x3A, 0x24, 0x24, 0x38, 0x02, 0x42, 0x43, 0xA3, 0x23, 0x22, 0x54, 0x34, 0x29,
+  0x02, 0x52, 0x53, 0x12, 0x23, 0x25, 0x84, 0x34, 0x27, 0xA2, 0x52, 0x51, 0xA2, 0x32, 0x31, 0x54,
+  0x24, 0x32, 0x62, 0x42, 0x49, 0x63, 0x22, 0x29, 0x05, 0x25, 0x2B, 0x23, 0x43, 0x46, 0x42, 0x22,
+  0x27, 0xA5, 0x25, 0x20, 0x32, 0x52, 0x56, 0x32, 0x32, 0x36, 0xA4, 0x24, 0x36, 0xA2, 0x42, 0x41,
+  0x33, 0x33, 0x37, 0xB3, 0x33, 0x30, 0x12, 0x24, 0x21, 0x17, 0x32, 0x29, 0x23, 0x22, 0x13, 0x35,
+  0x21, 0x19, 0x22, 0x2B, 0x32, 0x24, 0x03, 0x37, 0x30, 0x0B, 0x23, 0x30, 0x32, 0x35, 0x12, 0x29,
+  0x21, 0x10, 0x32, 0x22, 0x23, 0x37, 0x12, 0x2B, 0x21, 0x12, 0x32, 0x24, 0x23, 0x29, 0x03, 0x30,
+  0x30, 0x04, 0x23, 0x35, 0x32, 0x2B, 0x12, 0x22, 0x31, 0x15, 0x23, 0x37, 0x22, 0x20, 0x03, 0x33,
+  0x30, 0x07, 0x23, 0x38, 0x32, 0x22, 0x12, 0x25, 0x31, 0x18, 0x23, 0x3A, 0x22, 0x33, 0x12, 0x27,
+  0x21, 0x1A, 0x32, 0x20, 0x23, 0x25, 0x13, 0x38, 0x21, 0x10, 0x22, 0x22, 0x32, 0x27, 0x03, 0x3A,
+  0x30, 0x02, 0x23, 0x33, 0x32, 0x38, 0x12, 0x20, 0x21, 0x13, 0x32, 0x25, 0x23, 0x3A, 0x12, 0x22,
+  0x21, 0x15, 0x32, 0x27, 0x23, 0x20, 0x13, 0x33, 0x21, 0x17, 0x22, 0x29, 0x32, 0x22, 0x03, 0x35,
+  0x30, 0x09, 0x23, 0x3A, 0x32, 0x29, 0x12, 0x20, 0x31, 0x13, 0x23, 0x35, 0x22, 0x31, 0x12, 0x25,
+  0x21, 0x18, 0x32, 0x2A, 0x23, 0x25, 0x03, 0x38, 0x30, 0x00, 0x23, 0x31, 0x32, 0x27, 0x12, 0x2A,
+  0x31, 0x11, 0x23, 0x33, 0x22, 0x2A, 0x13, 0x31, 0x21, 0x15, 0x22, 0x27, 0x32, 0x32, 0x12, 0x26,
+  0x21, 0x19, 0x32, 0x2B, 0x23, 0x26, 0x12, 0x29, 0x31, 0x10, 0x23, 0x32, 0x22, 0x29, 0x13, 0x30,
+  0x21, 0x14, 0x22, 0x26, 0x32, 0x2B, 0x03, 0x32, 0x30, 0x06, 0x23, 0x37, 0x32, 0x24, 0x12, 0x27,
+  0x31, 0x1A, 0x23, 0x30, 0x22, 0x27, 0x13, 0x3A, 0x21, 0x12, 0x22, 0x24, 0x32, 0x20, 0x12, 0x23,
+  0x31, 0x16, 0x23, 0x38, 0x22, 0x23, 0x13, 0x36, 0x21, 0x1A, 0x22, 0x20, 0x32, 0x36, 0x12, 0x2A,
+  0x21, 0x11, 0x32, 0x23, 0x23, 0x2A, 0x03, 0x31, 0x30, 0x05, 0x23, 0x36, 0x32, 0x22, 0x22, 0x25,
+  0x22, 0x28, 0x22, 0x2B, 0x22, 0x33, 0x03, 0x37, 0x20, 0x0B, 0x32, 0x20, 0x33, 0x37, 0x02, 0x2B,
+  0x30, 0x02, 0x33, 0x33, 0x23, 0x30, 0x32, 0x24, 0x03, 0x37, 0x30, 0x0B, 0x23, 0x22, 0x23, 0x35,
+  0x12, 0x29, 0x21, 0x10, 0x32, 0x24, 0x23, 0x37, 0x12, 0x2B, 0x21, 0x12, 0x32, 0x35, 0x32, 0x29,
+  0x03, 0x30, 0x30, 0x04, 0x23, 0x37, 0x22, 0x2B, 0x12, 0x22, 0x31, 0x15, 0x23, 0x29, 0x23, 0x30,
+  0x12, 0x24, 0x21, 0x17, 0x32, 0x2B, 0x32, 0x22, 0x13, 0x35, 0x21, 0x19, 0x22, 0x20, 0x23, 0x33,
+  0x12, 0x27, 0x21, 0x1A, 0x32, 0x22, 0x32, 0x25, 0x13, 0x38, 0x21, 0x10, 0x22, 0x33, 0x32, 0x27,
+  0x03, 0x3A, 0x30, 0x02, 0x23, 0x25, 0x23, 0x38, 0x12, 0x20, 0x21, 0x13, 0x32, 0x27, 0x23, 0x3A,
+  0x12, 0x22, 0x21, 0x15, 0x32, 0x38, 0x32, 0x20, 0x03, 0x33, 0x30, 0x07, 0x23, 0x3A, 0x22, 0x22,
+  0x12, 0x25, 0x31, 0x18, 0x23, 0x35, 0x22, 0x29, 0x12, 0x20, 0x31, 0x13, 0x23, 0x29, 0x32, 0x20,
+  0x13, 0x33, 0x21, 0x17, 0x22, 0x3A, 0x32, 0x22, 0x03, 0x35, 0x30, 0x09, 0x23, 0x31, 0x32, 0x25,
+  0x03, 0x38, 0x30, 0x00, 0x23, 0x33, 0x22, 0x27, 0x12, 0x2A, 0x31, 0x11, 0x23, 0x27, 0x32, 0x2A,
+  0x13, 0x31, 0x21, 0x15, 0x22, 0x2A, 0x23, 0x31, 0x12, 0x25, 0x21, 0x18, 0x32, 0x32, 0x22, 0x26,
+  0x12, 0x29, 0x31, 0x10, 0x23, 0x26, 0x32, 0x29, 0x13, 0x30, 0x21, 0x14, 0x22, 0x37, 0x32, 0x2B,
+  0x03, 0x32, 0x30, 0x06, 0x23, 0x2B, 0x23, 0x32, 0x12, 0x26, 0x21, 0x19, 0x32, 0x30, 0x22, 0x24,
+  0x12, 0x27, 0x31, 0x1A, 0x23, 0x24, 0x32, 0x27, 0x13, 0x3A, 0x21, 0x12, 0x22, 0x20, 0x32, 0x23,
+  0x13, 0x36, 0x21, 0x1A, 0x22, 0x23, 0x23, 0x36, 0x12, 0x2A, 0x21, 0x11, 0x32, 0x36, 0x32, 0x2A,
+  0x03, 0x31, 0x30, 0x05, 0x23, 0x38, 0x22, 0x20, 0x12, 0x23, 0x31, 0x16, 0x23, 0x20, 0x33, 0x33,
+  0x03, 0x37, 0x20, 0x0B, 0x32, 0x33, 0x23, 0x37, 0x02, 0x2B, 0x30, 0x02, 0x33, 0x2B, 0x22, 0x22,
+  0x22, 0x25, 0x22, 0x28, 0x22, 0x40, 0x31, 0x15, 0x03, 0x37, 0x40, 0x0B, 0x14, 0x42, 0x21, 0x17,
+  0x12, 0x29, 0x41, 0x10, 0x14, 0x44, 0x21, 0x19, 0x12, 0x2B, 0x41, 0x12, 0x14, 0x55, 0x30, 0x0B,
+  0x03, 0x30, 0x50, 0x04, 0x05, 0x47, 0x21, 0x10, 0x12, 0x22, 0x41, 0x15, 0x14, 0x49, 0x21, 0x12,
+  0x12, 0x24, 0x41, 0x17, 0x14, 0x4B, 0x30, 0x04, 0x13, 0x35, 0x41, 0x19, 0x04, 0x40, 0x21, 0x15,
+  0x12, 0x27, 0x41, 0x1A, 0x14, 0x42, 0x30, 0x07, 0x13, 0x38, 0x41, 0x10, 0x04, 0x43, 0x31, 0x18,
+  0x03, 0x3A, 0x40, 0x02, 0x14, 0x45, 0x21, 0x1A, 0x12, 0x20, 0x41, 0x13, 0x14, 0x58, 0x30, 0x02,
+  0x03, 0x33, 0x50, 0x07, 0x05, 0x4A, 0x21, 0x13, 0x12, 0x25, 0x41, 0x18, 0x14, 0x53, 0x30, 0x09,
+  0x03, 0x3A, 0x50, 0x02, 0x05, 0x49, 0x30, 0x02, 0x13, 0x33, 0x41, 0x17, 0x04, 0x4A, 0x31, 0x13,
+  0x03, 0x35, 0x40, 0x09, 0x14, 0x51, 0x30, 0x07, 0x03, 0x38, 0x50, 0x00, 0x05, 0x43, 0x21, 0x18,
+  0x12, 0x2A, 0x41, 0x11, 0x14, 0x47, 0x30, 0x00, 0x13, 0x31, 0x41, 0x15, 0x04, 0x48, 0x31, 0x11,
+  0x03, 0x33, 0x40, 0x07, 0x14, 0x50, 0x30, 0x06, 0x03, 0x37, 0x50, 0x0B, 0x05, 0x46, 0x30, 0x0B,
+  0x13, 0x30, 0x41, 0x14, 0x04, 0x47, 0x31, 0x10, 0x03, 0x32, 0x40, 0x06, 0x14, 0x4B, 0x21, 0x14,
+  0x12, 0x26, 0x41, 0x19, 0x14, 0x44, 0x30, 0x09, 0x13, 0x3A, 0x41, 0x12, 0x04, 0x45, 0x31, 0x1A,
+  0x03, 0x30, 0x40, 0x04, 0x14, 0x5A, 0x30, 0x04, 0x03, 0x35, 0x50, 0x09, 0x05, 0x40, 0x30, 0x05,
+  0x13, 0x36, 0x41, 0x1A, 0x04, 0x41, 0x31, 0x16, 0x03, 0x38, 0x40, 0x00, 0x14, 0x56, 0x30, 0x00,
+  0x03, 0x31, 0x50, 0x05, 0x05, 0x48, 0x21, 0x11, 0x12, 0x23, 0x41, 0x16, 0x14, 0x43, 0x22, 0x28,
+  0x02, 0x2B, 0x40, 0x02, 0x24, 0x55, 0x20, 0x0B, 0x12, 0x20, 0x51, 0x13, 0x05, 0x3B, 0x21, 0x13,
+  0x22, 0x25, 0x32, 0x28, 0x13, 0x40, 0x51, 0x41, 0x47, 0x24, 0x14, 0x17, 0x94, 0x44, 0x44, 0x91,
+  0x41, 0x4B, 0x54, 0x05, 0x0B, 0x04, 0x54, 0x47, 0x01, 0x41, 0x42, 0x94, 0x14, 0x12, 0x44, 0x44,
+  0x4B, 0x40, 0x50, 0x55, 0x24, 0x04, 0x07, 0x85, 0x45, 0x43, 0x81, 0x41, 0x4A, 0x54, 0x14, 0x1A,
+  0x04, 0x44, 0x58, 0x20, 0x40, 0x43, 0xA5, 0x14, 0x13, 0x54, 0x44, 0x53, 0x90, 0x40, 0x4A, 0x95,
+  0x04, 0x02, 0x35, 0x45, 0x51, 0x70, 0x40, 0x48, 0x75, 0x04, 0x00, 0x15, 0x45, 0x48, 0x11, 0x41,
+  0x43, 0x04, 0x05, 0x06, 0x74, 0x54, 0x46, 0xB0, 0x50, 0x50, 0xB4, 0x14, 0x14, 0x64, 0x44, 0x44,
+  0x90, 0x50, 0x5A, 0xA4, 0x05, 0x04, 0x54, 0x54, 0x40, 0x50, 0x50, 0x56, 0x14, 0x14, 0x16, 0x84,
+  0x44, 0x56, 0x00, 0x40, 0x41, 0x35, 0x24, 0x28, 0xB3, 0x43, 0x3B, 0x31, 0x51, 0x55, 0x03, 0x43,
+  0x41, 0x14, 0x90, 0x01, 0xB3, 0x30, 0x24, 0x52, 0x50, 0x05, 0xB1, 0x10, 0x02, 0x21, 0x45, 0x42,
+  0x71, 0x14, 0x01, 0x11, 0x22, 0x21, 0x54, 0x43, 0x91, 0x14, 0x20, 0x01, 0x43, 0x30, 0x74, 0x43,
+  0xB0, 0x04, 0x41, 0x10, 0x53, 0x31, 0x94, 0x42, 0x01, 0x14, 0x51, 0x11, 0x72, 0x21, 0xB4, 0x42,
+  0x21, 0x14, 0x71, 0x11, 0x92, 0x21, 0x04, 0x42, 0x31, 0x14, 0x81, 0x11, 0xA2, 0x21, 0x24, 0x42,
+  0x51, 0x14, 0xA1, 0x11, 0x02, 0x21, 0x34, 0x43, 0x71, 0x14, 0x00, 0x01, 0x23, 0x30, 0x54, 0x52,
+  0x80, 0x05, 0x21, 0x10, 0x32, 0x21, 0x75, 0x42, 0xA1, 0x14, 0x31, 0x11, 0x52, 0x21, 0x84, 0x43,
+  0x01, 0x14, 0x50, 0x01, 0x73, 0x30, 0xA4, 0x43, 0x20, 0x04, 0x71, 0x10, 0x83, 0x31, 0x04, 0x52,
+  0x30, 0x05, 0x91, 0x10, 0xA2, 0x21, 0x55, 0x43, 0x90, 0x04, 0x21, 0x10, 0x33, 0x31, 0xA4, 0x43,
+  0x21, 0x14, 0x70, 0x01, 0x93, 0x30, 0x14, 0x43, 0x51, 0x14, 0xA0, 0x01, 0x03, 0x30, 0x34, 0x43,
+  0x70, 0x04, 0x01, 0x10, 0x13, 0x31, 0x54, 0x42, 0x81, 0x14, 0x11, 0x11, 0x32, 0x21, 0xA4, 0x52,
+  0x10, 0x05, 0x71, 0x10, 0x82, 0x21, 0x25, 0x43, 0x60, 0x04, 0xB1, 0x10, 0x03, 0x31, 0x64, 0x42,
+  0x91, 0x14, 0x21, 0x11, 0x42, 0x21, 0x74, 0x43, 0xB1, 0x14, 0x40, 0x01, 0x63, 0x30, 0x94, 0x52,
+  0x00, 0x05, 0x61, 0x10, 0x72, 0x21, 0x05, 0x43, 0x40, 0x04, 0x91, 0x10, 0xA3, 0x31, 0x74, 0x52,
+  0xA0, 0x05, 0x41, 0x10, 0x52, 0x21, 0x35, 0x52, 0x60, 0x05, 0x01, 0x10, 0x12, 0x21, 0x65, 0x43,
+  0xA1, 0x14, 0x30, 0x01, 0x53, 0x30, 0x84, 0x43, 0x00, 0x04, 0x51, 0x10, 0x63, 0x31, 0xA4, 0x42,
+  0x11, 0x14, 0x61, 0x11, 0x82, 0x21, 0x04, 0x42, 0x32, 0x24, 0x80, 0x02, 0xB2, 0x20, 0x74, 0x33,
+  0xB1, 0x13, 0x31, 0x11, 0x53, 0x31, 0xB3, 0x42, 0x20, 0x04, 0x72, 0x20, 0x82, 0x22, 0x04, 0x23,
+  0x43, 0x24, 0x43, 0x77, 0x43, 0x37, 0x4B, 0x37, 0x42, 0x37, 0x32, 0x22, 0x23, 0x54, 0x23, 0x84,
+  0x29, 0x84, 0x02, 0x84, 0x32, 0x85, 0x32, 0x42, 0x32, 0x42, 0x37, 0x42, 0xB8, 0x42, 0x28, 0x42,
+  0x28, 0x73, 0x28, 0x23, 0x35, 0x32, 0x94, 0x32, 0x74, 0x30, 0x74, 0x43, 0x74, 0x23, 0x79, 0x23,
+  0x73, 0x23, 0x52, 0x2B, 0x52, 0x27, 0x52, 0x37, 0x55, 0x37, 0xB2, 0x37, 0x22, 0x29, 0x23, 0x04,
+  0x23, 0x84, 0x24, 0x84, 0x72, 0x84, 0x32, 0x80, 0x32, 0xB2, 0x22, 0x43, 0x22, 0x43, 0x58, 0x43,
+  0x28, 0x49, 0x28, 0x22, 0x28, 0x32, 0x20, 0x23, 0x34, 0x23, 0x84, 0x27, 0x84, 0xA2, 0x84, 0x32,
+  0x83, 0x32, 0x22, 0x22, 0x43, 0x25, 0x43, 0x88, 0x43, 0x28, 0x40, 0x28, 0x52, 0x28, 0x32, 0x33,
+  0x32, 0x74, 0x32, 0x74, 0x3A, 0x74, 0x23, 0x74, 0x23, 0x77, 0x23, 0x53, 0x32, 0x42, 0x38, 0x42,
+  0x08, 0x42, 0x28, 0x43, 0x28, 0x83, 0x28, 0x23, 0x27, 0x23, 0xA4, 0x23, 0x84, 0x22, 0x84, 0x52,
+  0x84, 0x32, 0x8A, 0x32, 0x82, 0x23, 0x43, 0x20, 0x43, 0x37, 0x43, 0x37, 0x47, 0x37, 0x02, 0x37,
+  0x32, 0x3A, 0x22, 0x25, 0x22, 0x75, 0x25, 0x75, 0x83, 0x75, 0x23, 0x72, 0x23, 0x52, 0x23, 0x52,
+  0x29, 0x52, 0x07, 0x52, 0x37, 0x53, 0x37, 0x92, 0x37, 0x22, 0x29, 0x32, 0x04, 0x32, 0x84, 0x33,
+  0x84, 0x72, 0x84, 0x22, 0x80, 0x22, 0xA3, 0x23, 0x43, 0x22, 0x43, 0x57, 0x43, 0x37, 0x49, 0x37,
+  0x22, 0x37, 0x32, 0x31, 0x32, 0x54, 0x32, 0x74, 0x38, 0x74, 0x03, 0x74, 0x23, 0x75, 0x23, 0x33,
+  0x23, 0x52, 0x27, 0x52, 0xA7, 0x52, 0x37, 0x51, 0x37, 0x72, 0x37, 0x22, 0x27, 0x32, 0xA4, 0x32,
+  0x84, 0x31, 0x84, 0x52, 0x84, 0x22, 0x8A, 0x22, 0xA3, 0x32, 0x42, 0x31, 0x42, 0x58, 0x42, 0x28,
+  0x48, 0x28, 0x13, 0x28, 0x23, 0x32, 0x22, 0x65, 0x22, 0x75, 0x29, 0x75, 0x03, 0x75, 0x23, 0x76,
+  0x23, 0x62, 0x22, 0x43, 0x29, 0x43, 0x08, 0x43, 0x28, 0x44, 0x28, 0x92, 0x28, 0x32, 0x37, 0x32,
+  0xB4, 0x32, 0x74, 0x32, 0x74, 0x63, 0x74, 0x23, 0x7B, 0x23, 0xB3, 0x32, 0x42, 0x32, 0x42, 0x68,
+  0x42, 0x28, 0x49, 0x28, 0x23, 0x28, 0x23, 0x30, 0x22, 0x45, 0x22, 0x75, 0x27, 0x75, 0xA3, 0x75,
+  0x23, 0x74, 0x23, 0x42, 0x22, 0x43, 0x27, 0x43, 0xA8, 0x43, 0x28, 0x42, 0x28, 0x72, 0x28, 0x32,
+  0x20, 0x32, 0x34, 0x32, 0x84, 0x36, 0x84, 0xA2, 0x84, 0x22, 0x83, 0x22, 0x33, 0x32, 0x42, 0x36,
+  0x42, 0xA8, 0x42, 0x28, 0x41, 0x28, 0x63, 0x28, 0x23, 0x36, 0x32, 0xA4, 0x32, 0x74, 0x31, 0x74,
+  0x53, 0x74, 0x23, 0x7A, 0x23, 0x83, 0x23, 0x52, 0x20, 0x52, 0x37, 0x52, 0x37, 0x56, 0x37, 0x02,
+  0x37, 0x22, 0x20, 0x33, 0x33, 0x33, 0x83, 0x37, 0x83, 0xB2, 0x83, 0x32, 0x83, 0x32, 0x33, 0x33,
+  0x42, 0x37, 0x42, 0xB7, 0x42, 0x37, 0x42, 0x37, 0x73, 0x37, 0x23, 0x2B, 0x22, 0x25, 0x22, 0x85,
+  0x25, 0x85, 0x82, 0x85, 0x22, 0x82, 0x22, 0x02, 0x23, 0x93, 0x24, 0x93, 0x72, 0x93, 0x32, 0x9B,
+  0x32, 0x92, 0x32, 0x32, 0x22, 0x23, 0x5A, 0x23, 0x2A, 0x29, 0x2A, 0x02, 0x2A, 0x32, 0x2B, 0x32,
+  0x42, 0x32, 0x92, 0x37, 0x92, 0xB3, 0x92, 0x23, 0x92, 0x23, 0x03, 0x23, 0x23, 0x35, 0x32, 0x99,
+  0x32, 0x29, 0x30, 0x29, 0x43, 0x29, 0x23, 0x22, 0x23, 0x73, 0x23, 0xA2, 0x2B, 0xA2, 0x22, 0xA2,
+  0x32, 0xA5, 0x32, 0x42, 0x32, 0x22, 0x29, 0x23, 0x09, 0x23, 0x39, 0x24, 0x39, 0x72, 0x39, 0x32,
+  0x35, 0x32, 0xB2, 0x22, 0x93, 0x22, 0x93, 0x53, 0x93, 0x23, 0x99, 0x23, 0x72, 0x23, 0x32, 0x20,
+  0x23, 0x39, 0x23, 0x39, 0x27, 0x39, 0xA2, 0x39, 0x32, 0x38, 0x32, 0x22, 0x22, 0x93, 0x25, 0x93,
+  0x83, 0x93, 0x23, 0x90, 0x23, 0xA2, 0x23, 0x32, 0x33, 0x32, 0x79, 0x32, 0x29, 0x3A, 0x29, 0x23,
+  0x29, 0x23, 0x20, 0x23, 0x53, 0x32, 0xA2, 0x38, 0xA2, 0x02, 0xA2, 0x22, 0xA3, 0x22, 0x23, 0x22,
+  0x23, 0x27, 0x23, 0xA9, 0x23, 0x39, 0x22, 0x39, 0x52, 0x39, 0x32, 0x33, 0x32, 0x82, 0x23, 0x93,
+  0x20, 0x93, 0x32, 0x93, 0x32, 0x97, 0x32, 0x52, 0x32, 0x32, 0x3A, 0x22, 0x2A, 0x22, 0x2A, 0x25,
+  0x2A, 0x83, 0x2A, 0x23, 0x27, 0x23, 0x02, 0x32, 0xA2, 0x33, 0xA2, 0x72, 0xA2, 0x22, 0xAA, 0x22,
+  0x93, 0x22, 0x23, 0x22, 0x23, 0x59, 0x23, 0x39, 0x29, 0x39, 0x02, 0x39, 0x32, 0x3A, 0x32, 0x52,
+  0x23, 0xA2, 0x29, 0xA2, 0x02, 0xA2, 0x32, 0xA3, 0x32, 0x22, 0x32, 0x22, 0x29, 0x32, 0x09, 0x32,
+  0x39, 0x33, 0x39, 0x72, 0x39, 0x22, 0x35, 0x22, 0xA3, 0x23, 0x93, 0x22, 0x93, 0x52, 0x93, 0x32,
+  0x99, 0x32, 0x72, 0x32, 0x32, 0x31, 0x32, 0x59, 0x32, 0x29, 0x38, 0x29, 0x03, 0x29, 0x23, 0x2A,
+  0x23, 0x33, 0x23, 0xA2, 0x27, 0xA2, 0xA2, 0xA2, 0x32, 0xA1, 0x32, 0x02, 0x32, 0x22, 0x25, 0x23,
+  0x89, 0x23, 0x39, 0x20, 0x39, 0x32, 0x39, 0x32, 0x31, 0x32, 0x72, 0x22, 0x93, 0x2A, 0x93, 0x13,
+  0x93, 0x23, 0x95, 0x23, 0x32, 0x23, 0x32, 0x2A, 0x23, 0x1A, 0x23, 0x2A, 0x25, 0x2A, 0x82, 0x2A,
+  0x32, 0x27, 0x32, 0x22, 0x23, 0xA2, 0x26, 0xA2, 0x92, 0xA2, 0x32, 0xA0, 0x32, 0xB2, 0x32, 0x22,
+  0x26, 0x32, 0x99, 0x32, 0x39, 0x30, 0x39, 0x42, 0x39, 0x22, 0x32, 0x22, 0x73, 0x23, 0x93, 0x2B,
+  0x93, 0x22, 0x93, 0x32, 0x96, 0x32, 0x42, 0x32, 0x32, 0x29, 0x23, 0x0A, 0x23, 0x2A, 0x24, 0x2A,
+  0x72, 0x2A, 0x32, 0x26, 0x32, 0xB2, 0x32, 0x92, 0x32, 0x92, 0x63, 0x92, 0x23, 0x99, 0x23, 0x73,
+  0x23, 0x23, 0x30, 0x22, 0x4A, 0x22, 0x2A, 0x27, 0x2A, 0xA3, 0x2A, 0x23, 0x29, 0x23, 0x42, 0x22,
+  0x93, 0x27, 0x93, 0xA3, 0x93, 0x23, 0x92, 0x23, 0x02, 0x23, 0x32, 0x27, 0x23, 0xAA, 0x23, 0x2A,
+  0x22, 0x2A, 0x52, 0x2A, 0x32, 0x24, 0x32, 0x02, 0x22, 0x93, 0x23, 0x93, 0x63, 0x93, 0x23, 0x9A,
+  0x23, 0x82, 0x23, 0x32, 0x23, 0x23, 0x6A, 0x23, 0x2A, 0x2A, 0x2A, 0x12, 0x2A, 0x32, 0x20, 0x32,
+  0x62, 0x23, 0x93, 0x2A, 0x93, 0x12, 0x93, 0x32, 0x95, 0x32, 0x32, 0x32, 0x32, 0x38, 0x22, 0x0A,
+  0x22, 0x2A, 0x23, 0x2A, 0x63, 0x2A, 0x23, 0x25, 0x23, 0xA2, 0x32, 0x92, 0x31, 0x92, 0x53, 0x92,
+  0x23, 0x98, 0x23, 0x63, 0x23, 0x23, 0x20, 0x33, 0x38, 0x33, 0x38, 0x37, 0x38, 0xB2, 0x38, 0x32,
+  0x38, 0x32, 0x23, 0x22, 0xA3, 0x25, 0xA3, 0x82, 0xA3, 0x22, 0xA0, 0x22, 0xB2, 0x22, 0x32, 0x33,
+  0x23, 0x79, 0x23, 0x29, 0x2B, 0x29, 0x23, 0x29, 0x33, 0x20, 0x33, 0x72, 0x23, 0x92, 0x2B, 0x92,
+  0x23, 0x92, 0x33, 0x95, 0x33, 0x32, 0x33, 0x22, 0x2B, 0x22, 0x2A, 0x22, 0x3A, 0x25, 0x3A, 0x82,
+  0x3A, 0x22, 0x37, 0x22, 0x02, 0x23, 0x53, 0x24, 0x53, 0x76, 0x53, 0x36, 0x5B, 0x36, 0x52, 0x36,
+  0x32, 0x22, 0x23, 0x56, 0x23, 0x66, 0x29, 0x66, 0x02, 0x66, 0x32, 0x67, 0x32, 0x42, 0x32, 0x62,
+  0x37, 0x62, 0xB6, 0x62, 0x26, 0x62, 0x26, 0x93, 0x26, 0x23, 0x35, 0x32, 0x96, 0x32, 0x56, 0x30,
+  0x56, 0x43, 0x56, 0x23, 0x5B, 0x23, 0x73, 0x23, 0x62, 0x2B, 0x62, 0x26, 0x62, 0x36, 0x65, 0x36,
+  0x02, 0x36, 0x22, 0x29, 0x23, 0x06, 0x23, 0x66, 0x24, 0x66, 0x72, 0x66, 0x32, 0x62, 0x32, 0xB2,
+  0x22, 0x63, 0x22, 0x63, 0x56, 0x63, 0x26, 0x69, 0x26, 0x42, 0x26, 0x32, 0x20, 0x23, 0x36, 0x23,
+  0x66, 0x27, 0x66, 0xA2, 0x66, 0x32, 0x65, 0x32, 0x22, 0x22, 0x63, 0x25, 0x63, 0x86, 0x63, 0x26,
+  0x60, 0x26, 0x72, 0x26, 0x32, 0x33, 0x32, 0x75, 0x32, 0x65, 0x3A, 0x65, 0x23, 0x65, 0x23, 0x68,
+  0x23, 0x53, 0x32, 0x62, 0x38, 0x62, 0x06, 0x62, 0x26, 0x63, 0x26, 0xA3, 0x26, 0x23, 0x27, 0x23,
+  0xA6, 0x23, 0x66, 0x22, 0x66, 0x52, 0x66, 0x32, 0x60, 0x32, 0x82, 0x23, 0x63, 0x20, 0x63, 0x35,
+  0x63, 0x35, 0x67, 0x35, 0x22, 0x35, 0x32, 0x3A, 0x22, 0x26, 0x22, 0x66, 0x25, 0x66, 0x83, 0x66,
+  0x23, 0x63, 0x23, 0x32, 0x23, 0x63, 0x27, 0x63, 0xA5, 0x63, 0x35, 0x62, 0x35, 0x92, 0x35, 0x32,
+  0x35, 0x22, 0x96, 0x22, 0x66, 0x20, 0x66, 0x33, 0x66, 0x23, 0x6A, 0x23, 0x92, 0x22, 0x63, 0x20,
+  0x63, 0x36, 0x63, 0x26, 0x67, 0x26, 0x22, 0x26, 0x32, 0x3A, 0x32, 0x25, 0x32, 0x65, 0x35, 0x65,
+  0x93, 0x65, 0x23, 0x63, 0x23, 0x13, 0x23, 0x63, 0x25, 0x63, 0x85, 0x63, 0x35, 0x60, 0x35, 0x72,
+  0x35, 0x32, 0x33, 0x22, 0x76, 0x22, 0x66, 0x2A, 0x66, 0x13, 0x66, 0x23, 0x68, 0x23, 0x72, 0x22,
+  0x63, 0x2A, 0x63, 0x16, 0x63, 0x26, 0x65, 0x26, 0x02, 0x26, 0x32, 0x38, 0x32, 0x05, 0x32, 0x65,
+  0x33, 0x65, 0x73, 0x65, 0x23, 0x61, 0x23, 0xA3, 0x32, 0x62, 0x31, 0x62, 0x56, 0x62, 0x26, 0x68,
+  0x26, 0x33, 0x26, 0x23, 0x30, 0x32, 0x46, 0x32, 0x56, 0x37, 0x56, 0xB3, 0x56, 0x23, 0x56, 0x23,
+  0x23, 0x23, 0x62, 0x26, 0x62, 0x96, 0x62, 0x36, 0x60, 0x36, 0x72, 0x36, 0x22, 0x26, 0x32, 0x96,
+  0x32, 0x66, 0x30, 0x66, 0x42, 0x66, 0x22, 0x6B, 0x22, 0x73, 0x23, 0x53, 0x2B, 0x53, 0x26, 0x53,
+  0x36, 0x56, 0x36, 0x02, 0x36, 0x32, 0x2B, 0x23, 0x26, 0x23, 0x66, 0x26, 0x66, 0x92, 0x66, 0x32,
+  0x64, 0x32, 0x02, 0x23, 0x62, 0x24, 0x62, 0x76, 0x62, 0x36, 0x6A, 0x36, 0x52, 0x36, 0x22, 0x24,
+  0x32, 0x76, 0x32, 0x66, 0x3A, 0x66, 0x22, 0x66, 0x22, 0x69, 0x22, 0x53, 0x23, 0x53, 0x29, 0x53,
+  0x06, 0x53, 0x36, 0x54, 0x36, 0xA2, 0x36, 0x32, 0x3A, 0x32, 0x26, 0x32, 0x56, 0x35, 0x56, 0x93,
+  0x56, 0x23, 0x54, 0x23, 0x03, 0x22, 0x63, 0x23, 0x63, 0x66, 0x63, 0x26, 0x6A, 0x26, 0x52, 0x26,
+  0x32, 0x31, 0x32, 0x55, 0x32, 0x65, 0x38, 0x65, 0x03, 0x65, 0x23, 0x66, 0x23, 0x33, 0x32, 0x62,
+  0x36, 0x62, 0xA6, 0x62, 0x26, 0x61, 0x26, 0x83, 0x26, 0x23, 0x36, 0x32, 0xA6, 0x32, 0x56, 0x31,
+  0x56, 0x53, 0x56, 0x23, 0x50, 0x23, 0x83, 0x23, 0x62, 0x20, 0x62, 0x36, 0x62, 0x36, 0x66, 0x36,
+  0x12, 0x36, 0x22, 0x20, 0x33, 0x35, 0x33, 0x65, 0x37, 0x65, 0xB2, 0x65, 0x32, 0x65, 0x32, 0x33,
+  0x33, 0x52, 0x37, 0x52, 0xB6, 0x52, 0x36, 0x52, 0x36, 0x83, 0x36, 0x23, 0x25, 0x23, 0x87, 0x23,
+  0x57, 0x20, 0x57, 0x32, 0x57, 0x32, 0x5B, 0x32, 0xB2, 0x22, 0x62, 0x22, 0x62, 0x57, 0x62, 0x27,
+  0x68, 0x27, 0x32, 0x27, 0x22, 0x30, 0x32, 0x99, 0x24, 0x93, 0x49, 0x37, 0x99, 0x34, 0x9B, 0x49,
+  0x23, 0x99, 0x34, 0x32, 0x47, 0x23, 0x93, 0x22, 0x23, 0x9A, 0x35, 0xA2, 0x49, 0x29, 0x9A, 0x24,
+  0xA0, 0x49, 0x32, 0x9B, 0x24, 0x23, 0x49, 0x32, 0xA2, 0x24, 0x23, 0xA9, 0x37, 0x92, 0x4A, 0x2B,
+  0xA9, 0x24, 0x92, 0x4A, 0x32, 0xA0, 0x24, 0x23, 0x4B, 0x32, 0x92, 0x35, 0x32, 0x99, 0x29, 0x93,
+  0x49, 0x30, 0x99, 0x34, 0x94, 0x49, 0x23, 0x92, 0x34, 0x32, 0x40, 0x23, 0x93, 0x37, 0x22, 0x9A,
+  0x2B, 0xA2, 0x49, 0x22, 0x9A, 0x34, 0xA5, 0x49, 0x23, 0x94, 0x34, 0x22, 0x42, 0x23, 0xA2, 0x29,
+  0x23, 0xA9, 0x30, 0x92, 0x4A, 0x24, 0xA9, 0x24, 0x97, 0x4A, 0x32, 0xA5, 0x24, 0x23, 0x44, 0x32,
+  0x92, 0x2B, 0x32, 0x99, 0x22, 0x93, 0x59, 0x35, 0x99, 0x25, 0x99, 0x59, 0x22, 0x97, 0x25, 0x32,
+  0x55, 0x22, 0x93, 0x20, 0x23, 0xA9, 0x33, 0x92, 0x4A, 0x27, 0xA9, 0x24, 0x9A, 0x4A, 0x32, 0xA8,
+  0x24, 0x23, 0x47, 0x32, 0x92, 0x22, 0x32, 0x99, 0x25, 0x93, 0x59, 0x38, 0x99, 0x25, 0x90, 0x59,
+  0x22, 0x9A, 0x25, 0x32, 0x58, 0x22, 0x93, 0x33, 0x32, 0x99, 0x27, 0x93, 0x49, 0x3A, 0x99, 0x34,
+  0x92, 0x49, 0x23, 0x90, 0x34, 0x32, 0x4A, 0x23, 0x93, 0x25, 0x23, 0x9A, 0x38, 0xA2, 0x49, 0x20,
+  0x9A, 0x24, 0xA3, 0x49, 0x32, 0x92, 0x24, 0x23, 0x40, 0x32, 0xA2, 0x27, 0x23, 0xA9, 0x3A, 0x92,
+  0x4A, 0x22, 0xA9, 0x24, 0x95, 0x4A, 0x32, 0xA3, 0x24, 0x23, 0x42, 0x32, 0x92, 0x38, 0x32, 0x99,
+  0x20, 0x93, 0x49, 0x33, 0x99, 0x34, 0x97, 0x49, 0x23, 0x95, 0x34, 0x32, 0x43, 0x23, 0x93, 0x3A,
+  0x22, 0x9A, 0x22, 0xA2, 0x49, 0x25, 0x9A, 0x34, 0xA8, 0x49, 0x23, 0x97, 0x34, 0x22, 0x45, 0x23,
+  0xA2, 0x20, 0x23, 0x9A, 0x33, 0xA2, 0x49, 0x27, 0x9A, 0x24, 0xAA, 0x49, 0x32, 0x99, 0x24, 0x23,
+  0x47, 0x32, 0xA2, 0x22, 0x23, 0xA9, 0x35, 0x92, 0x4A, 0x29, 0xA9, 0x24, 0x90, 0x4A, 0x32, 0xAA,
+  0x24, 0x23, 0x49, 0x32, 0x92, 0x35, 0x22, 0x9A, 0x29, 0xA2, 0x49, 0x20, 0x9A, 0x34, 0xA3, 0x49,
+  0x23, 0x92, 0x34, 0x22, 0x40, 0x23, 0xA2, 0x29, 0x32, 0x99, 0x20, 0x93, 0x59, 0x33, 0x99, 0x25,
+  0x97, 0x59, 0x22, 0x95, 0x25, 0x32, 0x53, 0x22, 0x93, 0x3A, 0x32, 0x99, 0x22, 0x93, 0x49, 0x35,
+  0x99, 0x34, 0x99, 0x49, 0x23, 0x97, 0x34, 0x32, 0x45, 0x23, 0x93, 0x31, 0x32, 0x99, 0x25, 0x93,
+  0x49, 0x38, 0x99, 0x34, 0x90, 0x49, 0x23, 0x9A, 0x34, 0x32, 0x48, 0x23, 0x93, 0x33, 0x22, 0x9A,
+  0x27, 0xA2, 0x49, 0x2A, 0x9A, 0x34, 0xA1, 0x49, 0x23, 0x90, 0x34, 0x22, 0x4A, 0x23, 0xA2, 0x25,
+  0x23, 0xA9, 0x38, 0x92, 0x4A, 0x20, 0xA9, 0x24, 0x93, 0x4A, 0x32, 0xA1, 0x24, 0x23, 0x40, 0x32,
+  0x92, 0x27, 0x32, 0x99, 0x2A, 0x93, 0x59, 0x31, 0x99, 0x25, 0x95, 0x59, 0x22, 0x93, 0x25, 0x32,
+  0x51, 0x22, 0x93, 0x2A, 0x23, 0x9A, 0x31, 0xA2, 0x49, 0x25, 0x9A, 0x24, 0xA8, 0x49, 0x32, 0x97,
+  0x24, 0x23, 0x45, 0x32, 0xA2, 0x32, 0x22, 0x9A, 0x26, 0xA2, 0x49, 0x29, 0x9A, 0x34, 0xA0, 0x49,
+  0x23, 0x9B, 0x34, 0x22, 0x49, 0x23, 0xA2, 0x26, 0x32, 0x99, 0x29, 0x93, 0x59, 0x30, 0x99, 0x25,
+  0x94, 0x59, 0x22, 0x92, 0x25, 0x32, 0x50, 0x22, 0x93, 0x37, 0x32, 0x99, 0x2B, 0x93, 0x49, 0x32,
+  0x99, 0x34, 0x96, 0x49, 0x23, 0x94, 0x34, 0x32, 0x42, 0x23, 0x93, 0x29, 0x23, 0x9A, 0x30, 0xA2,
+  0x49, 0x24, 0x9A, 0x24, 0xA7, 0x49, 0x32, 0x96, 0x24, 0x23, 0x44, 0x32, 0xA2, 0x2B, 0x23, 0xA9,
+  0x32, 0x92, 0x4A, 0x26, 0xA9, 0x24, 0x99, 0x4A, 0x32, 0xA7, 0x24, 0x23, 0x46, 0x32, 0x92, 0x30,
+  0x22, 0x9A, 0x24, 0xA2, 0x49, 0x27, 0x9A, 0x34, 0xAA, 0x49, 0x23, 0x99, 0x34, 0x22, 0x47, 0x23,
+  0xA2, 0x24, 0x32, 0x99, 0x27, 0x93, 0x59, 0x3A, 0x99, 0x25, 0x92, 0x59, 0x22, 0x90, 0x25, 0x32,
+  0x5A, 0x22, 0x93, 0x27, 0x23, 0x9A, 0x3A, 0xA2, 0x49, 0x22, 0x9A, 0x24, 0xA5, 0x49, 0x32, 0x94,
+  0x24, 0x23, 0x42, 0x32, 0xA2, 0x20, 0x32, 0x99, 0x23, 0x93, 0x59, 0x36, 0x99, 0x25, 0x9A, 0x59,
+  0x22, 0x98, 0x25, 0x32, 0x56, 0x22, 0x93, 0x23, 0x23, 0x9A, 0x36, 0xA2, 0x49, 0x2A, 0x9A, 0x24,
+  0xA1, 0x49, 0x32, 0x90, 0x24, 0x23, 0x4A, 0x32, 0xA2, 0x36, 0x32, 0x99, 0x2A, 0x93, 0x49, 0x31,
+  0x99, 0x34, 0x95, 0x49, 0x23, 0x93, 0x34, 0x32, 0x41, 0x23, 0x93, 0x38, 0x22, 0x9A, 0x20, 0xA2,
+  0x49, 0x23, 0x9A, 0x34, 0xA6, 0x49, 0x23, 0x95, 0x34, 0x22, 0x43, 0x23, 0xA2, 0x2A, 0x23, 0xA9,
+  0x31, 0x92, 0x4A, 0x25, 0xA9, 0x24, 0x98, 0x4A, 0x32, 0xA6, 0x24, 0x23, 0x45, 0x32, 0x92, 0x20,
+  0x33, 0xA8, 0x33, 0x83, 0x4A, 0x37, 0xA8, 0x24, 0x8B, 0x4A, 0x32, 0xA8, 0x24, 0x33, 0x47, 0x32,
+  0x83, 0x22, 0x32, 0x8A, 0x25, 0xA3, 0x58, 0x38, 0x8A, 0x25, 0xA0, 0x58, 0x22, 0x8B, 0x25, 0x32,
+  0x58, 0x22, 0xA3, 0x33, 0x23, 0xA9, 0x37, 0x92, 0x3A, 0x2B, 0xA9, 0x33, 0x92, 0x3A, 0x33, 0xA0,
+  0x33, 0x23, 0x3B, 0x33, 0x92, 0x37, 0x22, 0xA9, 0x2B, 0x92, 0x4A, 0x22, 0xA9, 0x34, 0x95, 0x4A,
+  0x23, 0xA3, 0x34, 0x22, 0x42, 0x23, 0x92, 0x2B, 0x22, 0x9A, 0x22, 0xA2, 0x59, 0x25, 0x9A, 0x25,
+  0xA8, 0x59, 0x22, 0x97, 0x25, 0x22, 0x55, 0x22, 0xA2,
+};
+
+static inline uint8_t chordNibble(uint16_t position) {
+  uint8_t packed = pgm_read_byte(&CHORD_NIBBLES[position >> 1]);
+  return (position & 1) ? (packed >> 4) : (packed & 0x0F);
+}
+
+static inline uint8_t chordOffsets(uint8_t scale, uint8_t numeral, uint8_t complexity, uint8_t inversion,
+                                   uint8_t offsets[CHORD_MAX_NOTES]) {
+  uint8_t count = pgm_read_byte(&CHORD_COMPLEXITY_NOTES[complexity]);
+  uint8_t group = pgm_read_byte(&CHORD_GROUP_INDEX[scale][numeral][complexity]);
+  uint16_t position = pgm_read_word(&CHORD_COMPLEXITY_START[complexity])
+                      + ((uint16_t)group * count + inversion % count) * count;
+  uint8_t offset = chordNibble(position);
+  offsets[0] = offset;
+  for (uint8_t i = 1; i < count; i++) {
+    offset += chordNibble(position + i) + 1;
+    offsets[i] = offset;
+  }
+  return count;
+}
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Compile a Standard MIDI File into a per-solenoid pulse schedule.
+
+Note-ons for the drum map in solenoid_driver.DRUMS (36/38/42/49) become
+pulses with a start time, a width that grows with velocity and the
+sketch's 160-255 PWM level. Two limits are then enforced per coil:
+  - re-trigger gap: a pulse that starts less than --min-gap ms after the
+    previous kept pulse ended is dropped
+  - duty cycle: the on-time of pulses starting in any --window ms may not
+    exceed --max-duty of it; a pulse that would exceed it is shortened,
+    or dropped if that leaves less than --min-width
+The tick-to-time conversion and both limits run on NumPy arrays. Only the
+pulses that actually break a limit go through a Python loop.
+
+Output is CSV ("time_ms,drum,pin,width_ms,pwm", sorted by time) or JSON
+grouped by drum.
+
+Example:
+    python pulse_compiler.py song.mid -o song_pulses.csv
+    python pulse_compiler.py song.mid -o song.json --max-duty 0.25 --min-gap 15
+    python pulse_compiler.py --bench 3600          # compile an hour of dense drums
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import struct
+import sys
+import time
+
+import numpy as np
+
+from solenoid_driver import DRUMS, PWM_MAX, PWM_MIN
+
+# Defaults for every coil
+MIN_WIDTH = 4.0  # ms, velocity 1
+MAX_WIDTH = 10.0  # ms, velocity 127 (the sketch's NOTE_DURATION)
+MIN_GAP = 10.0  # ms from the end of one pulse to the start of the next
+DUTY_WINDOW = 1000.0  # ms
+MAX_DUTY = 0.3  # Fraction of the window a coil may be on
+DEFAULT_TEMPO = 500000  # us per quarter note (120 bpm)
+
+
+# ===== SMF reader =====
+
+# A stretch of running-status events with two data bytes (note on/off, aftertouch, controller, pitch bend):
+# each is a delta of 0-3 bytes >= 0x80 and one < 0x80, then two data bytes < 0x80. An event with its own
+# status byte, or a meta/SysEx event, ends the stretch. The possessive form (Python 3.11+) skips the
+# backtracking bookkeeping, which is most of the match time on long stretches.
+try:
+    RUNNING_STATUS_RUN = re.compile(rb"(?:[\x80-\xff]{0,3}+[\x00-\x7f]{3})++")
+except re.error:
+    RUNNING_STATUS_RUN = re.compile(rb"(?:[\x80-\xff]{0,3}[\x00-\x7f]{3})+")
+
+
+def _read_vlq(data, pos):
+    value = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, pos
+
+
+def _read_run(data, start, stop, tick):
+    """
+    Decode a RUNNING_STATUS_RUN match with NumPy.
+
+    Returns (ticks, first data bytes, second data bytes) as arrays. Every
+    event has exactly three bytes < 0x80 (the delta's last byte and the two
+    data bytes), so the k-th such byte in the run has role k % 3.
+    """
+    run = np.frombuffer(data, np.uint8, stop - start, start)
+    low = np.flatnonzero(run < 0x80)
+    last_delta_byte = low[0::3]
+    second = low[2::3]
+    deltas = run[last_delta_byte].astype(np.int64)
+    # Delta bytes >= 0x80 sit between the previous event's last data byte and this event's last delta byte
+    prefix = last_delta_byte - np.concatenate(([0], second[:-1] + 1))
+    for k in range(1, int(prefix.max()) + 1):
+        longer = prefix >= k
+        deltas[longer] |= (run[last_delta_byte[longer] - k].astype(np.int64) & 0x7F) << (7 * k)
+    return tick + np.cumsum(deltas), run[low[1::3]], run[second]
+
+
+def read_smf(path):
+    """
+    Read the note-ons and tempo changes of a Standard MIDI File.
+
+    Returns (notes, tempos, division): notes is an int64 array of rows
+    (tick, channel, note, velocity) for note-ons with velocity > 0, tempos
+    is [(tick, us_per_quarter)] and division is the header's time division.
+    Stretches of running-status events are decoded with _read_run; the
+    rest is read one event at a time.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] != b"MThd":
+        raise ValueError(f"{path} is not a Standard MIDI File")
+    header_length = struct.unpack(">I", data[4:8])[0]
+    _, track_count, division = struct.unpack(">HHH", data[8:14])
+    pos = 8 + header_length
+    chunks = []  # Arrays of note rows, in file order
+    notes = []  # Rows read one event at a time since the last chunk
+    tempos = []
+    for _ in range(track_count):
+        while data[pos:pos + 4] != b"MTrk":  # Skip unknown chunks
+            if pos + 8 > len(data):
+                raise ValueError(f"{path}: missing track")
+            pos += 8 + struct.unpack(">I", data[pos + 4:pos + 8])[0]
+        end = pos + 8 + struct.unpack(">I", data[pos + 4:pos + 8])[0]
+        pos += 8
+        tick = 0
+        status = 0
+        kind = 0
+        while pos < end:
+            if kind and kind not in (0xC0, 0xD0):
+                run = RUNNING_STATUS_RUN.match(data, pos, end)
+                if run:
+                    ticks, keys, velocities = _read_run(data, pos, run.end(), tick)
+                    tick = int(ticks[-1])
+                    pos = run.end()
+                    if kind == 0x90:
+                        on = velocities > 0
+                        if notes:
+                            chunks.append(np.array(notes, dtype=np.int64))
+                            notes = []
+                        chunks.append(np.column_stack((ticks[on], np.full(np.count_nonzero(on), status & 0x0F),
+                                                       keys[on], velocities[on])))
+                    continue
+            delta, pos = _read_vlq(data, pos)
+            tick += delta
+            byte = data[pos]
+            if byte & 0x80:
+                pos += 1
+                if byte < 0xF0:
+                    status = byte  # Running status only applies to channel messages
+                    kind = status & 0xF0
+                elif byte == 0xFF:
+                    meta_type = data[pos]
+                    length, pos = _read_vlq(data, pos + 1)
+                    if meta_type == 0x51 and length == 3:
+                        tempos.append((tick, (data[pos] << 16) | (data[pos + 1] << 8) | data[pos + 2]))
+                    pos += length
+                    if meta_type == 0x2F:
+                        break
+                    continue
+                else:
+                    length, pos = _read_vlq(data, pos)  # SysEx
+                    pos += length
+                    continue
+            if kind in (0xC0, 0xD0):
+                pos += 1
+                continue
+            if kind == 0x90 and data[pos + 1]:
+                notes.append((tick, status & 0x0F, data[pos], data[pos + 1]))
+            pos += 2
+        pos = end
+    if notes:
+        chunks.append(np.array(notes, dtype=np.int64))
+    if not chunks:
+        return np.zeros((0, 4), dtype=np.int64), sorted(tempos), division
+    return np.concatenate(chunks).astype(np.int64, copy=False), sorted(tempos), division
+
+
+def ticks_to_ms(ticks, tempos, division):
+    """Convert an array of absolute ticks to milliseconds using the tempo map."""
+    ticks = np.asarray(ticks, dtype=np.int64)
+    if division & 0x8000:
+        # SMPTE: -frames per second in the high byte, ticks per frame in the low byte
+        fps = 256 - (division >> 8)
+        return ticks * 1000.0 / (fps * (division & 0xFF))
+    tempo_ticks = np.array([0] + [tick for tick, _ in tempos], dtype=np.int64)
+    tempo_values = np.array([DEFAULT_TEMPO] + [tempo for _, tempo in tempos], dtype=np.float64)
+    # Time at each tempo change, then each tick from its segment's start
+    segment_ms = np.diff(tempo_ticks) * tempo_values[:-1] / (1000.0 * division)
+    start_ms = np.concatenate(([0.0], np.cumsum(segment_ms)))
+    segment = np.searchsorted(tempo_ticks, ticks, side="right") - 1
+    return start_ms[segment] + (ticks - tempo_ticks[segment]) * tempo_values[segment] / (1000.0 * division)
+
+
+# ===== Pulse limits =====
+
+def velocity_widths(velocities, min_width=MIN_WIDTH, max_width=MAX_WIDTH):
+    """Pulse width in ms, linear in velocity 1-127."""
+    return min_width + (max_width - min_width) * (np.asarray(velocities) - 1) / 126.0
+
+
+def velocity_pwm(velocities):
+    """The sketch's Arduino map(velocity, 0, 127, 160, 255), for velocities > 0."""
+    return np.asarray(velocities) * (PWM_MAX - PWM_MIN) // 127 + PWM_MIN
+
+
+def enforce_gap(starts, widths, min_gap=MIN_GAP):
+    """
+    Which pulses to keep so each starts at least min_gap after every kept pulse ends.
+
+    starts must be sorted. A pulse clear of every earlier pulse (kept or not)
+    is always kept, so only the clashing ones are walked in order, as plain
+    floats, against the furthest reach of the clear pulses before them.
+    """
+    count = len(starts)
+    keep = np.ones(count, dtype=bool)
+    if count < 2:
+        return keep
+    reach = starts + widths + min_gap
+    clash = np.zeros(count, dtype=bool)
+    clash[1:] = starts[1:] < np.maximum.accumulate(reach)[:-1]
+    clashes = np.flatnonzero(clash)
+    clear_reach = np.maximum.accumulate(np.where(clash, -np.inf, reach))
+    kept_reach = -np.inf  # Furthest reach of the clashing pulses kept so far
+    dropped = []
+    for i, start, clear, own in zip(clashes.tolist(), starts[clashes].tolist(),
+                                    clear_reach[clashes - 1].tolist(), reach[clashes].tolist()):
+        if start < kept_reach or start < clear:
+            dropped.append(i)
+        else:
+            kept_reach = own
+    keep[dropped] = False
+    return keep
+
+
+def enforce_duty(starts, widths, window=DUTY_WINDOW, max_duty=MAX_DUTY, min_width=0.0):
+    """
+    Widths cut so pulses starting in any `window` ms add up to at most max_duty of it.
+
+    Rolling sums come from a cumulative sum; only pulses whose window is
+    over the limit are shortened, in order, against the widths already cut.
+    A pulse cut below min_width becomes 0 (dropped).
+    """
+    limit = window * max_duty
+    total = np.concatenate(([0.0], np.cumsum(widths)))
+    first = np.searchsorted(starts, starts - window, side="right")
+    over = np.flatnonzero(total[1:] - total[first] > limit + 1e-9)
+    if not len(over):
+        return widths
+    widths = widths.copy()
+    for i in over:
+        used = widths[first[i]:i].sum()
+        width = min(widths[i], limit - used)
+        widths[i] = width if width >= min_width else 0.0
+    return widths
+
+
+def compile_pulses(notes, tempos, division, drums=DRUMS, channel=None, min_width=MIN_WIDTH,
+                   max_width=MAX_WIDTH, min_gap=MIN_GAP, window=DUTY_WINDOW, max_duty=MAX_DUTY):
+    """
+    Turn read_smf() output into {pitch: {"start", "width", "pwm"}} arrays plus per-drum stats.
+    """
+    if channel is not None:
+        notes = notes[notes[:, 1] == channel]
+    times = ticks_to_ms(notes[:, 0], tempos, division)
+    schedule = {}
+    stats = {}
+    for pitch in drums:
+        mine = notes[:, 2] == pitch
+        order = np.argsort(times[mine], kind="stable")
+        starts = times[mine][order]
+        velocities = notes[mine, 3][order]
+        widths = velocity_widths(velocities, min_width, max_width)
+
+        keep = enforce_gap(starts, widths, min_gap)
+        starts, velocities, widths = starts[keep], velocities[keep], widths[keep]
+        limited = enforce_duty(starts, widths, window, max_duty, min_width)
+        usable = limited > 0
+        shortened = int(np.count_nonzero(usable & (limited < widths)))
+        schedule[pitch] = {"start": starts[usable], "width": limited[usable], "pwm": velocity_pwm(velocities[usable])}
+        stats[pitch] = {
+            "notes": int(np.count_nonzero(mine)),
+            "pulses": int(np.count_nonzero(usable)),
+            "dropped_gap": int(np.count_nonzero(~keep)),
+            "dropped_duty": int(np.count_nonzero(~usable)),
+            "shortened_duty": shortened,
+            "on_ms": float(limited[usable].sum()),
+        }
+    return schedule, stats
+
+
+# ===== Output =====
+
+def write_csv(path, schedule, drums=DRUMS):
+    pitches = np.concatenate([np.full(len(s["start"]), pitch) for pitch, s in schedule.items()])
+    starts = np.concatenate([s["start"] for s in schedule.values()])
+    widths = np.concatenate([s["width"] for s in schedule.values()])
+    pwms = np.concatenate([s["pwm"] for s in schedule.values()])
+    order = np.argsort(starts, kind="stable")
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["time_ms", "drum", "pin", "width_ms", "pwm"])
+        for i in order:
+            name, pin, _ = drums[int(pitches[i])]
+            writer.writerow([f"{starts[i]:.3f}", name, pin, f"{widths[i]:.3f}", int(pwms[i])])
+
+
+def write_json(path, schedule, stats, drums=DRUMS):
+    result = {}
+    for pitch, s in schedule.items():
+        name, pin, _ = drums[pitch]
+        result[name] = {
+            "note": pitch, "pin": pin, "stats": stats[pitch],
+            "pulses": [[round(float(t), 3), round(float(w), 3), int(p)]
+                       for t, w, p in zip(s["start"], s["width"], s["pwm"])],
+        }
+    with open(path, "w") as f:
+        json.dump(result, f, indent=1)
+
+
+def print_stats(stats, drums=DRUMS, length_ms=None):
+    print(f"{'drum':<8}{'notes':>8}{'pulses':>8}{'gap':>7}{'duty':>7}{'cut':>7}{'duty %':>8}")
+    for pitch, s in stats.items():
+        duty = f"{100 * s['on_ms'] / length_ms:.2f}" if length_ms else "-"
+        print(f"{drums[pitch][0]:<8}{s['notes']:>8}{s['pulses']:>8}{s['dropped_gap']:>7}"
+              f"{s['dropped_duty']:>7}{s['shortened_duty']:>7}{duty:>8}")
+
+
+def benchmark(seconds, path, rate=40, seed=0, **limits):
+    """Write `seconds` of dense random drums with tempo changes, then time reading and compiling it."""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Code"))
+    from midi_file import MidiFileWriter
+
+    rng = np.random.default_rng(seed)
+    ticks_per_beat = 480
+    bpm = 120
+    count = int(seconds * rate)
+    ticks = np.sort(rng.integers(0, int(seconds * bpm / 60 * ticks_per_beat), count))
+    pitches = rng.choice(list(DRUMS), count)
+    velocities = rng.integers(1, 128, count)
+    with MidiFileWriter(path, ticks_per_beat) as midi:
+        conductor = midi.new_track()
+        for minute in range(int(seconds // 60) + 1):
+            conductor.tempo(minute * bpm * ticks_per_beat, bpm + (minute % 3) * 20)
+        conductor.end()
+        track = midi.new_track()
+        events = [(int(t), 0, int(p), int(v)) for t, p, v in zip(ticks, pitches, velocities)]
+        events += [(int(t) + 30, 1, int(p), 0) for t, p, v in zip(ticks, pitches, velocities)]
+        for tick, order, pitch, velocity in sorted(events):
+            if velocity:
+                track.note_on(tick, 9, pitch, velocity)
+            else:
+                track.note_off(tick, 9, pitch)
+        track.end()
+
+    start = time.perf_counter()
+    notes, tempos, division = read_smf(path)
+    read_time = time.perf_counter() - start
+    start = time.perf_counter()
+    schedule, stats = compile_pulses(notes, tempos, division, **limits)
+    compile_time = time.perf_counter() - start
+    print(f"{len(notes)} note-ons ({os.path.getsize(path)} bytes): read {read_time:.3f} s, "
+          f"compiled {compile_time:.3f} s")
+    print_stats(stats, length_ms=float(ticks_to_ms([notes[-1, 0]], tempos, division)[0]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a MIDI file into solenoid pulses with per-coil limits.")
+    parser.add_argument("midi", nargs="?", help="Standard MIDI File")
+    parser.add_argument("-o", "--output", help="Write the schedule here (.csv, otherwise JSON)")
+    parser.add_argument("--channel", type=int, choices=range(16), metavar="0-15",
+                        help="Only use this MIDI channel, numbered as in the status byte (GM drums are 9; default all)")
+    parser.add_argument("--min-width", type=float, default=MIN_WIDTH, help="Pulse width at velocity 1, ms")
+    parser.add_argument("--max-width", type=float, default=MAX_WIDTH, help="Pulse width at velocity 127, ms")
+    parser.add_argument("--min-gap", type=float, default=MIN_GAP, help="Rest between pulses on one coil, ms")
+    parser.add_argument("--window", type=float, default=DUTY_WINDOW, help="Duty-cycle window, ms")
+    parser.add_argument("--max-duty", type=float, default=MAX_DUTY, help="Largest on fraction per window")
+    parser.add_argument("--bench", type=float, metavar="SECONDS", help="Compile a generated file this long and exit")
+    args = parser.parse_args()
+
+    limits = {"min_width": args.min_width, "max_width": args.max_width, "min_gap": args.min_gap,
+              "window": args.window, "max_duty": args.max_duty}
+    if args.bench:
+        benchmark(args.bench, args.output or "pulse_bench.mid", **limits)
+        return
+    if not args.midi:
+        parser.error("give a MIDI file or --bench")
+
+    notes, tempos, division = read_smf(args.midi)
+    schedule, stats = compile_pulses(notes, tempos, division, channel=args.channel, **limits)
+    length_ms = float(ticks_to_ms([notes[-1, 0]], tempos, division)[0]) if len(notes) else None
+    print_stats(stats, length_ms=length_ms)
+    if args.output:
+        if args.output.lower().endswith(".csv"):
+            write_csv(args.output, schedule)
+        else:
+            write_json(args.output, schedule, stats)
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
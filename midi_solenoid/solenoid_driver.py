@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Host-side reference of the solenoid driver in
+pwm_example_with_potentiometer_and_max_note_length.ino.
+
+Same state machine as the sketch:
+  - note-on velocity 1-127 maps to PWM 160-255 (Arduino map(), integer maths)
+  - the PWM value is scaled by the drum's pot, read as 0.5-1.0
+  - velocity 0 or note-off writes 0
+  - a note still on after NOTE_DURATION ms is forced off
+Unlike the sketch, notes without a drum do not get a timeout slot (the
+sketch stores one and later writes to pin -1).
+
+Two ways to find the timed-out notes:
+  ScanDriver  checks all 128 slots every loop, like checkNoteTimeouts()
+  HeapDriver  keeps a min-heap of deadlines, so a loop costs O(active notes)
+Re-triggering a drum that is already on pushes a new deadline; the old
+heap entry is skipped when it comes up.
+
+Example:
+    python solenoid_driver.py --bench                # dense random drums, both drivers
+    python solenoid_driver.py --bench --rate 2000 --seconds 60
+"""
+import argparse
+import heapq
+from abc import ABC, abstractmethod
+import random
+import time
+
+# MIDI note -> (name, PWM pin, pot pin), as in the sketch
+DRUMS = {
+    36: ("kick", 3, "A0"),
+    38: ("snare", 4, "A1"),
+    42: ("hihat", 6, "A2"),
+    49: ("crash", 9, "A3"),
+}
+NOTE_DURATION = 10  # ms
+PWM_MIN = 160
+PWM_MAX = 255
+
+
+def arduino_map(x, in_min, in_max, out_min, out_max):
+    """Arduino's map(): integer maths, truncating toward zero like C long division."""
+    numerator = (x - in_min) * (out_max - out_min)
+    quotient = abs(numerator) // abs(in_max - in_min)
+    if (numerator < 0) != (in_max - in_min < 0):
+        quotient = -quotient
+    return quotient + out_min
+
+
+def velocity_to_pwm(velocity):
+    """MIDI velocity 0-127 to PWM 160-255; 0 stays 0 (note off)."""
+    return arduino_map(velocity, 0, 127, PWM_MIN, PWM_MAX) if velocity > 0 else 0
+
+
+def pot_to_scale(reading):
+    """Pot reading 0-1023 to the 0.5-1.0 scale factor."""
+    return arduino_map(reading, 0, 1023, 50, 100) / 100.0
+
+
+def scaled_pwm(velocity, scale):
+    """PWM value written for a note: the mapped velocity times the pot scale, stored back in a byte."""
+    return int(velocity_to_pwm(velocity) * scale) & 0xFF
+
+
+class SolenoidDriver(ABC):
+    """
+    Driver state machine; subclasses supply the timeout bookkeeping.
+
+    Every analogWrite is passed to write(time_ms, pin, value) and appended to
+    self.writes when no write callback is given.
+    """
+
+    def __init__(self, drums=DRUMS, note_duration=NOTE_DURATION, write=None):
+        self.drums = drums
+        self.note_duration = note_duration
+        self.scales = {pitch: 1.0 for pitch in drums}
+        self.writes = []
+        self.write = write or (lambda t, pin, value: self.writes.append((t, pin, value)))
+        self.checked = 0  # Timeout slots examined, for comparing the two drivers
+
+    def set_pot(self, pitch, reading):
+        """Update a drum's scale from its pot reading (0-1023)."""
+        self.scales[pitch] = pot_to_scale(reading)
+
+    def note_on(self, pitch, velocity, now):
+        """Handle a note-on at time `now` (ms); velocity 0 is a note-off."""
+        if velocity == 0:
+            self.note_off(pitch, now)
+            return
+        drum = self.drums.get(pitch)
+        if drum is None:
+            return
+        self.write(now, drum[1], scaled_pwm(velocity, self.scales[pitch]))
+        self._start(pitch, now)
+
+    def note_off(self, pitch, now):
+        drum = self.drums.get(pitch)
+        if drum is None:
+            return
+        self.write(now, drum[1], 0)
+        self._stop(pitch)
+
+    def _release(self, pitch, now):
+        self.write(now, self.drums[pitch][1], 0)
+
+    @abstractmethod
+    def _start(self, pitch, now):
+        """Remember that `pitch` went on at `now`."""
+
+    @abstractmethod
+    def _stop(self, pitch):
+        """Forget `pitch`; it was turned off by a note-off."""
+
+    @abstractmethod
+    def check_timeouts(self, now):
+        """Force off every note that has been on for more than note_duration ms."""
+
+
+class ScanDriver(SolenoidDriver):
+    """checkNoteTimeouts() as in the sketch: look at all 128 slots every time."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.note_on_times = [None] * 128
+
+    def _start(self, pitch, now):
+        self.note_on_times[pitch] = now
+
+    def _stop(self, pitch):
+        self.note_on_times[pitch] = None
+
+    def check_timeouts(self, now):
+        times = self.note_on_times
+        self.checked += 128
+        for pitch in range(128):
+            on_time = times[pitch]
+            if on_time is not None and now - on_time > self.note_duration:
+                self._release(pitch, now)
+                times[pitch] = None
+
+
+class HeapDriver(SolenoidDriver):
+    """Deadlines in a min-heap; only due (or stale) entries are looked at."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.note_on_times = {}  # pitch -> on time of the live note
+        self.deadlines = []  # Heap of (on_time + note_duration, pitch, on_time)
+
+    def _start(self, pitch, now):
+        self.note_on_times[pitch] = now
+        heapq.heappush(self.deadlines, (now + self.note_duration, pitch, now))
+
+    def _stop(self, pitch):
+        self.note_on_times.pop(pitch, None)  # Its heap entry goes stale
+
+    def check_timeouts(self, now):
+        deadlines = self.deadlines
+        self.checked += 1
+        while deadlines and deadlines[0][0] < now:
+            _, pitch, on_time = heapq.heappop(deadlines)
+            self.checked += 1
+            if self.note_on_times.get(pitch) == on_time:
+                del self.note_on_times[pitch]
+                self._release(pitch, now)
+
+
+def dense_events(seconds, rate, seed=0, drums=DRUMS):
+    """Random drum hits, [(time_ms, pitch, velocity)] sorted by time; about 1 in 8 is a note-off."""
+    rng = random.Random(seed)
+    pitches = list(drums) + [40, 46]  # A couple of notes with no drum
+    events = []
+    for _ in range(int(seconds * rate)):
+        velocity = 0 if rng.random() < 0.125 else rng.randint(1, 127)
+        events.append((rng.uniform(0, seconds * 1000), rng.choice(pitches), velocity))
+    events.sort()
+    return events
+
+
+def replay(driver, events, seconds, loop_us=50):
+    """
+    Run the sketch's loop() every loop_us microseconds over `seconds`.
+
+    Each pass delivers the events that are due, then checks timeouts, with
+    millis() style integer times. Returns the seconds spent in check_timeouts.
+    """
+    loop_ms = loop_us / 1000
+    i = 0
+    timeout_time = 0.0
+    passes = int(seconds * 1000 / loop_ms)
+    clock = time.perf_counter
+    for n in range(passes):
+        t = n * loop_ms
+        now = int(t)
+        while i < len(events) and events[i][0] <= t:
+            _, pitch, velocity = events[i]
+            driver.note_on(pitch, velocity, now)
+            i += 1
+        start = clock()
+        driver.check_timeouts(now)
+        timeout_time += clock() - start
+    return timeout_time
+
+
+def benchmark(seconds, rate, loop_us, seed=0):
+    events = dense_events(seconds, rate, seed)
+    passes = int(seconds * 1000 / (loop_us / 1000))
+    print(f"{len(events)} events over {seconds} s, loop every {loop_us} us ({passes} passes)")
+    results = {}
+    for driver in (ScanDriver(), HeapDriver()):
+        for pitch, reading in zip(DRUMS, (1023, 700, 400, 0)):
+            driver.set_pot(pitch, reading)
+        elapsed = replay(driver, events, seconds, loop_us)
+        name = type(driver).__name__
+        results[name] = driver.writes
+        print(f"  {name:<11} {elapsed:.3f} s in check_timeouts ({elapsed / passes * 1e6:.2f} us/pass), "
+              f"{driver.checked / passes:.2f} slots checked/pass, {len(driver.writes)} writes")
+    same = results["ScanDriver"] == results["HeapDriver"]
+    print("  Outputs identical" if same else "  OUTPUTS DIFFER")
+    return same
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reference solenoid driver; benchmarks scan vs heap timeouts.")
+    parser.add_argument("--bench", action="store_true", help="Replay dense random drums through both drivers")
+    parser.add_argument("--seconds", type=float, default=10, help="Length of the replay")
+    parser.add_argument("--rate", type=float, default=500, help="MIDI events per second")
+    parser.add_argument("--loop-us", type=float, default=50, help="Time between loop() passes")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.bench:
+        if not benchmark(args.seconds, args.rate, args.loop_us, args.seed):
+            raise SystemExit(1)
+        return
+    driver = HeapDriver()
+    for velocity in (1, 64, 127):
+        print(f"Velocity {velocity:>3} -> PWM {velocity_to_pwm(velocity)}, "
+              f"with the pot at half {scaled_pwm(velocity, pot_to_scale(512))}")
+    driver.note_on(36, 100, 0)
+    for now in range(0, 15):
+        driver.check_timeouts(now)
+    print(f"Writes: {driver.writes}")
+
+
+if __name__ == "__main__":
+    main()
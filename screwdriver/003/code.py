@@ -3,6 +3,10 @@ import audiocore
 import audiopwmio
 import board
 import digitalio
+import keypad
+import supervisor
+from gestures import GestureRecognizer  # lib/gestures.py
+from sound_bank import SoundBank, load_raw_sample  # lib/sound_bank.py
 
 # GPIO Pin Definitions
 BUTTON_PIN = board.GP1
@@ -16,11 +20,36 @@ FLASHLIGHT_MODE = 2
 # Button Press Timings
 SHORT_PRESS_THRESHOLD = 0.3  # Time in seconds for a short press
 BUTTON_TIMEOUT = 0.3  # Maximum time between presses to count as consecutive
+HOLD_TIME = 1.0  # A press held this long is a hold (not mapped to anything yet)
+DEBOUNCE_INTERVAL = 0.005  # keypad scan/debounce interval in seconds
+# Longest the loop sleeps between checks for keypad events. CircuitPython cannot wait on the
+# event queue, so this is one scan interval: a press is handled within about two scans
+# (10 ms), never later than with the old 10 ms poll, and waking more often finds nothing new
+MAX_SLEEP = DEBOUNCE_INTERVAL
+
+# Gestures (see lib/gestures.py) that switch modes
+GESTURE_MODES = {
+    "double": FX_MODE,
+    "triple": FLASHLIGHT_MODE,
+}
+
+# Sounds, converted by tools/convert_wav.py (a missing .raw falls back to streaming the .wav)
+SOUNDS = {
+    "fx": "sonic.raw",
+}
+MODE_SOUNDS = {FX_MODE: "fx"}  # Played while the button is held in that mode
+GESTURE_SOUNDS = {}  # Played once when the gesture is recognized, e.g. {"triple": "click"}
+SOUND_FOLLOW = {}  # Sound to prefetch while another plays; learned from use when not given
+SOUND_BUDGET = 128 * 1024  # Bytes of RAM for loaded sounds
+WAV_FILE = "sonic.wav"  # Streamed baseline for BENCHMARK_FILES
+REPORT_LATENCY = True  # Print how long each sound takes to start
+BENCHMARK_FILES = ()  # e.g. ("sonic_22050_8.raw", "sonic_22050_16.raw") to compare formats at boot
+BENCHMARK_RUNS = 20
 
 def initialize_button():
-    button = digitalio.DigitalInOut(BUTTON_PIN)
-    button.switch_to_input(pull=digitalio.Pull.UP)
-    return button
+    # keypad scans and debounces the pin in the background and queues
+    # timestamped press/release events, so the loop never polls the pin
+    return keypad.Keys((BUTTON_PIN,), value_when_pressed=False, pull=True, interval=DEBOUNCE_INTERVAL)
 
 def initialize_led(pin):
     led = digitalio.DigitalInOut(pin)
@@ -30,94 +59,131 @@ def initialize_led(pin):
 def initialize_audio():
     return audiopwmio.PWMAudioOut(board.GP0)  # Replace with a valid PWM pin
 
+def play_sound(audio, bank, name, loop=True):
+    """Play a sound from the bank, reporting how long it took to start."""
+    start = time.monotonic_ns()
+    bank.play(audio, name, loop=loop)
+    if REPORT_LATENCY:
+        print(f"Trigger latency: {(time.monotonic_ns() - start) / 1000000:.2f} ms")
+
+def benchmark_formats(audio):
+    """Print RAM size and median audio.play() latency of each file in BENCHMARK_FILES, plus the WAV."""
+    print(f"{'file':<24}{'bytes':>8}{'play ms':>9}")
+    for path in BENCHMARK_FILES + (WAV_FILE,):
+        f = None
+        try:
+            if path == WAV_FILE:
+                f = open(path, "rb")
+                sample, size = audiocore.WaveFile(f), 0  # Streamed, only a small buffer in RAM
+            else:
+                sample, size = load_raw_sample(path)
+        except OSError:
+            print(f"{path:<24} missing")
+            continue
+        latencies = []
+        for _ in range(BENCHMARK_RUNS):
+            start = time.monotonic_ns()
+            audio.play(sample, loop=True)
+            latencies.append((time.monotonic_ns() - start) / 1000000)
+            audio.stop()
+        latencies.sort()
+        print(f"{path:<24}{size:>8}{latencies[len(latencies) // 2]:>9.2f}")
+        sample = None
+        if f:
+            f.close()
+
 def main():
+    keys = fx_led = flashlight_led = audio = None
     try:
         print("Starting multi-mode LED control script...")
 
         # Initialize components
-        button = initialize_button()
+        keys = initialize_button()
         fx_led = initialize_led(LED_PIN)
         flashlight_led = initialize_led(FLASHLIGHT_LED_PIN)
         audio = initialize_audio()
+        if BENCHMARK_FILES:
+            benchmark_formats(audio)
 
-        # Open the WAV file
-        with open("sonic.wav", "rb") as f:
-            wav = audiocore.WaveFile(f)
-
+        # Sounds load on first use; the boot mode's sound is prefetched while idle
+        bank = SoundBank(SOUNDS, SOUND_BUDGET, SOUND_FOLLOW)
+        try:
             # Initialize variables
             current_mode = FX_MODE  # Boot into FX Mode by default
             print("Booting into FX Mode by default")  # Optional: For debugging
-            button_press_count = 0
-            last_press_time = 0
-            previous_button_value = button.value
-            press_start_time = None  # Initialize press start time
+            gestures = []  # Gestures recognized since the last loop pass
+            recognizer = GestureRecognizer(lambda gesture, timestamp: gestures.append(gesture),
+                                           long_ms=int(SHORT_PRESS_THRESHOLD * 1000),
+                                           gap_ms=int(BUTTON_TIMEOUT * 1000),
+                                           hold_ms=int(HOLD_TIME * 1000))
+            event = keypad.Event()
 
             # Ensure FX Mode is properly initialized
             flashlight_led.value = False
             fx_led.value = False  # Turn off FX LED initially
             audio.stop()  # Ensure audio is off at startup
+            bank.prefetch(MODE_SOUNDS.get(current_mode))
 
             while True:
-                current_button_value = button.value
-
-                # Edge detection
-                if previous_button_value != current_button_value:
-                    if not current_button_value:  # Button pressed (logic low)
-                        press_start_time = time.monotonic()
-                    else:  # Button released
-                        if press_start_time is not None:
-                            press_duration = time.monotonic() - press_start_time
-                            if press_duration < SHORT_PRESS_THRESHOLD:
-                                button_press_count += 1
-                                last_press_time = time.monotonic()
-                            press_start_time = None  # Reset press start time
+                # Handle every queued button event, using its own timestamp
+                while keys.events.get_into(event):
+                    recognizer.edge(event.pressed, event.timestamp)
+                    if current_mode == FX_MODE:
+                        if event.pressed:
+                            fx_led.value = True
+                            if not audio.playing:
+                                play_sound(audio, bank, MODE_SOUNDS[FX_MODE])
+                        else:
+                            fx_led.value = False
+                            if audio.playing:
+                                audio.stop()
 
                 # Handle mode change
-                if button_press_count > 0 and (time.monotonic() - last_press_time > BUTTON_TIMEOUT):
-                    if button_press_count == 2:
+                now = supervisor.ticks_ms()
+                recognizer.poll(now)
+                for gesture in gestures:
+                    if gesture in GESTURE_SOUNDS:
+                        play_sound(audio, bank, GESTURE_SOUNDS[gesture], loop=False)
+                    new_mode = GESTURE_MODES.get(gesture)
+                    if new_mode == FX_MODE:
                         current_mode = FX_MODE
                         print("Entering FX Mode")
                         flashlight_led.value = False
                         fx_led.value = False  # Turn off FX LED initially
                         audio.stop()  # Ensure audio is off at mode entry
-                    elif button_press_count == 3:
+                        bank.prefetch(MODE_SOUNDS.get(FX_MODE))
+                    elif new_mode == FLASHLIGHT_MODE:
                         current_mode = FLASHLIGHT_MODE
                         print("Entering Flashlight Mode")
                         fx_led.value = False
                         audio.stop()
                         flashlight_led.value = True
-                    button_press_count = 0  # Reset count after mode change
-
-                # Handle FX_MODE operation
-                if current_mode == FX_MODE:
-                    if not button.value:  # Button is pressed
-                        fx_led.value = True
-                        if not audio.playing:
-                            audio.play(wav, loop=True)
-                    else:  # Button is released
-                        fx_led.value = False
-                        if audio.playing:
-                            audio.stop()
-                elif current_mode == FLASHLIGHT_MODE:
-                    flashlight_led.value = True  # Keep flashlight LED on
-                else:
-                    # Ensure everything is off in an undefined state
-                    fx_led.value = False
-                    flashlight_led.value = False
-                    if audio.playing:
-                        audio.stop()
+                gestures.clear()
+
+                # Load the next chunk of a prefetched sound
+                bank.step()
 
-                previous_button_value = current_button_value
-                time.sleep(0.01)  # Small delay to reduce CPU usage
+                # Sleep until the recognizer's next timer is due, checking for new events at least every MAX_SLEEP
+                sleep_time = MAX_SLEEP
+                wait = recognizer.time_to_deadline(now)
+                if wait is not None:
+                    sleep_time = min(sleep_time, wait / 1000)
+                time.sleep(sleep_time)
+        finally:
+            bank.deinit()
 
     except Exception as e:
         print(f"Error: {e}")
     finally:
         print("Deinitializing...")
+        if keys:
+            keys.deinit()
         if audio:
             audio.deinit()
-        fx_led.value = False
-        flashlight_led.value = False
+        if fx_led:
+            fx_led.value = False
+        if flashlight_led:
+            flashlight_led.value = False
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,40 @@
+"""Linux stand-in for CircuitPython's `audiocore` module (WaveFile and RawSample)."""
+import wave
+
+
+class WaveFile:
+    """Reads the WAV header; the samples themselves are never decoded."""
+
+    def __init__(self, file, buffer=None):
+        if isinstance(file, str):
+            file = open(file, "rb")
+        start = file.tell()
+        with wave.open(file, "rb") as w:
+            self.sample_rate = w.getframerate()
+            self.channel_count = w.getnchannels()
+            self.bits_per_sample = w.getsampwidth() * 8
+            self.frame_count = w.getnframes()
+        file.seek(start)
+
+    @property
+    def duration(self):
+        return self.frame_count / self.sample_rate
+
+    def deinit(self):
+        pass
+
+
+class RawSample:
+    def __init__(self, buffer, *, channel_count=1, sample_rate=8000, single_buffer=True):
+        self.buffer = buffer
+        self.channel_count = channel_count
+        self.sample_rate = sample_rate
+        self.bits_per_sample = getattr(buffer, "itemsize", 1) * 8
+        self.frame_count = len(buffer) // channel_count
+
+    @property
+    def duration(self):
+        return self.frame_count / self.sample_rate
+
+    def deinit(self):
+        pass
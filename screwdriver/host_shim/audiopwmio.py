@@ -0,0 +1,49 @@
+"""
+Linux stand-in for CircuitPython's `audiopwmio` module. Plays nothing,
+but keeps the state and logs (time, "play" | "stop" | "end", sample) to TIMELINE.
+"""
+import time
+
+TIMELINE = []
+
+
+class PWMAudioOut:
+    def __init__(self, left_channel, *, right_channel=None, quiescent_value=0x8000):
+        self.left_channel = left_channel
+        self.right_channel = right_channel
+        self.sample = None
+        self.loop = False
+        self.started = None
+        self.paused = False
+
+    @property
+    def playing(self):
+        if self.sample is None:
+            return False
+        if not self.loop and time.monotonic() - self.started >= self.sample.duration:
+            TIMELINE.append((self.started + self.sample.duration, "end", self.sample))
+            self.sample = None  # Finished on its own
+            return False
+        return True
+
+    def play(self, sample, *, loop=False):
+        self.sample = sample
+        self.loop = loop
+        self.started = time.monotonic()
+        self.paused = False
+        TIMELINE.append((self.started, "play", sample))
+
+    def stop(self):
+        if self.playing:
+            TIMELINE.append((time.monotonic(), "stop", self.sample))
+        self.sample = None
+        self.paused = False
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def deinit(self):
+        self.stop()
@@ -0,0 +1,63 @@
+"""
+Linux stand-in for CircuitPython's `board` module (Raspberry Pi Pico pins).
+
+Put this directory on sys.path to run the screwdriver code.py files on a
+PC. Each pin remembers every level change as (time, level), so inputs can
+be scripted ahead of time and outputs read back afterwards.
+"""
+import time
+
+
+class Pin:
+    """A GPIO pin with a level history."""
+
+    def __init__(self, name):
+        self.name = name
+        self.changes = [(float("-inf"), True)]  # Idle high, like a button with a pull-up
+
+    def __repr__(self):
+        return f"board.{self.name}"
+
+    def set_level(self, level, at=None):
+        """Change the level now, or at time `at` (time.monotonic seconds)."""
+        at = time.monotonic() if at is None else at
+        level = bool(level)
+        if at >= self.changes[-1][0]:
+            if level != self.changes[-1][1]:
+                self.changes.append((at, level))
+            return
+        # Scripted out of order: insert and drop the levels that no longer change anything
+        self.changes.append((at, level))
+        self.changes.sort(key=lambda change: change[0])
+        merged = [self.changes[0]]
+        for change in self.changes[1:]:
+            if change[1] != merged[-1][1]:
+                merged.append(change)
+        self.changes = merged
+
+    def level_at(self, t):
+        """Level of the pin at time t."""
+        level = self.changes[0][1]
+        for at, value in self.changes:
+            if at > t:
+                break
+            level = value
+        return level
+
+    @property
+    def level(self):
+        return self.level_at(time.monotonic())
+
+
+for _n in range(30):
+    globals()[f"GP{_n}"] = Pin(f"GP{_n}")
+LED = GP25
+A0, A1, A2 = GP26, GP27, GP28
+del _n
+
+
+def reset():
+    """Put every pin back to idle high with no history."""
+    for value in globals().values():
+        if isinstance(value, Pin):
+            value.changes = [(float("-inf"), True)]
@@ -0,0 +1,128 @@
+"""
+Linux stand-in for CircuitPython's `keypad` module (Keys only).
+
+The real module scans the pins every `interval` seconds in the background
+and reports a change once `debounce_threshold` scans in a row (default 1)
+have seen the new state. Here the scan happens
+when the event queue is read: every scan time since the last read is
+replayed against the pins' level histories, so events get the same
+debounce and timestamps they would have had on the board.
+"""
+import time
+from collections import deque
+
+import supervisor
+
+
+class Event:
+    def __init__(self, key_number=0, pressed=True, timestamp=None):
+        self.key_number = key_number
+        self.pressed = pressed
+        self.timestamp = supervisor.ticks_ms() if timestamp is None else timestamp
+
+    @property
+    def released(self):
+        return not self.pressed
+
+    def __eq__(self, other):
+        return (isinstance(other, Event) and self.key_number == other.key_number
+                and self.pressed == other.pressed)
+
+    def __hash__(self):
+        return hash((self.key_number, self.pressed))
+
+    def __repr__(self):
+        return f"<Event: key_number {self.key_number} {'pressed' if self.pressed else 'released'}>"
+
+
+class EventQueue:
+    def __init__(self, scanner, max_events):
+        self._scanner = scanner
+        self._events = deque()
+        self._max_events = max_events
+        self.overflowed = False
+
+    def _put(self, event):
+        if len(self._events) >= self._max_events:
+            self.overflowed = True
+            return
+        self._events.append(event)
+
+    def get(self):
+        self._scanner._scan()
+        return self._events.popleft() if self._events else None
+
+    def get_into(self, event):
+        self._scanner._scan()
+        if not self._events:
+            return False
+        queued = self._events.popleft()
+        event.key_number, event.pressed, event.timestamp = queued.key_number, queued.pressed, queued.timestamp
+        return True
+
+    def clear(self):
+        self._events.clear()
+        self.overflowed = False
+
+    def __len__(self):
+        self._scanner._scan()
+        return len(self._events)
+
+    def __bool__(self):
+        return len(self) > 0
+
+
+class Keys:
+    def __init__(self, pins, *, value_when_pressed, pull=True, interval=0.02, max_events=64,
+                 debounce_threshold=1):
+        self.pins = tuple(pins)
+        self.key_count = len(self.pins)
+        self.value_when_pressed = value_when_pressed
+        self.interval = interval
+        self.debounce_threshold = debounce_threshold
+        self.events = EventQueue(self, max_events)
+        self._last_scan = time.monotonic()
+        self._state = [self._pressed_at(i, self._last_scan) for i in range(self.key_count)]
+        self._counts = [0] * self.key_count  # Scans in a row that disagreed with _state
+
+    def _pressed_at(self, key_number, t):
+        return self.pins[key_number].level_at(t) == self.value_when_pressed
+
+    def _scan(self):
+        now = time.monotonic()
+        scans = int((now - self._last_scan) / self.interval)
+        if scans <= 0:
+            return
+        t = self._last_scan
+        for _ in range(scans):
+            t += self.interval
+            for i in range(self.key_count):
+                if self._pressed_at(i, t) == self._state[i]:
+                    self._counts[i] = 0
+                    continue
+                self._counts[i] += 1
+                if self._counts[i] >= self.debounce_threshold:
+                    self._state[i] = not self._state[i]
+                    self._counts[i] = 0
+                    self.events._put(Event(i, self._state[i], int(t * 1000) % supervisor.TICKS_PERIOD))
+            # Skip ahead over stretches where no pin changes
+            if not any(self._counts) and not self._changes_between(t, now):
+                break
+        self._last_scan = self._last_scan + scans * self.interval
+
+    def _changes_between(self, start, end):
+        return any(start < at <= end for pin in self.pins for at, _ in pin.changes)
+
+    def reset(self):
+        """Forget the key states; currently pressed keys are reported again."""
+        self._state = [False] * self.key_count
+        self._counts = [0] * self.key_count
+
+    def deinit(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.deinit()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Run screwdriver code.py revisions unchanged on a virtual clock.
+
+Each revision runs against the same button trace with a fresh set of
+shim modules, once per boot phase: the code starts at evenly spread
+offsets so loop periods do not line up with the trace's round numbers.
+The runner records the LED pins, audio play/stop and printed lines, and
+reports over all phases:
+  - press-to-LED and press-to-audio latency (presses with no response are counted apart)
+  - how long after the last release each "Entering ... Mode" line was printed
+
+A trace file has one edge per line, "TIME_MS down" or "TIME_MS up".
+
+Example:
+    python simulate.py                       # every revision, built-in trace
+    python simulate.py ../003/code.py --timeline
+    python simulate.py --max-latency-ms 20   # exit 1 if any press-to-LED latency is higher
+"""
+import argparse
+import glob
+import json
+import os
+import runpy
+import sys
+import time
+
+SHIM_DIR = os.path.dirname(os.path.abspath(__file__))
+SCREWDRIVER_DIR = os.path.dirname(SHIM_DIR)
+LIB_DIR = os.path.join(SCREWDRIVER_DIR, "lib")
+DEFAULT_DATA_DIR = os.path.join(SCREWDRIVER_DIR, "001")  # Where sonic.wav lives
+SHIM_MODULES = ("board", "digitalio", "keypad", "supervisor", "audiocore", "audiopwmio", "gestures")
+
+BUTTON_PIN = "GP1"
+LED_PINS = {"fx_led": "GP2", "flashlight_led": "GP3"}
+
+# (ms, pressed): double press, hold, triple press, double press, hold
+DEFAULT_TRACE = [
+    (500, True), (550, False), (650, True), (700, False),
+    (2000, True), (2500, False),
+    (3000, True), (3050, False), (3150, True), (3200, False), (3300, True), (3350, False),
+    (5000, True), (5050, False), (5150, True), (5200, False),
+    (7000, True), (7500, False),
+]
+
+sys.path[:0] = [SHIM_DIR, LIB_DIR]
+from vclock import SimulationDone, VirtualClock  # noqa: E402
+
+
+class StampedOutput:
+    """Stands in for sys.stdout and keeps each printed line with the virtual time."""
+
+    def __init__(self, clock, echo=False):
+        self.clock = clock
+        self.echo = echo
+        self.lines = []
+        self.partial = ""
+
+    def write(self, text):
+        self.partial += text
+        while "\n" in self.partial:
+            line, self.partial = self.partial.split("\n", 1)
+            self.lines.append((self.clock.now(), line))
+            if self.echo:
+                sys.__stdout__.write(f"{self.clock.now():10.4f}  {line}\n")
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def read_trace(path):
+    """Parse a trace file into [(ms, pressed)]."""
+    trace = []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#")[0].strip()
+            if line:
+                timestamp, edge = line.split()
+                trace.append((float(timestamp), edge.lower() in ("down", "press", "1")))
+    return trace
+
+
+def run_revision(code_path, trace, end, data_dir=DEFAULT_DATA_DIR, cpu_cost=10e-6, echo=False, start=0.0):
+    """
+    Run one code.py from `start` until `end` seconds of virtual time.
+
+    Returns {"lines", "pins", "audio", "sleeps", "wall_seconds"}; times are virtual seconds.
+    """
+    for name in SHIM_MODULES:
+        sys.modules.pop(name, None)  # Fresh pins and audio state for every run
+    clock = VirtualClock(start=start, end=end, cpu_cost=cpu_cost)
+    output = StampedOutput(clock, echo)
+    cwd, stdout = os.getcwd(), sys.stdout
+    start = time.perf_counter()
+    with clock:
+        import board
+        import audiopwmio
+        button = getattr(board, BUTTON_PIN)
+        for ms, pressed in trace:
+            button.set_level(not pressed, ms / 1000)  # Active low, like the real button
+        os.chdir(data_dir)
+        sys.stdout = output
+        try:
+            runpy.run_path(code_path, run_name="__main__")
+        except SimulationDone:
+            pass
+        finally:
+            sys.stdout = stdout
+            os.chdir(cwd)
+    return {
+        "lines": output.lines,
+        "pins": {name: [(t, level) for t, level in getattr(board, pin).changes if t > float("-inf")]
+                 for name, pin in LED_PINS.items()},
+        "audio": [(t, event) for t, event, _ in audiopwmio.TIMELINE],
+        "sleeps": clock.sleeps,
+        "wall_seconds": time.perf_counter() - start,
+    }
+
+
+def presses(trace):
+    """[(down_s, up_s)] from a trace."""
+    result = []
+    down = None
+    for ms, pressed in trace:
+        if pressed and down is None:
+            down = ms / 1000
+        elif not pressed and down is not None:
+            result.append((down, ms / 1000))
+            down = None
+    return result
+
+
+def response_latencies(press_list, times):
+    """Seconds from each press to the first response time before the next press (None if none)."""
+    latencies = []
+    for n, (down, _) in enumerate(press_list):
+        next_down = press_list[n + 1][0] if n + 1 < len(press_list) else float("inf")
+        latencies.append(next((t - down for t in times if down <= t < next_down), None))
+    return latencies
+
+
+def analyze(result, trace):
+    press_list = presses(trace)
+    led_on = sorted(t for name, changes in result["pins"].items() if name == "fx_led"
+                    for t, level in changes if level)
+    audio_play = [t for t, event in result["audio"] if event == "play"]
+    releases = [up for _, up in press_list]
+    modes = []
+    for t, line in result["lines"]:
+        if line.startswith("Entering"):
+            last_release = max((up for up in releases if up <= t), default=None)
+            modes.append((line, None if last_release is None else t - last_release))
+    return {
+        "led_ms": [None if v is None else v * 1000 for v in response_latencies(press_list, led_on)],
+        "audio_ms": [None if v is None else v * 1000 for v in response_latencies(press_list, audio_play)],
+        "mode_switches": [(line, None if delay is None else delay * 1000) for line, delay in modes],
+        "errors": [line for _, line in result["lines"] if line.startswith("Error")],
+    }
+
+
+def run_phases(code_path, trace, end, phases, phase_span, data_dir=DEFAULT_DATA_DIR, cpu_cost=10e-6, echo=False):
+    """
+    Run and analyze one code.py at `phases` start offsets spread over `phase_span` seconds.
+
+    Returns (pooled stats, result of the first run, total wall seconds).
+    """
+    pooled = {"led_ms": [], "audio_ms": [], "mode_switches": {}, "errors": []}
+    first = None
+    wall = 0.0
+    for n in range(phases):
+        result = run_revision(code_path, trace, end, data_dir, cpu_cost, echo, n * phase_span / phases)
+        first = first or result
+        wall += result["wall_seconds"]
+        stats = analyze(result, trace)
+        pooled["led_ms"] += stats["led_ms"]
+        pooled["audio_ms"] += stats["audio_ms"]
+        pooled["errors"] += stats["errors"]
+        # The n-th mode switch of each run is pooled with the n-th of the others
+        for i, (line, delay) in enumerate(stats["mode_switches"]):
+            pooled["mode_switches"].setdefault(f"{i + 1}. {line}", []).append(delay)
+    return pooled, first, wall
+
+
+def describe(latencies, unit="presses"):
+    values = sorted(v for v in latencies if v is not None)
+    if not values:
+        return f"no response to {len(latencies)} {unit}"
+    return (f"{len(values)}/{len(latencies)} {unit}, p50 {values[len(values) // 2]:.1f} ms, "
+            f"max {values[-1]:.1f} ms")
+
+
+def print_timeline(result):
+    events = [(t, f"{name} {'on' if level else 'off'}") for name, changes in result["pins"].items()
+              for t, level in changes]
+    events += [(t, f"audio {event}") for t, event in result["audio"]]
+    events += [(t, f'print "{line}"') for t, line in result["lines"]]
+    for t, text in sorted(events, key=lambda event: event[0]):
+        print(f"  {t:9.4f}  {text}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run screwdriver code.py revisions on simulated hardware and time.")
+    parser.add_argument("code", nargs="*", help="code.py files (default: every revision)")
+    parser.add_argument("--trace", help="Button trace file (default: a built-in mix of gestures)")
+    parser.add_argument("--end", type=float, help="Seconds of virtual time to run (default: 1.5 s after the last edge)")
+    parser.add_argument("--data", default=DEFAULT_DATA_DIR, help="Directory with sonic.wav, used as the working directory")
+    parser.add_argument("--phases", type=int, default=8, help="Runs per revision, each starting at a different offset")
+    parser.add_argument("--phase-ms", type=float, default=100, help="Spread of the start offsets, ms")
+    parser.add_argument("--cpu-us", type=float, default=10, help="Virtual microseconds charged per clock read")
+    parser.add_argument("--timeline", action="store_true", help="Print the LED/audio/print timeline of each run")
+    parser.add_argument("--echo", action="store_true", help="Show what the code prints, with virtual timestamps")
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--max-latency-ms", type=float, help="Exit 1 if any press-to-LED latency is higher")
+    args = parser.parse_args()
+
+    paths = args.code or sorted(glob.glob(os.path.join(SCREWDRIVER_DIR, "*", "code.py")))
+    trace = read_trace(args.trace) if args.trace else DEFAULT_TRACE
+    end = args.end if args.end is not None else trace[-1][0] / 1000 + 1.5
+    failed = False
+    report = {}
+    for path in paths:
+        name = os.path.relpath(path, SCREWDRIVER_DIR)
+        stats, result, wall = run_phases(os.path.abspath(path), trace, end, args.phases, args.phase_ms / 1000,
+                                         os.path.abspath(args.data), args.cpu_us / 1e6, args.echo)
+        report[name] = {**stats, "timeline": {"pins": result["pins"], "audio": result["audio"],
+                                              "lines": result["lines"]}}
+        print(f"{name}: {args.phases} x {end:.1f} s simulated in {wall:.3f} s "
+              f"({args.phases * end / wall:.0f}x real time)")
+        print(f"  LED    {describe(stats['led_ms'])}")
+        print(f"  audio  {describe(stats['audio_ms'])}")
+        for line, delays in stats["mode_switches"].items():
+            if any(delay is None for delay in delays):
+                print(f"  {line}: at start")
+            else:
+                print(f"  {line}: {describe(delays, 'runs')} after the last release")
+        for line in sorted(set(stats["errors"])):
+            print(f"  {line}")
+            failed = True
+        if args.timeline:
+            print_timeline(result)
+        if args.max_latency_ms is not None:
+            slow = [v for v in stats["led_ms"] if v is not None and v > args.max_latency_ms]
+            if slow:
+                print(f"  FAIL: {len(slow)} presses slower than {args.max_latency_ms} ms")
+                failed = True
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=1)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
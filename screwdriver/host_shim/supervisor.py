@@ -0,0 +1,9 @@
+"""Linux stand-in for CircuitPython's `supervisor` module (only ticks_ms)."""
+import time
+
+TICKS_PERIOD = 1 << 29
+
+
+def ticks_ms():
+    """Milliseconds from time.monotonic(), wrapping at 2**29 like the real one."""
+    return int(time.monotonic() * 1000) % TICKS_PERIOD
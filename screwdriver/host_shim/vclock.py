@@ -0,0 +1,58 @@
+"""
+Virtual clock for running CircuitPython code faster than real time.
+
+While installed it replaces time.monotonic, time.monotonic_ns and
+time.sleep. Sleeping just moves the clock forward, and every clock read
+costs `cpu_cost` seconds so loops that never sleep still move forward.
+Once the clock reaches `end`, sleep raises SimulationDone. That is a
+BaseException, so the `except Exception` in code.py does not swallow it.
+"""
+import time
+
+
+class SimulationDone(BaseException):
+    pass
+
+
+class VirtualClock:
+    def __init__(self, start=0.0, end=None, cpu_cost=10e-6):
+        self.now_ns = int(start * 1e9)
+        self.end_ns = None if end is None else int(end * 1e9)
+        self.cpu_cost_ns = int(cpu_cost * 1e9)
+        self.sleeps = 0
+        self._saved = None
+
+    def monotonic_ns(self):
+        self.now_ns += self.cpu_cost_ns
+        return self.now_ns
+
+    def monotonic(self):
+        return self.monotonic_ns() / 1e9
+
+    def now(self):
+        """Current time in seconds, without charging a clock read."""
+        return self.now_ns / 1e9
+
+    def sleep(self, seconds):
+        if seconds < 0:
+            raise ValueError("sleep length must be non-negative")
+        self.now_ns += int(seconds * 1e9)
+        self.sleeps += 1
+        if self.end_ns is not None and self.now_ns >= self.end_ns:
+            raise SimulationDone()
+
+    def install(self):
+        self._saved = (time.monotonic, time.monotonic_ns, time.sleep)
+        time.monotonic, time.monotonic_ns, time.sleep = self.monotonic, self.monotonic_ns, self.sleep
+
+    def uninstall(self):
+        if self._saved:
+            time.monotonic, time.monotonic_ns, time.sleep = self._saved
+            self._saved = None
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, *exc):
+        self.uninstall()
@@ -0,0 +1,118 @@
+"""
+Table-driven button gesture recognizer for CircuitPython (copy to CIRCUITPY/lib).
+
+Feed it timestamped press/release edges, e.g. straight from keypad events,
+and call poll() from the main loop. It calls emit(gesture, timestamp_ms)
+with one of:
+    "single", "double", "triple"  short presses followed by a pause
+                                  (the last allowed count fires on release)
+    "long"                        a press held past long_ms, then released
+    "hold"                        a press still held at hold_ms
+    "hold_end"                    release after "hold"
+
+All transitions come from one table built at start-up, and at most one
+deadline is pending, so poll() is a single comparison however many
+gestures or modes the caller maps.
+"""
+
+# Inputs
+PRESS = 0
+RELEASE = 1
+TIMEOUT = 2
+
+# Timers, as indexes into the durations tuple
+LONG_TIMER = 0
+GAP_TIMER = 1
+HOLD_TIMER = 2
+
+IDLE = 0
+LONG = 1
+HOLD = 2
+
+COUNT_GESTURES = (None, "single", "double", "triple", "quadruple")
+
+# supervisor.ticks_ms() wraps around at 2**29
+TICKS_PERIOD = 1 << 29
+TICKS_HALF_PERIOD = TICKS_PERIOD // 2
+
+
+def ticks_diff(end, start):
+    """Milliseconds from start to end, correct across ticks_ms wraparound."""
+    return ((end - start + TICKS_HALF_PERIOD) % TICKS_PERIOD) - TICKS_HALF_PERIOD
+
+
+def down_state(count):
+    """State for the button held down during press number `count`."""
+    return 1 + 2 * count
+
+
+def gap_state(count):
+    """State for the pause after `count` short presses."""
+    return 2 + 2 * count
+
+
+def build_table(max_presses=3):
+    """
+    Return {state: (on_press, on_release, on_timeout)}; each entry is
+    (next_state, gesture or None, timer or None), or None to ignore the input.
+    """
+    table = {
+        IDLE: ((down_state(1), None, LONG_TIMER), None, None),
+        LONG: (None, (IDLE, "long", None), (HOLD, "hold", None)),
+        HOLD: (None, (IDLE, "hold_end", None), None),
+    }
+    for count in range(1, max_presses + 1):
+        earlier = COUNT_GESTURES[count - 1]
+        if count < max_presses:
+            on_release = (gap_state(count), None, GAP_TIMER)
+            table[gap_state(count)] = ((down_state(count + 1), None, LONG_TIMER), None,
+                                       (IDLE, COUNT_GESTURES[count], None))
+        else:
+            on_release = (IDLE, COUNT_GESTURES[count], None)  # No more presses can follow
+        # Held too long: the earlier short presses end as their own gesture
+        table[down_state(count)] = (None, on_release, (LONG, earlier, HOLD_TIMER))
+    return table
+
+
+class GestureRecognizer:
+    def __init__(self, emit, long_ms=300, gap_ms=300, hold_ms=1000, max_presses=3):
+        if not 1 <= max_presses < len(COUNT_GESTURES):
+            raise ValueError("max_presses must be 1 to %d" % (len(COUNT_GESTURES) - 1))
+        self.emit = emit
+        # The hold timer starts when the press turns long, so it only runs for the rest of hold_ms
+        self.durations = (long_ms, gap_ms, max(0, hold_ms - long_ms))
+        self.table = build_table(max_presses)
+        self.state = IDLE
+        self.deadline = None  # ticks_ms when the pending timer fires
+
+    def _step(self, entry, timestamp):
+        next_state, gesture, timer = entry
+        self.state = next_state
+        if timer is None:
+            self.deadline = None
+        else:
+            self.deadline = (timestamp + self.durations[timer]) % TICKS_PERIOD
+        if gesture:
+            self.emit(gesture, timestamp)
+
+    def poll(self, now):
+        """Fire the pending timers that are due by `now` (ticks_ms)."""
+        while self.deadline is not None and ticks_diff(now, self.deadline) >= 0:
+            self._step(self.table[self.state][TIMEOUT], self.deadline)
+
+    def edge(self, pressed, timestamp):
+        """Feed one button edge; timestamp is ticks_ms, e.g. keypad.Event.timestamp."""
+        self.poll(timestamp)  # Timers that ran out before this edge go first
+        entry = self.table[self.state][RELEASE if not pressed else PRESS]
+        if entry is not None:
+            self._step(entry, timestamp)
+
+    def time_to_deadline(self, now):
+        """Milliseconds until the pending timer fires (0 if overdue), or None when idle."""
+        if self.deadline is None:
+            return None
+        return max(0, ticks_diff(self.deadline, now))
+
+    def reset(self):
+        self.state = IDLE
+        self.deadline = None
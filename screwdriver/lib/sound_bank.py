@@ -0,0 +1,240 @@
+"""
+Named sound samples loaded into RAM on demand (copy to CIRCUITPY/lib).
+
+Samples are .raw files from tools/convert_wav.py. A sample is read into a
+RAM buffer the first time it is needed and then kept in an LRU cache whose
+buffers stay under `budget` bytes. .wav files (and .raw files that are
+missing but have a .wav beside them) are streamed from flash instead and
+cost no budget.
+
+While a sample plays, the bank can load the sample most likely to come
+next. The load happens in chunk_bytes pieces, one per step() call from the
+main loop, so the loop never stalls on flash. The likely next sample
+comes from `follow`, or else from which sample has most often followed
+this one so far.
+"""
+import array
+import gc
+import os
+import struct
+
+import audiocore
+
+RAW_HEADER = "<4sIBB2x"  # b"SMP1", sample rate, bits, channels (see tools/convert_wav.py)
+RAW_MAGIC = b"SMP1"
+RAW_HEADER_SIZE = struct.calcsize(RAW_HEADER)
+CHUNK_BYTES = 4096
+
+
+def file_size(path):
+    return os.stat(path)[6]
+
+
+def read_raw_header(f, path):
+    """Read the header of an open .raw file; returns (sample_rate, bits, channels)."""
+    magic, sample_rate, bits, channels = struct.unpack(RAW_HEADER, f.read(RAW_HEADER_SIZE))
+    if magic != RAW_MAGIC:
+        raise ValueError(f"{path} is not a converted sample")
+    return sample_rate, bits, channels
+
+
+def allocate(bits, data_size):
+    """Sample buffer for `data_size` bytes: int16 for 16 bit, unsigned bytes for 8 bit."""
+    if bits == 16:
+        return array.array("h", [0]) * (data_size // 2)
+    return bytearray(data_size)
+
+
+def load_raw_sample(path):
+    """Load a converted sample into RAM in one go. Returns (RawSample, bytes of RAM used)."""
+    data_size = file_size(path) - RAW_HEADER_SIZE
+    with open(path, "rb") as f:
+        sample_rate, bits, channels = read_raw_header(f, path)
+        buffer = allocate(bits, data_size)
+        f.readinto(buffer)
+    return audiocore.RawSample(buffer, channel_count=channels, sample_rate=sample_rate), data_size
+
+
+class _Load:
+    """A sample being read into RAM a chunk at a time."""
+
+    def __init__(self, name, path, size):
+        self.name = name
+        self.size = size
+        self.file = open(path, "rb")
+        self.sample_rate, self.bits, self.channels = read_raw_header(self.file, path)
+        self.buffer = allocate(self.bits, size)
+        self.view = memoryview(self.buffer)
+        self.itemsize = 2 if self.bits == 16 else 1
+        self.position = 0  # Items read so far
+
+    def step(self, chunk_bytes):
+        """Read one chunk; returns True once the whole sample is in RAM."""
+        end = min(len(self.buffer), self.position + chunk_bytes // self.itemsize)
+        if end > self.position:
+            count = self.file.readinto(self.view[self.position:end])
+            self.position = end if not count else self.position + count // self.itemsize
+        return self.position >= len(self.buffer)
+
+    def finish(self):
+        while not self.step(self.size):
+            pass
+        self.close()
+        return audiocore.RawSample(self.buffer, channel_count=self.channels, sample_rate=self.sample_rate)
+
+    def close(self):
+        self.file.close()
+        self.view = None
+
+
+class SoundBank:
+    def __init__(self, files, budget, follow=None, chunk_bytes=CHUNK_BYTES):
+        """
+        files: {name: path}. budget: bytes of sample buffers to keep in RAM.
+        follow: optional {name: name to prefetch while it plays}.
+        """
+        self.budget = budget
+        self.follow = follow or {}
+        self.chunk_bytes = chunk_bytes
+        self.paths = {}
+        self.sizes = {}  # RAM bytes per name, 0 for streamed samples
+        for name, path in files.items():
+            if path.endswith(".raw") and not self._exists(path) and self._exists(path[:-4] + ".wav"):
+                print(f"No {path}, streaming {path[:-4]}.wav from flash")
+                path = path[:-4] + ".wav"
+            self.paths[name] = path
+            self.sizes[name] = file_size(path) - RAW_HEADER_SIZE if path.endswith(".raw") else 0
+            if self.sizes[name] > budget:
+                raise ValueError(f"{path} needs {self.sizes[name]} bytes, more than the {budget} byte budget")
+        self.cache = {}  # name -> sample in RAM
+        self.lru = []  # Cached names, least recently used first
+        self.used = 0  # Bytes in cache plus the load in progress
+        self.streams = {}  # name -> (WaveFile, open file)
+        self.loading = None
+        self.current = None
+        self.successors = {}  # name -> {next name: times seen}
+        self.stats = {"hits": 0, "misses": 0, "prefetched": 0, "evictions": 0, "bytes_loaded": 0}
+
+    @staticmethod
+    def _exists(path):
+        try:
+            os.stat(path)
+            return True
+        except OSError:
+            return False
+
+    def _evict(self, name):
+        self.lru.remove(name)
+        del self.cache[name]
+        self.used -= self.sizes[name]
+        self.stats["evictions"] += 1
+
+    def _cancel_load(self):
+        self.loading.close()
+        self.used -= self.loading.size
+        self.loading = None
+
+    def _make_room(self, size, evict_current=True):
+        """Evict least recently used samples (the playing one last) until `size` more bytes fit."""
+        freed = False
+        while self.used + size > self.budget:
+            victims = [name for name in self.lru if name != self.current]
+            if victims:
+                self._evict(victims[0])
+            elif self.loading:
+                self._cancel_load()
+            elif evict_current and self.current in self.cache:
+                self._evict(self.current)  # Its buffer is freed once playback stops
+            else:
+                break
+            freed = True
+        if freed:
+            gc.collect()
+
+    def _add(self, name, sample):
+        self.cache[name] = sample
+        self.lru.append(name)
+        self.stats["bytes_loaded"] += self.sizes[name]
+
+    def get(self, name):
+        """Return the sample for `name`, loading it now if it is not in RAM yet."""
+        if name in self.cache:
+            self.stats["hits"] += 1
+            self.lru.remove(name)
+            self.lru.append(name)
+            return self.cache[name]
+        path = self.paths[name]
+        if not path.endswith(".raw"):
+            if name not in self.streams:
+                f = open(path, "rb")
+                self.streams[name] = (audiocore.WaveFile(f), f)
+            return self.streams[name][0]
+        if self.loading and self.loading.name == name:
+            # Prefetch still running: read the rest now
+            self.stats["prefetched"] += 1
+            load, self.loading = self.loading, None
+            self._add(name, load.finish())
+            return self.cache[name]
+        self.stats["misses"] += 1
+        self._make_room(self.sizes[name])
+        sample, _ = load_raw_sample(path)
+        self.used += self.sizes[name]
+        self._add(name, sample)
+        return sample
+
+    def predict(self, name):
+        """Name of the sample most likely to be played after `name`, or None."""
+        if name in self.follow:
+            return self.follow[name]
+        seen = self.successors.get(name)
+        if not seen:
+            return None
+        return max(seen, key=seen.get)
+
+    def prefetch(self, name):
+        """Start loading `name` in the background of step() calls."""
+        if name is None or name in self.cache or not self.paths[name].endswith(".raw"):
+            return
+        if self.loading:
+            if self.loading.name == name:
+                return
+            self._cancel_load()
+        self._make_room(self.sizes[name], evict_current=False)
+        if self.used + self.sizes[name] > self.budget:
+            return  # Would have to evict the playing sample
+        self.loading = _Load(name, self.paths[name], self.sizes[name])
+        self.used += self.sizes[name]
+
+    def step(self):
+        """Load the next chunk of a pending prefetch; call once per main loop pass. True while work remains."""
+        if not self.loading:
+            return False
+        if not self.loading.step(self.chunk_bytes):
+            return True
+        load, self.loading = self.loading, None
+        load.close()
+        self._add(load.name, audiocore.RawSample(load.buffer, channel_count=load.channels,
+                                                 sample_rate=load.sample_rate))
+        self.stats["prefetched"] += 1
+        return False
+
+    def play(self, audio, name, loop=False):
+        """Play `name` on `audio` and start prefetching what usually follows it."""
+        sample = self.get(name)
+        audio.play(sample, loop=loop)
+        if self.current is not None:
+            seen = self.successors.setdefault(self.current, {})
+            seen[name] = seen.get(name, 0) + 1
+        self.current = name
+        self.prefetch(self.predict(name))
+        return sample
+
+    def deinit(self):
+        if self.loading:
+            self._cancel_load()
+        for _, f in self.streams.values():
+            f.close()
+        self.streams = {}
+        self.cache = {}
+        self.lru = []
+        self.used = 0
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Convert a WAV into a raw sample that lib/sound_bank.py loads straight into RAM.
+
+The sound is mixed to mono, trimmed of leading/trailing silence,
+resampled (with an anti-alias filter when going down) and requantized to 8-bit
+unsigned or 16-bit signed. The output is a 12 byte header followed by
+the samples, little-endian:
+    b"SMP1", sample rate (uint32), bits (uint8), channels (uint8), 2 pad bytes
+
+Example:
+    python convert_wav.py ../001/sonic.wav ../003/sonic.raw --rate 22050 --bits 8
+    python convert_wav.py ../001/sonic.wav --report     # size/quality of every format
+"""
+import argparse
+import struct
+import wave
+
+import numpy as np
+
+RAW_HEADER = "<4sIBB2x"  # Same layout as RAW_HEADER in lib/sound_bank.py (not imported: it needs audiocore)
+RAW_MAGIC = b"SMP1"
+
+# Formats compared by --report
+REPORT_RATES = (44100, 32000, 22050, 16000, 11025, 8000)
+REPORT_BITS = (16, 8)
+
+
+def read_wav(path):
+    """Read a PCM WAV; returns (mono float samples in [-1, 1), sample rate)."""
+    with wave.open(path, "rb") as w:
+        rate = w.getframerate()
+        channels = w.getnchannels()
+        width = w.getsampwidth()
+        frames = w.readframes(w.getnframes())
+    if width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float64) - 128) / 128
+    elif width == 2:
+        samples = np.frombuffer(frames, dtype="<i2") / 32768
+    elif width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        value = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        samples = np.where(value & 0x800000, value - (1 << 24), value) / (1 << 23)
+    elif width == 4:
+        samples = np.frombuffer(frames, dtype="<i4") / (1 << 31)
+    else:
+        raise ValueError(f"Unsupported sample width: {width} bytes")
+    return samples.reshape(-1, channels).mean(axis=1), rate
+
+
+def lowpass(samples, cutoff, taps=63):
+    """Windowed-sinc low-pass filter; cutoff is a fraction of the sample rate (< 0.5)."""
+    n = np.arange(taps) - (taps - 1) / 2
+    kernel = 2 * cutoff * np.sinc(2 * cutoff * n) * np.blackman(taps)
+    kernel /= kernel.sum()
+    return np.convolve(samples, kernel, mode="same")
+
+
+def resample(samples, rate, target_rate):
+    """Linear-interpolation resampler, filtered first when the rate goes down."""
+    if target_rate == rate:
+        return samples
+    if target_rate < rate:
+        samples = lowpass(samples, 0.45 * target_rate / rate)
+    count = int(round(len(samples) * target_rate / rate))
+    positions = np.arange(count) * (rate / target_rate)
+    return np.interp(positions, np.arange(len(samples)), samples)
+
+
+def trim(samples, threshold_db=-50.0):
+    """Drop leading and trailing samples quieter than threshold_db (dBFS)."""
+    loud = np.flatnonzero(np.abs(samples) > 10 ** (threshold_db / 20))
+    if len(loud) == 0:
+        return samples[:0]
+    return samples[loud[0]:loud[-1] + 1]
+
+
+def quantize(samples, bits, dither=True, seed=0):
+    """Requantize to uint8 (8 bits, midpoint 128) or int16 (16 bits), with optional TPDF dither."""
+    if bits not in (8, 16):
+        raise ValueError("bits must be 8 or 16")
+    scale = 128 if bits == 8 else 32768
+    scaled = samples * scale
+    if dither:
+        rng = np.random.default_rng(seed)
+        scaled = scaled + rng.random(len(scaled)) - rng.random(len(scaled))
+    values = np.clip(np.round(scaled), -scale, scale - 1)
+    if bits == 8:
+        return (values + 128).astype(np.uint8)
+    return values.astype("<i2")
+
+
+def dequantize(values):
+    """Back to floats, for measuring what a conversion lost."""
+    if values.dtype == np.uint8:
+        return (values.astype(np.float64) - 128) / 128
+    return values / 32768
+
+
+def convert(samples, rate, target_rate, bits, threshold_db=-50.0, dither=True):
+    """Trim, resample and quantize; returns the integer samples."""
+    return quantize(resample(trim(samples, threshold_db), rate, target_rate), bits, dither)
+
+
+def write_raw(path, values, sample_rate, bits):
+    with open(path, "wb") as f:
+        f.write(struct.pack(RAW_HEADER, RAW_MAGIC, sample_rate, bits, 1))
+        f.write(values.tobytes())
+
+
+def snr_db(samples, rate, values, target_rate, threshold_db=-50.0):
+    """Signal-to-noise ratio of a conversion, compared at the source rate against the trimmed source."""
+    reference = trim(samples, threshold_db)
+    restored = resample(dequantize(values), target_rate, rate)
+    length = min(len(reference), len(restored))
+    reference, restored = reference[:length], restored[:length]
+    noise = np.sum((reference - restored) ** 2)
+    if noise == 0:
+        return float("inf")
+    return 10 * np.log10(np.sum(reference ** 2) / noise)
+
+
+def report(samples, rate, threshold_db=-50.0, dither=True):
+    """
+    Print RAM size, length and SNR of every candidate format.
+
+    The SNR counts everything the conversion lost, so at low rates it is
+    mostly the treble removed by the anti-alias filter.
+    """
+    print(f"Source: {rate} Hz, {len(samples)} samples ({len(samples) / rate:.3f} s)")
+    print(f"{'rate':>7}{'bits':>6}{'bytes':>10}{'seconds':>9}{'SNR dB':>9}")
+    for target_rate in REPORT_RATES:
+        if target_rate > rate:
+            continue
+        for bits in REPORT_BITS:
+            values = convert(samples, rate, target_rate, bits, threshold_db, dither)
+            print(f"{target_rate:>7}{bits:>6}{values.nbytes:>10}{len(values) / target_rate:>9.3f}"
+                  f"{snr_db(samples, rate, values, target_rate, threshold_db):>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a WAV into a raw RAM sample for the screwdriver code.py.")
+    parser.add_argument("wav", help="Input WAV file")
+    parser.add_argument("output", nargs="?", help="Output .raw file")
+    parser.add_argument("--rate", type=int, default=22050, help="Target sample rate (default 22050)")
+    parser.add_argument("--bits", type=int, choices=(8, 16), default=16, help="Target bit depth (default 16)")
+    parser.add_argument("--trim-db", type=float, default=-50.0, help="Silence threshold for trimming, dBFS")
+    parser.add_argument("--no-dither", action="store_true", help="Round without dither")
+    parser.add_argument("--report", action="store_true", help="Compare size and quality of the usual formats")
+    args = parser.parse_args()
+
+    samples, rate = read_wav(args.wav)
+    dither = not args.no_dither
+    if args.report:
+        report(samples, rate, args.trim_db, dither)
+    if args.output:
+        values = convert(samples, rate, args.rate, args.bits, args.trim_db, dither)
+        write_raw(args.output, values, args.rate, args.bits)
+        print(f"Wrote {args.output}: {args.rate} Hz, {args.bits} bit, {len(values)} samples, "
+              f"{values.nbytes} bytes in RAM")
+    elif not args.report:
+        parser.error("give an output file or --report")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Replay button traces through lib/gestures.py in simulated time.
+
+Random mode builds traces for known gestures, with press and gap lengths
+drawn up to `--margin` ms away from the thresholds, and checks that every
+one is recognized as intended. It reports how long recognition took after
+the final edge and how many traces per second were replayed.
+
+A trace file has one edge per line, "TIME_MS down" or "TIME_MS up"; blank
+lines separate traces.
+
+Example:
+    python gesture_replay.py --count 10000 --margin 20
+    python gesture_replay.py --trace presses.txt
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lib"))
+from gestures import GestureRecognizer, TICKS_PERIOD  # noqa: E402
+
+GESTURES = ("single", "double", "triple", "long", "hold")
+
+
+def make_trace(gesture, rng, long_ms=300, gap_ms=300, hold_ms=1000, margin=20, start=0):
+    """Edges [(pressed, ms)] that should be recognized as `gesture`, starting at `start`."""
+    presses = {"single": 1, "double": 2, "triple": 3}.get(gesture, 1)
+    edges = []
+    t = start
+    for n in range(presses):
+        if gesture == "long":
+            duration = rng.uniform(long_ms + margin, hold_ms - margin)
+        elif gesture == "hold":
+            duration = rng.uniform(hold_ms + margin, hold_ms + 2000)
+        else:
+            duration = rng.uniform(margin, long_ms - margin)
+        edges.append((True, int(t) % TICKS_PERIOD))
+        t += duration
+        edges.append((False, int(t) % TICKS_PERIOD))
+        if n < presses - 1:
+            t += rng.uniform(margin, gap_ms - margin)
+    return edges
+
+
+def expected_gestures(gesture):
+    return ["hold", "hold_end"] if gesture == "hold" else [gesture]
+
+
+def replay(recognizer, edges, settle_ms=5000):
+    """Feed the edges, then let the timers run out; returns [(gesture, ms)]."""
+    out = []
+    recognizer.emit = lambda gesture, timestamp: out.append((gesture, timestamp))
+    recognizer.reset()
+    for pressed, timestamp in edges:
+        recognizer.edge(pressed, timestamp)
+    recognizer.poll((edges[-1][1] + settle_ms) % TICKS_PERIOD)
+    return out
+
+
+def run_random(count, seed, long_ms, gap_ms, hold_ms, margin):
+    rng = random.Random(seed)
+    recognizer = GestureRecognizer(None, long_ms, gap_ms, hold_ms)
+    traces = []
+    for _ in range(count):
+        gesture = rng.choice(GESTURES)
+        # Random start times also exercise the ticks_ms wraparound
+        traces.append((gesture, make_trace(gesture, rng, long_ms, gap_ms, hold_ms, margin,
+                                           rng.randrange(TICKS_PERIOD))))
+
+    failures = 0
+    delays = {gesture: [] for gesture in GESTURES}
+    start = time.perf_counter()
+    for gesture, edges in traces:
+        result = replay(recognizer, edges)
+        if [name for name, _ in result] != expected_gestures(gesture):
+            failures += 1
+            if failures <= 5:
+                print(f"Expected {gesture}, got {result} for {edges}")
+            continue
+        delays[gesture].append((result[0][1] - edges[-1][1]) % TICKS_PERIOD)
+    elapsed = time.perf_counter() - start
+
+    print(f"{count} traces in {elapsed:.3f} s ({count / elapsed:.0f}/s), {failures} misrecognized")
+    for gesture, values in delays.items():
+        if gesture == "hold" or not values:
+            continue  # hold fires while the button is still down
+        values.sort()
+        print(f"  {gesture:<7} recognized {values[len(values) // 2]} ms after the last release "
+              f"(max {values[-1]} ms)")
+    return failures
+
+
+def read_traces(path):
+    """Parse a trace file into lists of edges."""
+    traces, edges = [], []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#")[0].strip()
+            if not line:
+                if edges:
+                    traces.append(edges)
+                    edges = []
+                continue
+            timestamp, edge = line.split()
+            edges.append((edge.lower() in ("down", "press", "1"), int(timestamp)))
+    if edges:
+        traces.append(edges)
+    return traces
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay button traces through the gesture recognizer.")
+    parser.add_argument("--trace", help="Replay the traces in this file instead of random ones")
+    parser.add_argument("--count", type=int, default=10000, help="Number of random traces")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--margin", type=float, default=20, help="Closest a random trace gets to a threshold, ms")
+    parser.add_argument("--long-ms", type=int, default=300)
+    parser.add_argument("--gap-ms", type=int, default=300)
+    parser.add_argument("--hold-ms", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.trace:
+        recognizer = GestureRecognizer(None, args.long_ms, args.gap_ms, args.hold_ms)
+        for n, edges in enumerate(read_traces(args.trace), 1):
+            result = replay(recognizer, edges)
+            print(f"Trace {n}: " + (", ".join(f"{name} at {t} ms" for name, t in result) or "nothing"))
+        return
+    if run_random(args.count, args.seed, args.long_ms, args.gap_ms, args.hold_ms, args.margin):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()